@@ -1,78 +1,225 @@
 # eda/basic_viz.py
 
+import weakref
+
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 from ui import styles
 import matplotlib.pyplot as plt
 import seaborn as sns
+from eda.dataset_cache import DatasetCache
+from eda.chart_data import ChartSpec, chart_columns, column_chart_specs, export_chart_specs
+
+COLUMNS_PER_PAGE = 20
+FIGURE_CACHE_SIZE = 64
+
+# -------------------
+# Plotly renderers
+# -------------------
+def _plotly_histogram(spec: ChartSpec) -> go.Figure:
+    edges = spec.data["edges"]
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=spec.data["counts"], width=np.diff(edges),
+                           name=str(spec.column)))
+    fig.update_layout(title=spec.title, xaxis_title=str(spec.column), yaxis_title="count", bargap=0)
+    return fig
+
+def _plotly_box(spec: ChartSpec) -> go.Figure:
+    # Pre-computed box, with the sampled outliers as separate points
+    stats, col = spec.data, str(spec.column)
+    fig = go.Figure()
+    if stats is not None:
+        fig.add_trace(go.Box(
+            x=[col], q1=[stats["q1"]], median=[stats["median"]], q3=[stats["q3"]], mean=[stats["mean"]],
+            lowerfence=[stats["lower_whisker"]], upperfence=[stats["upper_whisker"]], name=col
+        ))
+        if stats["outliers"].size:
+            fig.add_trace(go.Scatter(
+                x=[col] * stats["outliers"].size, y=stats["outliers"], mode="markers",
+                name=f"outliers ({stats['n_outliers']})", marker={"size": 4}
+            ))
+    fig.update_layout(title=spec.title, yaxis_title=col, showlegend=False)
+    return fig
+
+def _plotly_bar(spec: ChartSpec) -> go.Figure:
+    return px.bar(spec.data, x=spec.column, y="Count", title=spec.title)
+
+def _plotly_pie(spec: ChartSpec) -> go.Figure:
+    return px.pie(spec.data, names=spec.column, values="Count", title=spec.title)
+
+def _time_title(spec: ChartSpec) -> str:
+    freq = spec.data["freq"]
+    return f"{spec.title} (rows per {freq})" if freq else spec.title
+
+def _plotly_time(spec: ChartSpec) -> go.Figure:
+    # WebGL trace: the series is already bounded by the time chart point budget
+    fig = go.Figure(go.Scattergl(x=spec.data["x"], y=spec.data["y"], mode="lines", name=str(spec.column)))
+    fig.update_layout(title=_time_title(spec), xaxis_title=str(spec.column), yaxis_title="count")
+    return fig
+
+PLOTLY_RENDERERS = {
+    "histogram": _plotly_histogram,
+    "box": _plotly_box,
+    "bar": _plotly_bar,
+    "pie": _plotly_pie,
+    "time": _plotly_time
+}
+
+def plotly_figure(spec: ChartSpec) -> go.Figure:
+    """
+    Renders a chart spec as a Plotly figure (Streamlit UI and HTML export).
+    """
+    return PLOTLY_RENDERERS[spec.kind](spec)
+
+# -------------------
+# Matplotlib renderers
+# -------------------
+def _matplotlib_histogram(spec: ChartSpec):
+    fig, ax = plt.subplots(figsize=(8, 5))
+    edges = spec.data["edges"]
+    if edges.size:
+        ax.bar(edges[:-1], spec.data["counts"], width=np.diff(edges), align="edge", alpha=0.7, edgecolor="black")
+    ax.set_xlabel(spec.column)
+    ax.set_ylabel("Frequency")
+    return fig, ax
+
+def _matplotlib_box(spec: ChartSpec):
+    fig, ax = plt.subplots(figsize=(8, 5))
+    stats = spec.data
+    if stats is not None:
+        ax.bxp([{
+            "med": stats["median"], "q1": stats["q1"], "q3": stats["q3"], "mean": stats["mean"],
+            "whislo": stats["lower_whisker"], "whishi": stats["upper_whisker"],
+            "fliers": stats["outliers"], "label": str(spec.column)
+        }])
+    ax.set_ylabel(spec.column)
+    return fig, ax
+
+def _matplotlib_bar(spec: ChartSpec):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    spec.data.set_index(spec.column)["Count"].plot(kind='bar', ax=ax)
+    ax.set_xlabel(spec.column)
+    ax.set_ylabel("Count")
+    plt.xticks(rotation=45)
+    return fig, ax
+
+def _matplotlib_pie(spec: ChartSpec):
+    fig, ax = plt.subplots(figsize=(8, 8))
+    spec.data.set_index(spec.column)["Count"].plot(kind='pie', ax=ax, autopct='%1.1f%%')
+    ax.set_ylabel('')  # Remove ylabel for pie charts
+    return fig, ax
+
+def _matplotlib_time(spec: ChartSpec):
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(spec.data["x"], spec.data["y"])
+    ax.set_xlabel(spec.column)
+    ax.set_ylabel("Count")
+    fig.autofmt_xdate()
+    return fig, ax
+
+MATPLOTLIB_RENDERERS = {
+    "histogram": _matplotlib_histogram,
+    "box": _matplotlib_box,
+    "bar": _matplotlib_bar,
+    "pie": _matplotlib_pie,
+    "time": _matplotlib_time
+}
+
+def matplotlib_figure(spec: ChartSpec):
+    """
+    Renders a chart spec as a matplotlib figure (PDF export).
+    """
+    fig, ax = MATPLOTLIB_RENDERERS[spec.kind](spec)
+    ax.set_title(_time_title(spec) if spec.kind == "time" else spec.title)
+    plt.tight_layout()
+    return fig
+
+# -------------------
+# Streamlit page
+# -------------------
+def _figure_cache(df: pd.DataFrame) -> DatasetCache:
+    """
+    This session's LRU cache of built figures for df; replaced when df_cleaned changes.
+    """
+    entry = st.session_state.get("figure_cache")
+    if entry is None or entry[0]() is not df:
+        # Every figure is stored with size 1, so the budget is a number of figures
+        entry = (weakref.ref(df), DatasetCache(FIGURE_CACHE_SIZE))
+        st.session_state.figure_cache = entry
+    return entry[1]
+
+def _show_figure(df: pd.DataFrame, spec: ChartSpec):
+    cache = _figure_cache(df)
+    key = (spec.kind, spec.column)
+    fig = cache.get(key)
+    if fig is None:
+        fig = plotly_figure(spec)
+        cache.put(key, fig, nbytes=1)
+    st.plotly_chart(fig, use_container_width=True)
+
+def _show_column_charts(df: pd.DataFrame, kind: str, col):
+    specs = column_chart_specs(df, col, kind)
+    if kind == "numeric":
+        # Histogram and box plot side by side
+        for container, spec in zip(st.columns(len(specs)), specs):
+            with container:
+                _show_figure(df, spec)
+    else:
+        # High-cardinality categoricals show their top values plus an "Other" bar
+        for spec in specs:
+            _show_figure(df, spec)
 
 def show_basic_visualizations(df: pd.DataFrame):
-    num_cols = df.select_dtypes(include='number').columns.tolist()
-    cat_cols = df.select_dtypes(include='object').columns.tolist()
-    dt_cols = df.select_dtypes(include='datetime').columns.tolist()
-
-    # -------------------
-    # 📈 Numeric Columns
-    # -------------------
-    if num_cols:
-        # st.markdown('<div class="section-card">', unsafe_allow_html=True)
-        st.markdown(f"### 📈 Numeric Column Distributions ({len(num_cols)})")
-
-        for col in num_cols:
-            with st.expander(f"🔢 {col}"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    fig1 = px.histogram(df, x=col, nbins=30, title=f"Histogram of {col}")
-                    st.plotly_chart(fig1, use_container_width=True)
-                with col2:
-                    fig2 = px.box(df, y=col, title=f"Boxplot of {col}")
-                    st.plotly_chart(fig2, use_container_width=True)
-        # st.markdown('</div>', unsafe_allow_html=True)
-
-    # -------------------
-    # 🔠 Categorical Columns
-    # -------------------
-    if cat_cols:
-        # st.markdown('<div class="section-card">', unsafe_allow_html=True)
-        st.markdown(f"### 🔠 Categorical Column Distributions ({len(cat_cols)})")
-
-        for col in cat_cols:
-            if df[col].nunique() < 30:
-                with st.expander(f"🏷️ {col}"):
-                    fig1 = px.bar(df[col].value_counts().reset_index(),
-                                  x='index', y=col,
-                                  labels={'index': col, col: 'Count'},
-                                  title=f"Bar Chart of {col}")
-                    st.plotly_chart(fig1, use_container_width=True)
-
-                    if df[col].nunique() <= 10:
-                        fig2 = px.pie(df, names=col, title=f"Pie Chart of {col}")
-                        st.plotly_chart(fig2, use_container_width=True)
-        # st.markdown('</div>', unsafe_allow_html=True)
-
-    # -------------------
-    # 🕒 Datetime Columns
-    # -------------------
-    if dt_cols:
-        # st.markdown('<div class="section-card">', unsafe_allow_html=True)
-        st.markdown(f"### 🕒 Time Series Trends ({len(dt_cols)})")
-
-        for col in dt_cols:
-            with st.expander(f"📅 {col}"):
-                df_time = df[[col]].dropna()
-                df_time['count'] = 1
-                df_time = df_time.groupby(col).count().reset_index()
-
-                fig = px.line(df_time, x=col, y='count', title=f"Time Trend of {col}")
-                st.plotly_chart(fig, use_container_width=True)
-        # st.markdown('</div>', unsafe_allow_html=True)
+    """
+    Column charts, one expander per column. Charts are only built for open expanders,
+    columns can be searched and are shown COLUMNS_PER_PAGE at a time, and built figures
+    are kept in a per-session LRU cache so re-opening an expander is free.
+    """
+    columns_by_kind = chart_columns(df)
 
     # -------------------
     # Empty state
     # -------------------
-    if not num_cols and not cat_cols and not dt_cols:
+    if not any(columns_by_kind.values()):
         st.info("No visualizable columns found in the cleaned dataset.")
+        return
+
+    search = st.text_input("🔎 Search columns", key="viz_search").strip().lower()
+    columns = [
+        (kind, col)
+        for kind, cols in columns_by_kind.items()
+        for col in cols
+        if search in str(col).lower()
+    ]
+    if not columns:
+        st.info("No columns match the search.")
+        return
+
+    n_pages = -(-len(columns) // COLUMNS_PER_PAGE)
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(f"Page (of {n_pages}, {COLUMNS_PER_PAGE} columns each)",
+                               min_value=1, max_value=n_pages, value=1, step=1, key="viz_page")
+    visible = columns[(page - 1) * COLUMNS_PER_PAGE:page * COLUMNS_PER_PAGE]
+
+    sections = {
+        "numeric": (f"### 📈 Numeric Column Distributions ({len(columns_by_kind['numeric'])})", "🔢"),
+        "categorical": (f"### 🔠 Categorical Column Distributions ({len(columns_by_kind['categorical'])})", "🏷️"),
+        "datetime": (f"### 🕒 Time Series Trends ({len(columns_by_kind['datetime'])})", "📅")
+    }
+    current = None
+    for kind, col in visible:
+        header, icon = sections[kind]
+        if kind != current:
+            st.markdown(header)
+            current = kind
+        # A state-tracking expander reruns on toggle and reports .open, so closed ones build nothing
+        expander = st.expander(f"{icon} {col}", key=f"viz_open_{kind}_{col}", on_change="rerun")
+        with expander:
+            if expander.open:
+                _show_column_charts(df, kind, col)
 
 
 def generate_plots_for_export(df: pd.DataFrame):
@@ -80,66 +227,8 @@ def generate_plots_for_export(df: pd.DataFrame):
     Generate plots for export (PDF/Dashboard) instead of displaying them in Streamlit.
     Returns a dictionary of plot objects.
     """
-    plots = {}
-    num_cols = df.select_dtypes(include='number').columns.tolist()
-    cat_cols = df.select_dtypes(include='object').columns.tolist()
-    dt_cols = df.select_dtypes(include='datetime').columns.tolist()
-
-    # -------------------
-    # 📈 Numeric Columns
-    # -------------------
-    if num_cols:
-        # Generate histograms and box plots for first few numeric columns (limit to avoid too many plots)
-        for i, col in enumerate(num_cols[:3]):  # Limit to first 3 numeric columns
-            # Histogram
-            plots[f"Histogram - {col}"] = px.histogram(
-                df, x=col, nbins=30, 
-                title=f"Distribution of {col}"
-            )
-            
-            # Box plot
-            plots[f"Box Plot - {col}"] = px.box(
-                df, y=col, 
-                title=f"Box Plot of {col}"
-            )
-
-    # -------------------
-    # 🔠 Categorical Columns
-    # -------------------
-    if cat_cols:
-        # Generate bar charts for first few categorical columns
-        for i, col in enumerate(cat_cols[:2]):  # Limit to first 2 categorical columns
-            if df[col].nunique() < 30:  # Only if manageable number of categories
-                value_counts = df[col].value_counts().reset_index()
-                plots[f"Bar Chart - {col}"] = px.bar(
-                    value_counts,
-                    x='index', y=col,
-                    labels={'index': col, col: 'Count'},
-                    title=f"Distribution of {col}"
-                )
-                
-                # Pie chart if <= 10 categories
-                if df[col].nunique() <= 10:
-                    plots[f"Pie Chart - {col}"] = px.pie(
-                        df, names=col, 
-                        title=f"Pie Chart of {col}"
-                    )
-
-    # -------------------
-    # 🕒 Datetime Columns
-    # -------------------
-    if dt_cols:
-        for i, col in enumerate(dt_cols[:2]):  # Limit to first 2 datetime columns
-            df_time = df[[col]].dropna()
-            df_time['count'] = 1
-            df_time = df_time.groupby(col).count().reset_index()
-            
-            plots[f"Time Trend - {col}"] = px.line(
-                df_time, x=col, y='count', 
-                title=f"Time Trend of {col}"
-            )
-
-    return plots
+    # Chart data is aggregated once per dataset and shared with the matplotlib export
+    return {spec.name: plotly_figure(spec) for spec in export_chart_specs(df)}
 
 
 def generate_matplotlib_plots_for_export(df: pd.DataFrame):
@@ -147,61 +236,7 @@ def generate_matplotlib_plots_for_export(df: pd.DataFrame):
     Generate matplotlib plots as fallback for export when Plotly fails.
     Returns a dictionary of matplotlib figure objects.
     """
-    plots = {}
-    num_cols = df.select_dtypes(include='number').columns.tolist()
-    cat_cols = df.select_dtypes(include='object').columns.tolist()
-    
     # Set style for better looking plots
     plt.style.use('default')
     sns.set_palette("husl")
-    
-    # -------------------
-    # 📈 Numeric Columns
-    # -------------------
-    if num_cols:
-        for i, col in enumerate(num_cols[:3]):  # Limit to first 3 numeric columns
-            # Histogram
-            fig, ax = plt.subplots(figsize=(8, 5))
-            ax.hist(df[col].dropna(), bins=30, alpha=0.7, edgecolor='black')
-            ax.set_title(f"Distribution of {col}")
-            ax.set_xlabel(col)
-            ax.set_ylabel("Frequency")
-            plt.tight_layout()
-            plots[f"Histogram - {col}"] = fig
-            
-            # Box plot
-            fig, ax = plt.subplots(figsize=(8, 5))
-            ax.boxplot(df[col].dropna())
-            ax.set_title(f"Box Plot of {col}")
-            ax.set_ylabel(col)
-            plt.tight_layout()
-            plots[f"Box Plot - {col}"] = fig
-
-    # -------------------
-    # 🔠 Categorical Columns
-    # -------------------
-    if cat_cols:
-        for i, col in enumerate(cat_cols[:2]):  # Limit to first 2 categorical columns
-            if df[col].nunique() < 30:  # Only if manageable number of categories
-                value_counts = df[col].value_counts()
-                
-                # Bar chart
-                fig, ax = plt.subplots(figsize=(10, 6))
-                value_counts.plot(kind='bar', ax=ax)
-                ax.set_title(f"Distribution of {col}")
-                ax.set_xlabel(col)
-                ax.set_ylabel("Count")
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                plots[f"Bar Chart - {col}"] = fig
-                
-                # Pie chart if <= 10 categories
-                if df[col].nunique() <= 10:
-                    fig, ax = plt.subplots(figsize=(8, 8))
-                    value_counts.plot(kind='pie', ax=ax, autopct='%1.1f%%')
-                    ax.set_title(f"Pie Chart of {col}")
-                    ax.set_ylabel('')  # Remove ylabel for pie charts
-                    plt.tight_layout()
-                    plots[f"Pie Chart - {col}"] = fig
-
-    return plots
+    return {spec.name: matplotlib_figure(spec) for spec in export_chart_specs(df)}
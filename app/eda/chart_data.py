@@ -0,0 +1,256 @@
+# eda/chart_data.py
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from eda.dataset_cache import memoize_on_frame
+from eda.profiler import get_profile
+from eda.type_inference import CATEGORICAL_DTYPES
+
+HISTOGRAM_BINS = 30
+WHISKER_IQR = 1.5
+MAX_OUTLIER_POINTS = 200
+TOP_CATEGORIES = 20
+PIE_MAX_DISTINCT = 10
+# Pies are only drawn for columns with at most PIE_MAX_DISTINCT values, so nothing is folded into "Other"
+PIE_CATEGORIES = PIE_MAX_DISTINCT
+MAX_TIME_BINS = 20_000
+TIME_POINT_BUDGET = 2_000
+# Resampling steps for time charts, finest first (months and years are approximate)
+TIME_FREQUENCIES = [
+    ("second", 10 ** 9),
+    ("minute", 60 * 10 ** 9),
+    ("5 minutes", 300 * 10 ** 9),
+    ("15 minutes", 900 * 10 ** 9),
+    ("hour", 3600 * 10 ** 9),
+    ("6 hours", 6 * 3600 * 10 ** 9),
+    ("day", 86400 * 10 ** 9),
+    ("week", 7 * 86400 * 10 ** 9),
+    ("30 days", 30 * 86400 * 10 ** 9),
+    ("365 days", 365 * 86400 * 10 ** 9)
+]
+
+CHART_NAMES = {
+    "histogram": "Histogram",
+    "box": "Box Plot",
+    "bar": "Bar Chart",
+    "pie": "Pie Chart",
+    "time": "Time Trend"
+}
+# Charts per kind of column included in the PDF/HTML exports
+EXPORT_COLUMNS = {"numeric": 3, "categorical": 2, "datetime": 2}
+
+def _finite_values(df: pd.DataFrame, col) -> np.ndarray:
+    values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+    return values[np.isfinite(values)]
+
+def histogram_data(df: pd.DataFrame, col, bins: int = HISTOGRAM_BINS):
+    """
+    Histogram of a numeric column computed server-side: bin edges and counts only,
+    so a chart built from it has the same size for 1k or 10M rows.
+    """
+    def compute():
+        values = _finite_values(df, col)
+        if values.size == 0:
+            return {"edges": np.array([]), "counts": np.array([], dtype="int64"), "count": 0}
+        counts, edges = np.histogram(values, bins=bins)
+        return {"edges": edges, "counts": counts, "count": int(values.size)}
+
+    return memoize_on_frame(df, ("histogram_data", col, bins), compute)
+
+def box_data(df: pd.DataFrame, col, whisker: float = WHISKER_IQR, max_outliers: int = MAX_OUTLIER_POINTS):
+    """
+    Box plot statistics of a numeric column. Quartiles and mean come from the dataset
+    profile (get_profile), so the box agrees with the summary table; one scan of the
+    values finds the whiskers at the most extreme values within whisker * IQR of the box
+    (Tukey, as Plotly and matplotlib draw them) and at most max_outliers of the points
+    beyond them (a fixed random sample that always keeps the minimum and maximum).
+    Returns None for a column without values.
+    """
+    def compute():
+        profile = get_profile(df)[col]
+        if not profile.count:
+            return None
+        q1, median, q3 = (float(profile.quantiles[q]) for q in (0.25, 0.5, 0.75))
+        values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        values = values[~np.isnan(values)]
+        iqr = q3 - q1
+        low, high = q1 - whisker * iqr, q3 + whisker * iqr
+        inside = (values >= low) & (values <= high)
+        outliers = values[~inside]
+        n_outliers = int(outliers.size)
+        # Infinite values count as outliers but cannot be drawn
+        outliers = outliers[np.isfinite(outliers)]
+        if outliers.size > max_outliers:
+            rng = np.random.default_rng(0)
+            keep = rng.choice(outliers.size, size=max_outliers - 2, replace=False)
+            outliers = np.concatenate((outliers[keep], [outliers.min(), outliers.max()]))
+        return {
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "mean": float(profile.mean),
+            "lower_whisker": float(values[inside].min()) if inside.any() else q1,
+            "upper_whisker": float(values[inside].max()) if inside.any() else q3,
+            "outliers": outliers,
+            "n_outliers": n_outliers,
+            "count": profile.count
+        }
+
+    return memoize_on_frame(df, ("box_data", col, whisker, max_outliers), compute)
+
+def value_counts(df: pd.DataFrame, col) -> pd.Series:
+    """
+    Non-null value counts of a column, most frequent first; computed once per frame.
+    """
+    return memoize_on_frame(df, ("value_counts", col), lambda: df[col].value_counts(sort=True, dropna=True))
+
+def category_counts(df: pd.DataFrame, col, top_k: int = TOP_CATEGORIES) -> pd.DataFrame:
+    """
+    The top_k most frequent values of a column with their counts, and the remaining
+    values folded into one "Other (n more)" row. Columns: col, "Count".
+    """
+    def compute():
+        counts = value_counts(df, col)
+        top = counts.iloc[:top_k]
+        labels, values = list(top.index), list(top.to_numpy())
+        if len(counts) > top_k:
+            labels.append(f"Other ({len(counts) - top_k} more)")
+            values.append(int(counts.iloc[top_k:].sum()))
+        return pd.DataFrame({col: pd.Series(labels, dtype="object"), "Count": np.array(values, dtype="int64")})
+
+    return memoize_on_frame(df, ("category_counts", col, top_k), compute)
+
+def _time_bin(span_ns: int, max_bins: int):
+    """
+    Smallest TIME_FREQUENCIES step that splits span_ns into at most max_bins bins.
+    """
+    for label, step in TIME_FREQUENCIES:
+        if span_ns // step + 1 <= max_bins:
+            return label, step
+    label, step = TIME_FREQUENCIES[-1]
+    return label, max(step, -(-span_ns // max_bins))
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling (Steinarsson, 2013): positions of n_out
+    points of the (x-sorted) series that keep its visual shape, peaks included.
+    The first and last points are always kept.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = x.astype("float64")
+    y = y.astype("float64")
+    # Interior points split into n_out - 2 buckets; one point is kept per bucket
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    previous = 0
+    for b in range(n_out - 2):
+        start, stop = edges[b], edges[b + 1]
+        # Third vertex: the average of the next bucket (the last point for the final bucket)
+        next_start, next_stop = stop, edges[b + 2] if b + 2 < len(edges) else n
+        avg_x, avg_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        keep[b + 1] = previous
+    return keep
+
+def time_counts(df: pd.DataFrame, col, max_bins: int = MAX_TIME_BINS, max_points: int = TIME_POINT_BUDGET):
+    """
+    Rows per point in time of a datetime column, bounded by max_points. Columns with
+    up to max_points distinct timestamps are counted per timestamp; others are resampled
+    to the smallest TIME_FREQUENCIES step giving at most max_bins bins (a bincount on
+    int64 nanoseconds) and then reduced with LTTB. Returns x (timestamps), y (counts) and
+    the resampling frequency label (None when counted per timestamp).
+    """
+    def compute():
+        series = df[col].dropna()
+        if series.empty:
+            return {"x": pd.DatetimeIndex([]), "y": np.array([], dtype="int64"), "freq": None, "downsampled": False}
+        tz = series.dt.tz
+        ints = series.dt.as_unit("ns").astype("int64").to_numpy()
+        freq = None
+        if get_profile(df)[col].distinct <= max_points:
+            times, counts = np.unique(ints, return_counts=True)
+        else:
+            low = ints.min()
+            freq, step = _time_bin(int(ints.max() - low), max_bins)
+            origin = low - low % step
+            counts = np.bincount((ints - origin) // step)
+            times = origin + np.arange(counts.size, dtype="int64") * step
+        downsampled = times.size > max_points
+        if downsampled:
+            keep = lttb(times, counts, max_points)
+            times, counts = times[keep], counts[keep]
+        x = pd.to_datetime(times, unit="ns", utc=tz is not None)
+        if tz is not None:
+            x = x.tz_convert(tz)
+        return {"x": x, "y": counts, "freq": freq, "downsampled": downsampled}
+
+    return memoize_on_frame(df, ("time_counts", col, max_bins, max_points), compute)
+
+@dataclass(frozen=True)
+class ChartSpec:
+    """
+    Backend-neutral description of one chart: the aggregated data it shows plus the
+    metadata a renderer needs. kind is one of CHART_NAMES; data is the matching
+    histogram_data, box_data, category_counts or time_counts result.
+    """
+    kind: str
+    column: object
+    title: str
+    data: object
+
+    @property
+    def name(self) -> str:
+        return f"{CHART_NAMES[self.kind]} - {self.column}"
+
+def chart_columns(df: pd.DataFrame) -> Dict[str, List]:
+    """
+    Chartable columns by kind: "numeric", "categorical" and "datetime".
+    """
+    return {
+        "numeric": df.select_dtypes(include="number").columns.tolist(),
+        "categorical": df.select_dtypes(include=CATEGORICAL_DTYPES).columns.tolist(),
+        "datetime": df.select_dtypes(include="datetime").columns.tolist()
+    }
+
+def column_chart_specs(df: pd.DataFrame, col, kind: str) -> List[ChartSpec]:
+    """
+    Specs of every chart of one column: histogram and box plot for numeric columns,
+    bar chart (plus a pie chart for at most PIE_MAX_DISTINCT values) for categorical
+    ones, and a time trend for datetimes. Memoized per frame.
+    """
+    def compute():
+        if kind == "numeric":
+            return [
+                ChartSpec("histogram", col, f"Distribution of {col}", histogram_data(df, col)),
+                ChartSpec("box", col, f"Box Plot of {col}", box_data(df, col))
+            ]
+        if kind == "categorical":
+            specs = [ChartSpec("bar", col, f"Bar Chart of {col}", category_counts(df, col))]
+            if get_profile(df)[col].distinct <= PIE_MAX_DISTINCT:
+                specs.append(ChartSpec("pie", col, f"Pie Chart of {col}", category_counts(df, col, PIE_CATEGORIES)))
+            return specs
+        return [ChartSpec("time", col, f"Time Trend of {col}", time_counts(df, col))]
+
+    return memoize_on_frame(df, ("column_chart_specs", col, kind), compute)
+
+def export_chart_specs(df: pd.DataFrame) -> List[ChartSpec]:
+    """
+    Specs of the charts included in exports: the first EXPORT_COLUMNS columns of each kind.
+    """
+    columns = chart_columns(df)
+    return [
+        spec
+        for kind, limit in EXPORT_COLUMNS.items()
+        for col in columns[kind][:limit]
+        for spec in column_chart_specs(df, col, kind)
+    ]
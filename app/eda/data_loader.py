@@ -1,14 +1,181 @@
 # eda/data_loader.py
 
+import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import streamlit as st
+from eda.spill import SpilledFrame
+from eda.dtype_optimizer import optimize_dtypes
+from eda.dataset_cache import DATASET_CACHE, content_key
+
+DEFAULT_CHUNK_ROWS = 100_000
+DEFAULT_MEMORY_BUDGET_MB = 1024
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+ARROW_IPC_EXTENSIONS = ('.feather', '.arrow', '.ipc')
+
+def read_csv_chunked(file, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                     memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB, on_progress=None):
+    """
+    Reads a CSV in chunks of `chunk_rows` rows while tracking in-memory size.
+    Returns a DataFrame when the data fits in `memory_budget_mb`, otherwise a
+    SpilledFrame holding every chunk on disk. `on_progress(fraction, rows)` is
+    called after each chunk.
+    """
+    budget_bytes = memory_budget_mb * 1024 * 1024
+    total_bytes = getattr(file, "size", None)
+
+    chunks = []
+    in_memory_bytes = 0
+    rows_read = 0
+    spilled = None
+
+    for chunk in pd.read_csv(file, chunksize=chunk_rows):
+        rows_read += len(chunk)
+
+        if spilled is not None:
+            spilled.append(chunk)
+        else:
+            chunks.append(chunk)
+            in_memory_bytes += int(chunk.memory_usage(deep=True).sum())
+            if in_memory_bytes > budget_bytes:
+                # Budget exceeded: move what we have to disk and keep streaming there
+                spilled = SpilledFrame(chunk.columns)
+                for held in chunks:
+                    spilled.append(held)
+                chunks = []
+
+        if on_progress is not None:
+            fraction = min(file.tell() / total_bytes, 1.0) if total_bytes else 0.0
+            on_progress(fraction, rows_read)
+
+    if spilled is not None:
+        return spilled
+    return pd.concat(chunks, ignore_index=True)
+
+def _arrow_source(file):
+    """
+    Returns a pyarrow readable source. Paths are memory-mapped; in-memory uploads
+    are wrapped without copying their bytes.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        return pa.memory_map(os.fspath(file), "r")
+    return pa.BufferReader(pa.py_buffer(file.getbuffer()))
+
+def _is_parquet(name: str) -> bool:
+    return name.lower().endswith(PARQUET_EXTENSIONS)
+
+def inspect_columnar_file(file, name: str) -> dict:
+    """
+    Reads only the footer/schema of a Parquet or Arrow IPC file.
+    Returns column names, the number of row groups (record batches for IPC) and rows.
+    """
+    if _is_parquet(name):
+        metadata = pq.ParquetFile(_arrow_source(file)).metadata
+        return {
+            "columns": metadata.schema.to_arrow_schema().names,
+            "row_groups": metadata.num_row_groups,
+            "rows": metadata.num_rows
+        }
+    reader = pa.ipc.open_file(_arrow_source(file))
+    return {
+        "columns": reader.schema.names,
+        "row_groups": reader.num_record_batches,
+        "rows": sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+    }
+
+def read_columnar(file, name: str, columns=None, row_groups=None) -> pd.DataFrame:
+    """
+    Reads a Parquet or Arrow IPC (Feather v2) file into pandas, decoding only the
+    requested `columns` and `row_groups` (record batches for IPC).
+    """
+    if _is_parquet(name):
+        parquet_file = pq.ParquetFile(_arrow_source(file))
+        if row_groups is None:
+            table = parquet_file.read(columns=columns)
+        else:
+            table = parquet_file.read_row_groups(row_groups, columns=columns)
+    else:
+        reader = pa.ipc.open_file(_arrow_source(file))
+        batch_ids = range(reader.num_record_batches) if row_groups is None else row_groups
+        # Batches from a memory-mapped/buffer source are zero-copy; only the projected columns get converted
+        table = pa.Table.from_batches([reader.get_batch(i) for i in batch_ids], schema=reader.schema)
+        if columns is not None:
+            table = table.select(columns)
+    return table.to_pandas()
+
+def _columnar_projection_options(file, name: str):
+    """
+    Renders column / row-group pickers for a columnar file and returns the selection.
+    """
+    info = inspect_columnar_file(file, name)
+    st.caption(f"{info['rows']:,} rows · {len(info['columns'])} columns · {info['row_groups']} row group(s)")
+    columns = st.multiselect(
+        "Columns to load",
+        info["columns"],
+        default=info["columns"],
+        key="load_columns",
+        help="Only the selected columns are decoded."
+    )
+    row_groups = None
+    if info["row_groups"] > 1:
+        first, last = st.slider(
+            "Row groups to load",
+            min_value=0,
+            max_value=info["row_groups"] - 1,
+            value=(0, info["row_groups"] - 1),
+            key="load_row_groups"
+        )
+        if (first, last) != (0, info["row_groups"] - 1):
+            row_groups = list(range(first, last + 1))
+    return columns or None, row_groups
+
+def load_dataset(file, name: str, options: dict) -> dict:
+    """
+    Parses an upload according to the loader options.
+    Returns the in-memory frame to analyse, the SpilledFrame it was sampled from
+    (if the memory budget was exceeded) and the dtype optimization report (if enabled).
+    """
+    spilled = None
+    memory_report = None
+    file.seek(0)
+
+    if name.endswith('.csv'):
+        if options["streaming"]:
+            progress = st.progress(0.0, text="Reading CSV...")
+            df = read_csv_chunked(
+                file,
+                chunk_rows=options["chunk_rows"],
+                memory_budget_mb=options["memory_budget_mb"],
+                on_progress=lambda fraction, rows: progress.progress(
+                    fraction, text=f"Reading CSV... {rows:,} rows"
+                )
+            )
+            progress.empty()
+        else:
+            df = pd.read_csv(file)
+    elif name.lower().endswith(PARQUET_EXTENSIONS + ARROW_IPC_EXTENSIONS):
+        df = read_columnar(file, name, columns=options["columns"], row_groups=options["row_groups"])
+    else:
+        df = pd.read_excel(file)
+
+    if isinstance(df, SpilledFrame):
+        # Over the memory budget: keep the full data on disk and analyse a bounded sample
+        spilled = df
+        df = spilled.sample_frame(options["memory_budget_mb"] * 1024 * 1024 // 4)
+
+    if options["optimize_dtypes"]:
+        df, memory_report = optimize_dtypes(df, arrow_strings=options["arrow_strings"])
+
+    return {"df": df, "spilled": spilled, "memory_report": memory_report}
 
 def upload_file():
     st.markdown("""
         <div style="text-align: center; margin-top: 1rem; margin-bottom: 2rem;">
             <h2 style="color: #22c55e; font-weight: 600; font-size: 1.75rem;">📁 Upload Your Dataset</h2>
             <p style="color: #cbd5e1; font-size: 1rem;">
-                Supported formats: <strong>.csv</strong> and <strong>.xlsx</strong><br>
+                Supported formats: <strong>.csv</strong>, <strong>.xlsx</strong>, <strong>.parquet</strong> and <strong>.feather/.arrow</strong><br>
                 Upload your dataset to begin exploring insights.
             </p>
         </div>
@@ -16,21 +183,62 @@ def upload_file():
 
     file = st.file_uploader(
         "Choose a file",
-        type=['csv', 'xlsx'],
+        type=['csv', 'xlsx', 'parquet', 'pq', 'feather', 'arrow', 'ipc'],
         label_visibility="collapsed",
-        help="Supported formats: .csv and .xlsx"
+        help="Supported formats: .csv, .xlsx, .parquet and Arrow IPC (.feather/.arrow)"
     )
 
+    with st.expander("⚙️ Loading Options"):
+        options = {
+            "streaming": st.checkbox("Stream CSV files in chunks", value=True, key="load_streaming"),
+            "chunk_rows": int(st.number_input("Rows per chunk", min_value=1_000, value=DEFAULT_CHUNK_ROWS,
+                                              step=10_000, key="load_chunk_rows")),
+            "memory_budget_mb": st.number_input("Session memory budget (MB)", min_value=16,
+                                                value=DEFAULT_MEMORY_BUDGET_MB, step=128,
+                                                key="load_memory_budget_mb",
+                                                help="Larger datasets are spilled to disk and analysed on a sample."),
+            "optimize_dtypes": st.checkbox("Optimize column dtypes after loading", value=False,
+                                           key="load_optimize_dtypes",
+                                           help="Downcasts numbers and stores low-cardinality text as categories."),
+            "arrow_strings": st.checkbox("Use Arrow-backed strings for remaining text columns", value=False,
+                                         key="load_arrow_strings"),
+            "columns": None,
+            "row_groups": None
+        }
+        if file is not None and file.name.lower().endswith(PARQUET_EXTENSIONS + ARROW_IPC_EXTENSIONS):
+            try:
+                options["columns"], options["row_groups"] = _columnar_projection_options(file, file.name)
+            except Exception:
+                # Unreadable footer/schema; the read below reports the error
+                pass
+
     if file is not None:
         try:
-            if file.name.endswith('.csv'):
-                df = pd.read_csv(file)
-            else:
-                df = pd.read_excel(file)
-            st.success("✅ File uploaded and loaded successfully.")
-            return df
+            # Reruns with the same bytes and options reuse the parsed dataset
+            dataset_key = content_key(file.getbuffer(), name=file.name, **options)
+            dataset = DATASET_CACHE.get(dataset_key)
+            if dataset is None:
+                dataset = load_dataset(file, file.name, options)
+                DATASET_CACHE.put(dataset_key, dataset)
         except Exception as e:
             st.error(f"❌ Error reading file: {e}")
             return None
 
+        if st.session_state.get("dataset_key") != dataset_key:
+            # Cleaned parts on disk belong to the previous dataset
+            st.session_state.pop("df_cleaned_spilled", None)
+        st.session_state.dataset_key = dataset_key
+        st.session_state.memory_report = dataset["memory_report"]
+        if dataset["spilled"] is not None:
+            spilled = dataset["spilled"]
+            st.session_state.df_spilled = spilled
+            st.warning(
+                f"⚠️ Dataset ({spilled.nbytes / 1024 ** 2:,.0f} MB in memory) exceeds the session budget and was "
+                f"spilled to disk. Analyses use a {dataset['df'].shape[0]:,}-row sample of {spilled.n_rows:,} rows."
+            )
+        else:
+            st.session_state.pop("df_spilled", None)
+        st.success("✅ File uploaded and loaded successfully.")
+        return dataset["df"]
+
     return None
@@ -0,0 +1,125 @@
+# eda/dataset_cache.py
+
+import hashlib
+import os
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_MB = int(os.environ.get("AUTOEDA_CACHE_MB", 2048))
+
+def content_key(data, **options) -> str:
+    """
+    Hashes raw upload bytes (any buffer) together with the loader options that shape the parsed result.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(data)
+    digest.update(repr(sorted(options.items())).encode("utf-8"))
+    return digest.hexdigest()
+
+def estimate_nbytes(value) -> int:
+    """
+    Approximate in-memory size of a cached value.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(value, pd.DataFrame) else int(usage)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+class DatasetCache:
+    """
+    Process-wide LRU cache bounded by an approximate byte budget.
+    Shared by all Streamlit sessions, so every operation takes a lock.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value, nbytes: int = None):
+        nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        if nbytes > self.max_bytes:
+            return  # Never evict everything for a single oversized value
+        with self._lock:
+            if key in self._entries:
+                self._total -= self._sizes.pop(key)
+                del self._entries[key]
+            self._entries[key] = value
+            self._sizes[key] = nbytes
+            self._total += nbytes
+            while self._total > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self._total -= self._sizes.pop(old_key)
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached value for key, computing and storing it on a miss.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total = 0
+
+DATASET_CACHE = DatasetCache(DEFAULT_CACHE_MB * 1024 * 1024)
+
+def cached(dataset_key: str, name: str, compute):
+    """
+    Memoizes a result derived from the dataset identified by dataset_key.
+    """
+    if dataset_key is None:
+        return compute()
+    return DATASET_CACHE.get_or_compute((dataset_key, name), compute)
+
+# Results keyed by id() of live DataFrames; entries are dropped when the frame is collected
+_FRAME_RESULTS = {}
+
+def _drop_frame_results(frame_id: int):
+    _FRAME_RESULTS.pop(frame_id, None)
+
+def memoize_on_frame(df: pd.DataFrame, name: str, compute):
+    """
+    Memoizes compute() for the lifetime of the DataFrame object df.
+    Frames in this app are not mutated after creation, so results stay valid.
+    Results must not reference df itself, or the frame is never released.
+    """
+    entry = _FRAME_RESULTS.get(id(df))
+    if entry is None or entry[0]() is not df:
+        entry = (weakref.ref(df), {})
+        _FRAME_RESULTS[id(df)] = entry
+        weakref.finalize(df, _drop_frame_results, id(df))
+    results = entry[1]
+    if name not in results:
+        results[name] = compute()
+    return results[name]
@@ -0,0 +1,61 @@
+# eda/dtype_optimizer.py
+
+import numpy as np
+import pandas as pd
+
+def _column_bytes(series: pd.Series) -> int:
+    return int(series.memory_usage(deep=True, index=False))
+
+def _optimize_column(series: pd.Series, category_ratio: float, arrow_strings: bool) -> pd.Series:
+    if pd.api.types.is_bool_dtype(series):
+        return series
+
+    if pd.api.types.is_integer_dtype(series):
+        # Signed only: unsigned columns wrap around on subtraction in later analyses
+        return pd.to_numeric(series, downcast="integer")
+
+    if pd.api.types.is_float_dtype(series):
+        # Only keep float32 when it round-trips exactly, so no values change
+        candidate = series.astype("float32")
+        if np.array_equal(candidate.to_numpy(dtype="float64"), series.to_numpy(dtype="float64"), equal_nan=True):
+            return candidate
+        return series
+
+    if series.dtype == "object":
+        non_null = series.count()
+        if non_null == 0:
+            return series
+        unique = series.nunique(dropna=True)
+        if unique / non_null <= category_ratio:
+            return series.astype("category")
+        if arrow_strings and pd.api.types.infer_dtype(series, skipna=True) == "string":
+            return series.astype("string[pyarrow]")
+
+    return series
+
+def optimize_dtypes(df: pd.DataFrame, category_ratio: float = 0.5, arrow_strings: bool = False):
+    """
+    Downcasts numeric columns and converts low-cardinality object columns to `category`
+    (and, optionally, remaining text columns to Arrow-backed strings).
+    Returns the optimized DataFrame and a per-column before/after memory report.
+    """
+    optimized = {}
+    report = []
+    for col in df.columns:
+        before = df[col]
+        after = _optimize_column(before, category_ratio, arrow_strings)
+        optimized[col] = after
+        before_bytes = _column_bytes(before)
+        after_bytes = _column_bytes(after)
+        report.append({
+            "Column": col,
+            "Before dtype": str(before.dtype),
+            "After dtype": str(after.dtype),
+            "Before (KB)": round(before_bytes / 1024, 2),
+            "After (KB)": round(after_bytes / 1024, 2),
+            "Saved %": round((1 - after_bytes / before_bytes) * 100, 2) if before_bytes else 0.0
+        })
+
+    optimized_df = pd.DataFrame(optimized, index=df.index)
+    report_df = pd.DataFrame(report).sort_values(by="Before (KB)", ascending=False).reset_index(drop=True)
+    return optimized_df, report_df
@@ -1,11 +1,160 @@
 # eda/missing_values.py
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+from eda.dataset_cache import memoize_on_frame
 
-def get_missing_value_report(df: pd.DataFrame) -> pd.DataFrame:
-    missing = df.isnull().sum()
-    missing_percent = df.isnull().mean() * 100
+ROW_BLOCK_BYTES = 8192  # rows are processed 8 * ROW_BLOCK_BYTES at a time
+PAIR_BLOCK = 64
+TOP_PATTERNS = 10
+
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """
+    Number of set bits in each element.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    as_bytes = values.view(np.uint8).reshape(values.shape + (values.itemsize,))
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=-1)
+
+class NullityBitmap:
+    """
+    Missing-value mask of a DataFrame with one bit per cell: row r of column c is bit r
+    of bits[c] (np.packbits order). A 10M x 200 frame takes about 250 MB instead of
+    a 2 GB boolean frame. Counts, row distributions, patterns and co-missingness are
+    all derived from the packed bits.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns = list(df.columns)
+        self.n_rows = len(df)
+        # Padding to whole 64-bit words lets pairwise ANDs run on uint64
+        n_bytes = -(-self.n_rows // 64) * 8
+        self.bits = np.zeros((len(self.columns), n_bytes), dtype=np.uint8)
+        for i, col in enumerate(self.columns):
+            packed = np.packbits(df[col].isna().to_numpy())
+            self.bits[i, :packed.size] = packed
+
+    def column_counts(self) -> pd.Series:
+        counts = _popcount(self.bits.view(np.uint64)).sum(axis=1, dtype=np.int64)
+        return pd.Series(counts, index=self.columns, dtype="int64")
+
+    def _row_blocks(self, columns: np.ndarray):
+        """
+        Yields boolean (rows x columns) blocks of the mask for the selected column positions.
+        """
+        for start in range(0, self.bits.shape[1], ROW_BLOCK_BYTES):
+            block = np.unpackbits(self.bits[columns, start:start + ROW_BLOCK_BYTES], axis=1)
+            rows = min(block.shape[1], self.n_rows - start * 8)
+            if rows <= 0:
+                break
+            yield block[:, :rows].T.astype(bool)
+
+    def missing_columns(self) -> np.ndarray:
+        return np.flatnonzero(self.column_counts().to_numpy() > 0)
+
+    def row_distribution(self) -> pd.DataFrame:
+        """
+        How many rows have 0, 1, 2, ... missing values.
+        """
+        columns = self.missing_columns()
+        totals = np.zeros(len(self.columns) + 1, dtype=np.int64)
+        if columns.size == 0:
+            totals[0] = self.n_rows
+        else:
+            for block in self._row_blocks(columns):
+                totals += np.bincount(block.sum(axis=1), minlength=totals.size)
+        present = np.flatnonzero(totals)
+        return pd.DataFrame({
+            "Missing Values in Row": present,
+            "Rows": totals[present],
+            "Rows (%)": np.round(totals[present] / max(self.n_rows, 1) * 100, 2)
+        })
+
+    def pattern_frequencies(self, top: int = TOP_PATTERNS) -> pd.DataFrame:
+        """
+        Most frequent combinations of missing columns across rows (rows with no
+        missing values form the empty pattern).
+        """
+        columns = self.missing_columns()
+        counts = {}
+        if columns.size == 0:
+            counts[b""] = self.n_rows
+        else:
+            n_words = -(-columns.size // 64)
+            for block in self._row_blocks(columns):
+                # Each row's pattern packed into 64-bit words; one word covers up to 64 columns
+                packed = np.zeros((block.shape[0], n_words * 8), dtype=np.uint8)
+                packed[:, :-(-columns.size // 8)] = np.packbits(block, axis=1)
+                words = packed.view(np.uint64)
+                if n_words == 1:
+                    uniques, block_counts = np.unique(words.ravel(), return_counts=True)
+                    uniques = uniques[:, None]
+                else:
+                    uniques, block_counts = np.unique(words, axis=0, return_counts=True)
+                for key, count in zip(uniques, block_counts):
+                    key = key.tobytes()
+                    counts[key] = counts.get(key, 0) + int(count)
+
+        names = np.array(self.columns, dtype=object)[columns]
+        ranked = sorted(counts.items(), key=lambda item: -item[1])[:top]
+        records = []
+        for key, count in ranked:
+            flags = np.unpackbits(np.frombuffer(key, dtype=np.uint8))[:columns.size].astype(bool) if key else []
+            missing = ", ".join(str(name) for name in names[flags]) if len(flags) else ""
+            records.append({
+                "Missing Columns": missing or "(none)",
+                "Columns Missing": int(np.count_nonzero(flags)),
+                "Rows": count,
+                "Rows (%)": round(count / max(self.n_rows, 1) * 100, 2)
+            })
+        return pd.DataFrame(records)
+
+    def co_missing_correlation(self) -> pd.DataFrame:
+        """
+        Pearson correlation between the missing-value indicators of every pair of columns
+        that has missing values (1 = both tend to be missing together, -1 = never together).
+        Pair counts come from popcounts of the ANDed bitmaps, 64 rows per word.
+        """
+        columns = self.missing_columns()
+        words = self.bits[columns].view(np.uint64)
+        both = np.zeros((columns.size, columns.size), dtype=np.int64)
+        for start in range(0, columns.size, PAIR_BLOCK):
+            block = words[start:start + PAIR_BLOCK]
+            for offset, row in enumerate(block):
+                i = start + offset
+                both[i, i:] = _popcount(row & words[i:]).sum(axis=1, dtype=np.int64)
+        both = np.triu(both) + np.triu(both, k=1).T
+
+        n = self.n_rows
+        counts = np.diag(both).astype("float64")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread = np.sqrt(counts * (n - counts))
+            corr = (n * both - np.outer(counts, counts)) / np.outer(spread, spread)
+        names = [self.columns[i] for i in columns]
+        return pd.DataFrame(corr, index=names, columns=names)
+
+def get_nullity_bitmap(df: pd.DataFrame) -> NullityBitmap:
+    """
+    Returns the NullityBitmap for df, building it on first use.
+    """
+    return memoize_on_frame(df, "nullity_bitmap", lambda: NullityBitmap(df))
+
+def get_missing_value_report(df: pd.DataFrame, profile=None) -> pd.DataFrame:
+    """
+    Missing count and percent per column with missing values. Counts come from the given
+    profile (e.g. the streamed full profile of a spilled dataset) or the nullity bitmap.
+    """
+    if profile is not None:
+        missing = pd.Series({col: p.null_count for col, p in profile.columns.items()}, dtype="int64")
+        n_rows = profile.n_rows
+    else:
+        missing = get_nullity_bitmap(df).column_counts()
+        n_rows = len(df)
+    missing_percent = missing / n_rows * 100 if n_rows else missing.astype("float64")
     report = pd.DataFrame({
         "Missing Count": missing,
         "Missing (%)": missing_percent
@@ -27,3 +176,15 @@ def plot_missing_bar(missing_df: pd.DataFrame):
     fig.update_traces(texttemplate="%{text:.1f}%", textposition="outside")
     fig.update_layout(yaxis_range=[0, 100])
     return fig
+
+def plot_co_missing_heatmap(corr_df: pd.DataFrame):
+    if corr_df.shape[0] < 2:
+        return None
+    fig = px.imshow(
+        corr_df,
+        color_continuous_scale="RdBu_r",
+        zmin=-1,
+        zmax=1,
+        title="Co-missingness (correlation of missing-value indicators)"
+    )
+    return fig
@@ -0,0 +1,110 @@
+# eda/parallel.py
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_WORKERS = int(os.environ.get("AUTOEDA_WORKERS", os.cpu_count() or 1))
+PARALLEL_MIN_CELLS = 2_000_000
+TASKS_PER_WORKER = 4
+
+_EXECUTOR = None
+_EXECUTOR_WORKERS = 0
+_EXECUTOR_LOCK = threading.Lock()
+
+def resolve_workers(n_rows: int, n_columns: int, workers: int = None) -> int:
+    """
+    Number of processes to use for column-wise work on an n_rows x n_columns block.
+    Small frames run serially (1): shipping them to a pool costs more than it saves.
+    """
+    workers = DEFAULT_WORKERS if workers is None else workers
+    if workers <= 1 or n_columns < 2 or n_rows * n_columns < PARALLEL_MIN_CELLS:
+        return 1
+    return min(workers, n_columns)
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns a process pool with the given number of workers, reused across calls.
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or _EXECUTOR_WORKERS != workers:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+            # Streamlit runs scripts in threads, and forking a threaded process is unsafe
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+            _EXECUTOR = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+            _EXECUTOR_WORKERS = workers
+        return _EXECUTOR
+
+class SharedColumns:
+    """
+    Float64 copy of some DataFrame columns in a multiprocessing.shared_memory block,
+    stored column-major so every column is one contiguous slice. Workers attach to
+    the block by name instead of receiving pickled copies. NaN marks missing values.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns):
+        self.columns = list(columns)
+        self.shape = (len(df), len(self.columns))
+        size = max(self.shape[0] * self.shape[1] * 8, 1)
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        block = self.array()
+        for i, col in enumerate(self.columns):
+            block[:, i] = df[col].to_numpy(dtype="float64", na_value=np.nan)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def array(self) -> np.ndarray:
+        return np.ndarray(self.shape, dtype="float64", buffer=self.shm.buf, order="F")
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _column_worker(func, shm_name: str, shape, items):
+    """
+    Runs func(column_view, *args) for each (position, args) in items, inside a worker.
+    Results must not keep references to the shared buffer.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray(shape, dtype="float64", buffer=shm.buf, order="F")
+        results = [func(block[:, position], *args) for position, args in items]
+        del block
+        return results
+    finally:
+        shm.close()
+
+def map_shared_columns(func, shared: SharedColumns, args_per_column, workers: int):
+    """
+    Applies func(column_view, *args) to every column of a SharedColumns block on a
+    process pool and returns the results in column order. Columns are partitioned
+    into contiguous groups, a few per worker, to balance uneven columns.
+    func must be a module-level function so it can be sent to the workers.
+    """
+    items = list(enumerate(args_per_column))
+    n_tasks = min(len(items), workers * TASKS_PER_WORKER)
+    groups = [group.tolist() for group in np.array_split(np.arange(len(items)), n_tasks) if group.size]
+    executor = _get_executor(workers)
+    futures = [
+        executor.submit(_column_worker, func, shared.name, shared.shape, [items[i] for i in group])
+        for group in groups
+    ]
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
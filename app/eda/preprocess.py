@@ -1,23 +1,223 @@
+import json
+
 import pandas as pd
 import numpy as np
+from eda.profiler import get_profile
+from eda.spill import SpilledFrame
+from eda.streaming_stats import StreamingStats
+
+MAX_CATEGORIES = 30
+FILL_LABEL = "Unknown"
+
+def _to_builtin(value):
+    """
+    JSON encoder hook for NumPy scalars and timestamps (tagged so _from_builtin restores them).
+    """
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return {"__timestamp__": pd.Timestamp(value).isoformat()}
+    if isinstance(value, (pd.Timedelta, np.timedelta64)):
+        return {"__timedelta__": pd.Timedelta(value).isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__} in a preprocessing pipeline")
+
+def _from_builtin(obj: dict):
+    """
+    JSON decoder hook reversing the tags written by _to_builtin.
+    """
+    if "__timestamp__" in obj:
+        return pd.Timestamp(obj["__timestamp__"])
+    if "__timedelta__" in obj:
+        return pd.Timedelta(obj["__timedelta__"])
+    return obj
+
+def _column_name(name):
+    # JSON turns tuple column names (MultiIndex) into lists
+    return tuple(name) if isinstance(name, list) else name
+
+def _column_pairs(entries):
+    # Pipelines saved before names were stored as pairs map column -> value
+    return entries.items() if isinstance(entries, dict) else entries
+
+def _column_role(dtype) -> str:
+    """
+    How preprocessing treats a column of the given dtype: "numeric", "category", "text" or "other".
+    """
+    if pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "numeric"
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "category"
+    if dtype == "object" or pd.api.types.is_string_dtype(dtype):
+        return "text"
+    return "other"
+
+class PreprocessPipeline:
+    """
+    Preprocessing learned once and replayable on new data:
+    numeric missing values are filled with the fitted median, text/categorical ones
+    with "Unknown", and low-cardinality categoricals (less than MAX_CATEGORIES values,
+    "Unknown" included) are encoded with the fitted vocabulary, so every batch gets
+    the same codes. Values not seen during fit are encoded as -1.
+    """
+
+    def __init__(self, max_categories: int = MAX_CATEGORIES):
+        self.max_categories = max_categories
+        self.fill_values = {}
+        self.category_fills = []
+        self.vocabularies = {}
+
+    def _learn(self, col, role: str, null_count: int, median, values=None):
+        """
+        Records the fill value and (when values is given) the vocabulary of one column.
+        role is "numeric", "category", "text" or "other"; values are its non-null distinct
+        values, passed only for low-cardinality text/category columns.
+        """
+        if role == "numeric":
+            if not pd.isna(median):
+                self.fill_values[col] = median
+        elif role == "category":
+            if null_count:
+                # Categorical columns need the fill label added as a category first
+                self.category_fills.append(col)
+        elif role == "text":
+            self.fill_values[col] = FILL_LABEL
+
+        if values is None:
+            return
+        if role == "category":
+            vocabulary = list(values)
+            if null_count and FILL_LABEL not in vocabulary:
+                vocabulary.append(FILL_LABEL)
+        else:
+            if null_count:
+                values = np.append(values, FILL_LABEL)
+            # Same (sorted) category order astype("category") would give
+            vocabulary = list(pd.Categorical(values).categories)
+        self.vocabularies[col] = vocabulary
 
-def preprocess_data(df):
-    df = df.copy()
+    def fit(self, df: pd.DataFrame, profile=None) -> "PreprocessPipeline":
+        profile = profile or get_profile(df)
+        self.fill_values, self.category_fills, self.vocabularies = {}, [], {}
+        for col in df.columns:
+            dtype = df[col].dtype
+            col_profile = profile[col]
+            role = _column_role(dtype)
+            values = None
+            if role in ("category", "text") and col_profile.distinct_with_null < self.max_categories:
+                values = dtype.categories if role == "category" else pd.unique(df[col].dropna())
+            self._learn(col, role, col_profile.null_count, col_profile.quantiles.get(0.5), values)
+        return self
 
-    # Handle missing values
-    for col in df.columns:
-        if df[col].dtype in ["float64", "int64"]:
-            df[col].fillna(df[col].median(), inplace=True)
-        elif df[col].dtype == "object":
-            df[col].fillna("Unknown", inplace=True)
+    def fit_chunks(self, chunks) -> "PreprocessPipeline":
+        """
+        Fits in one pass over an iterable of chunks, holding one chunk at a time.
+        Medians come from the mergeable KLL sketches of StreamingStats (approximate);
+        distinct values are tracked per text/category column only until they reach
+        max_categories, so memory stays bounded.
+        """
+        stats = StreamingStats()
+        distinct = {}
+        for chunk in chunks:
+            stats.update(chunk)
+            for col in chunk.columns:
+                seen = distinct.setdefault(col, {})
+                if seen is None:
+                    continue
+                series = chunk[col]
+                role = _column_role(series.dtype)
+                if role != "category" and not series.notna().any():
+                    # An all-null chunk (e.g. float64 from read_csv) says nothing about the column's type
+                    continue
+                if role == "category":
+                    # Keep the declared category order, extended by later chunks
+                    seen.update(dict.fromkeys(series.cat.categories))
+                elif role == "text":
+                    seen.update(dict.fromkeys(pd.unique(series.dropna())))
+                else:
+                    distinct[col] = None
+                    continue
+                if len(seen) >= self.max_categories:
+                    distinct[col] = None
 
-    # Identify low-cardinality categoricals (less than 30 unique values)
-    cat_cols = df.select_dtypes(include="object").columns
-    low_cardinality = [col for col in cat_cols if df[col].nunique() < 30]
+        self.fill_values, self.category_fills, self.vocabularies = {}, [], {}
+        for col, col_stats in stats.columns.items():
+            role = _column_role(pd.api.types.pandas_dtype(col_stats.dtype or "object"))
+            null_count = col_stats.nulls.null_count
+            median = col_stats.sketch.quantiles([0.5])[0]
+            values = distinct.get(col)
+            if values is not None and len(values) + bool(null_count) < self.max_categories:
+                values = list(values)
+            else:
+                values = None
+            self._learn(col, role, null_count, median, values)
+        return self
 
-    # Encode low-cardinality categorical columns only
-    for col in low_cardinality:
-        df[col] = df[col].astype("category").cat.codes
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        fill_values = {col: value for col, value in self.fill_values.items() if col in df.columns}
+        # One dict-based fillna; it returns a new frame, so the input is never modified
+        df = df.fillna(fill_values)
+        for col in self.category_fills:
+            if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+                if FILL_LABEL not in df[col].cat.categories:
+                    df[col] = df[col].cat.add_categories(FILL_LABEL)
+                df[col] = df[col].fillna(FILL_LABEL)
+
+        # Vectorized lookup of each value's position in the fitted vocabulary
+        for col, vocabulary in self.vocabularies.items():
+            if col in df.columns:
+                df[col] = pd.Categorical(df[col], categories=vocabulary).codes
+        return df
+
+    def fit_transform(self, df: pd.DataFrame, profile=None) -> pd.DataFrame:
+        return self.fit(df, profile).transform(df)
+
+    def to_dict(self) -> dict:
+        """
+        JSON-ready form. Per-column settings are [column, value] pairs rather than
+        objects, so column names that are not strings (e.g. 0, 1) survive a round trip.
+        """
+        return {
+            "max_categories": self.max_categories,
+            "fill_values": [[col, value] for col, value in self.fill_values.items()],
+            "category_fills": list(self.category_fills),
+            "vocabularies": [[col, vocab] for col, vocab in self.vocabularies.items()]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PreprocessPipeline":
+        """
+        Inverse of to_dict. Raises ValueError when data is not a preprocessing pipeline.
+        """
+        try:
+            pipeline = cls(max_categories=int(data["max_categories"]))
+            pipeline.fill_values = {_column_name(col): value for col, value in _column_pairs(data["fill_values"])}
+            pipeline.category_fills = [_column_name(col) for col in data["category_fills"]]
+            pipeline.vocabularies = {_column_name(col): list(vocab) for col, vocab in _column_pairs(data["vocabularies"])}
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Not a valid preprocessing pipeline: {e!r}") from e
+        return pipeline
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), default=_to_builtin, indent=2)
+
+    @classmethod
+    def from_json(cls, text: str) -> "PreprocessPipeline":
+        return cls.from_dict(json.loads(text, object_hook=_from_builtin))
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+    @classmethod
+    def load(cls, path: str) -> "PreprocessPipeline":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_json(f.read())
+
+def preprocess_data(df, pipeline: PreprocessPipeline = None):
+    """
+    Cleans df with a fitted PreprocessPipeline; fits a new one on df when none is given.
+    """
+    pipeline = pipeline or PreprocessPipeline().fit(df)
 
     # Optional: Standardize numeric features
     # from sklearn.preprocessing import StandardScaler
@@ -25,4 +225,17 @@ def preprocess_data(df):
     # num_cols = df.select_dtypes(include=["float64", "int64"]).columns
     # df[num_cols] = scaler.fit_transform(df[num_cols])
 
-    return df
+    return pipeline.transform(df)
+
+def preprocess_spilled(spilled: SpilledFrame, pipeline: PreprocessPipeline = None):
+    """
+    Out-of-core preprocess_data for a dataset kept on disk: fits over the stored chunks
+    (when no pipeline is given), then cleans them one at a time into a new SpilledFrame,
+    so neither the raw nor the cleaned data is ever fully in memory.
+    Returns (cleaned SpilledFrame, pipeline).
+    """
+    pipeline = pipeline or PreprocessPipeline().fit_chunks(spilled.iter_chunks())
+    cleaned = SpilledFrame(spilled.columns, prefix="autoeda_clean_")
+    for chunk in spilled.iter_chunks():
+        cleaned.append(pipeline.transform(chunk))
+    return cleaned, pipeline
@@ -0,0 +1,266 @@
+# eda/profiler.py
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from eda.dataset_cache import memoize_on_frame
+from eda.parallel import SharedColumns, map_shared_columns, resolve_workers
+from eda.sketches import KLLSketch, EXACT_QUANTILE_MAX_ROWS, EXACT_DISTINCT_MAX_ROWS, approximate_distinct
+
+PROFILE_QUANTILES = (0.25, 0.5, 0.75)
+TOP_K = 10
+
+@dataclass
+class ColumnProfile:
+    """
+    Statistics of a single column, computed in one pass over its values.
+    Moments and quantiles are only set for numeric (non-boolean) columns.
+    `approximate` marks sketch-based quantiles/distinct counts (KLL, HyperLogLog).
+    """
+    name: str
+    dtype: str
+    n_rows: int
+    count: int
+    null_count: int
+    distinct: Optional[int]
+    is_numeric: bool = False
+    is_datetime: bool = False
+    mean: Optional[float] = None
+    variance: Optional[float] = None
+    skew: Optional[float] = None
+    min: Optional[object] = None
+    max: Optional[object] = None
+    quantiles: Dict[float, float] = field(default_factory=dict)
+    top_values: Optional[pd.Series] = None
+    approximate: bool = False
+
+    @property
+    def null_fraction(self) -> float:
+        return self.null_count / self.n_rows if self.n_rows else 0.0
+
+    @property
+    def distinct_with_null(self) -> int:
+        """
+        Distinct values counting missing as one value, like nunique(dropna=False).
+        """
+        if self.distinct is None:
+            return None
+        return self.distinct + (1 if self.null_count else 0)
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance)) if self.variance is not None else np.nan
+
+    @property
+    def population_std(self) -> float:
+        if self.variance is None or self.count == 0:
+            return np.nan
+        return float(np.sqrt(self.variance * (self.count - 1) / self.count))
+
+@dataclass
+class DatasetProfile:
+    n_rows: int
+    columns: Dict[str, ColumnProfile]
+
+    def __getitem__(self, name) -> ColumnProfile:
+        return self.columns[name]
+
+    def numeric_columns(self) -> List[str]:
+        return [name for name, col in self.columns.items() if col.is_numeric]
+
+def _run_lengths(sorted_values: np.ndarray):
+    """
+    Returns the distinct values of a sorted array and how often each occurs.
+    """
+    if sorted_values.size == 0:
+        return sorted_values, np.array([], dtype=np.int64)
+    starts = np.flatnonzero(np.concatenate(([True], sorted_values[1:] != sorted_values[:-1])))
+    counts = np.diff(np.append(starts, sorted_values.size))
+    return sorted_values[starts], counts
+
+def sorted_quantiles(sorted_values: np.ndarray, qs) -> Dict[float, float]:
+    """
+    Linear-interpolated quantiles (pandas/NumPy default) read directly from a sorted array.
+    """
+    n = sorted_values.size
+    if n == 0:
+        return {q: np.nan for q in qs}
+    result = {}
+    for q in qs:
+        pos = q * (n - 1)
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, n - 1)
+        result[q] = float(sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo))
+    return result
+
+def skew_from_moments(count: int, m2: float, m3: float) -> float:
+    """
+    Bias-corrected sample skewness (same definition as pandas Series.skew).
+    """
+    if count < 3:
+        return np.nan
+    # Treat floating-point residue as exact zero, as pandas does
+    m2 = 0.0 if abs(m2) < 1e-14 else m2
+    m3 = 0.0 if abs(m3) < 1e-14 else m3
+    if m2 == 0:
+        return 0.0
+    return float((count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5))
+
+def profile_numeric(name: str, series: pd.Series, top_k: int = TOP_K,
+                    exact_max_rows: int = EXACT_QUANTILE_MAX_ROWS, sorted_out: dict = None) -> ColumnProfile:
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    return profile_numeric_values(name, str(series.dtype), values, top_k, exact_max_rows, sorted_out)
+
+def profile_numeric_values(name: str, dtype: str, values: np.ndarray, top_k: int = TOP_K,
+                           exact_max_rows: int = EXACT_QUANTILE_MAX_ROWS, sorted_out: dict = None) -> ColumnProfile:
+    """
+    Profiles a float64 array (NaN = missing). The result holds no reference to values,
+    so values may be a view into a shared-memory block. When the values get sorted
+    for exact quantiles and sorted_out is given, sorted_out[name] receives the sorted
+    non-null values.
+    """
+    valid = values[~np.isnan(values)]
+    count = int(valid.size)
+
+    if count <= exact_max_rows:
+        # One sort gives exact quantiles, distinct count and top values
+        sorted_values = np.sort(valid)
+        if sorted_out is not None:
+            sorted_out[name] = sorted_values
+        uniques, counts = _run_lengths(sorted_values)
+        order = np.argsort(-counts, kind="stable")[:top_k]
+        quantiles = sorted_quantiles(sorted_values, PROFILE_QUANTILES)
+        distinct = int(uniques.size)
+        top_values = pd.Series(counts[order], index=uniques[order], name="count")
+    else:
+        # Large column: sketch quantiles and distinct count instead of sorting or building a hash set
+        sketch = KLLSketch().update(valid)
+        quantiles = dict(zip(PROFILE_QUANTILES, sketch.quantiles(PROFILE_QUANTILES)))
+        distinct = approximate_distinct(pd.Series(valid))
+        top_values = None
+
+    profile = ColumnProfile(
+        name=name,
+        dtype=dtype,
+        n_rows=int(values.size),
+        count=count,
+        null_count=int(values.size - count),
+        distinct=distinct,
+        is_numeric=True,
+        quantiles=quantiles,
+        top_values=top_values,
+        approximate=count > exact_max_rows
+    )
+    if count:
+        mean = float(valid.mean())
+        deviations = valid - mean
+        squared = deviations ** 2
+        m2 = float(squared.sum())
+        m3 = float((squared * deviations).sum())
+        profile.mean = mean
+        profile.variance = m2 / (count - 1) if count > 1 else np.nan
+        profile.skew = skew_from_moments(count, m2, m3)
+        profile.min = float(valid.min())
+        profile.max = float(valid.max())
+    return profile
+
+def profile_other(name: str, series: pd.Series, top_k: int = TOP_K,
+                  exact_max_rows: int = EXACT_DISTINCT_MAX_ROWS) -> ColumnProfile:
+    is_datetime = pd.api.types.is_datetime64_any_dtype(series)
+    if len(series) > exact_max_rows:
+        # Large column: HyperLogLog distinct count, no per-value hash table
+        count = int(series.count())
+        profile = ColumnProfile(
+            name=name,
+            dtype=str(series.dtype),
+            n_rows=int(len(series)),
+            count=count,
+            null_count=int(len(series) - count),
+            distinct=approximate_distinct(series),
+            is_datetime=is_datetime,
+            approximate=True
+        )
+        if is_datetime and count:
+            profile.min = series.min()
+            profile.max = series.max()
+        return profile
+
+    # Hash-based counting gives distinct, top values and non-null count together
+    value_counts = series.value_counts(dropna=True, sort=True)
+    count = int(value_counts.sum())
+    profile = ColumnProfile(
+        name=name,
+        dtype=str(series.dtype),
+        n_rows=int(len(series)),
+        count=count,
+        null_count=int(len(series) - count),
+        distinct=int(len(value_counts)),
+        is_datetime=is_datetime,
+        top_values=value_counts.head(top_k)
+    )
+    if is_datetime and count:
+        profile.min = value_counts.index.min()
+        profile.max = value_counts.index.max()
+    return profile
+
+def profile_column(name: str, series: pd.Series, top_k: int = TOP_K, sorted_out: dict = None) -> ColumnProfile:
+    if _is_profiled_numeric(series):
+        return profile_numeric(name, series, top_k, sorted_out=sorted_out)
+    return profile_other(name, series, top_k)
+
+def _is_profiled_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+def _profile_shared_column(values: np.ndarray, name: str, dtype: str, top_k: int):
+    """
+    Profiles a shared-memory column, then leaves it sorted in place (NaN last) for
+    the parent. Returns the profile and the number of non-NaN values.
+    """
+    sorted_out = {}
+    # Profiling the original order keeps moments bit-identical to the serial path
+    profile = profile_numeric_values(name, dtype, values, top_k, sorted_out=sorted_out)
+    if name in sorted_out:
+        values[:profile.count] = sorted_out[name]
+        values[profile.count:] = np.nan
+    else:
+        values.sort()
+    return profile, profile.count
+
+def profile_dataframe(df: pd.DataFrame, top_k: int = TOP_K, workers: int = None,
+                      sorted_out: dict = None) -> DatasetProfile:
+    """
+    Profiles every column of df, visiting each column's values once.
+    Numeric columns of large frames are profiled on a process pool (workers, default
+    AUTOEDA_WORKERS) that reads them from shared memory; small frames stay serial.
+    When sorted_out is given, it receives the sorted non-null values of every numeric
+    column that was sorted along the way, so they need not be sorted again.
+    """
+    numeric = [col for col in df.columns if _is_profiled_numeric(df[col])]
+    workers = resolve_workers(len(df), len(numeric), workers)
+    shared_profiles = {}
+    if workers > 1:
+        with SharedColumns(df, numeric) as shared:
+            args = [(col, str(df[col].dtype), top_k) for col in numeric]
+            results = map_shared_columns(_profile_shared_column, shared, args, workers)
+            block = shared.array()
+            for i, (col, (profile, count)) in enumerate(zip(numeric, results)):
+                shared_profiles[col] = profile
+                if sorted_out is not None:
+                    sorted_out[col] = block[:count, i].copy()
+            del block
+
+    columns = {
+        col: shared_profiles[col] if col in shared_profiles else profile_column(col, df[col], top_k, sorted_out)
+        for col in df.columns
+    }
+    return DatasetProfile(n_rows=len(df), columns=columns)
+
+def get_profile(df: pd.DataFrame, sorted_out: dict = None) -> DatasetProfile:
+    """
+    Returns the profile for df, computing it on first use. Only when this call computes
+    the profile and sorted_out is given does sorted_out receive the sorted numeric
+    columns (see profile_dataframe); the memoized profile never keeps them.
+    """
+    return memoize_on_frame(df, "profile", lambda: profile_dataframe(df, sorted_out=sorted_out))
@@ -0,0 +1,179 @@
+# eda/sketches.py
+
+import math
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_KLL_K = 200
+EXACT_QUANTILE_MAX_ROWS = 1_000_000
+UPDATE_BLOCK_ROWS = 1 << 16
+
+DEFAULT_HLL_PRECISION = 14
+EXACT_DISTINCT_MAX_ROWS = 1_000_000
+
+def kll_rank_error(k: int) -> float:
+    """
+    Approximate normalized rank error of a KLL sketch with parameter k
+    (99% confidence, single quantile; empirical fit from Apache DataSketches).
+    k=200 gives about 1.3%.
+    """
+    return 2.296 / k ** 0.9723
+
+class KLLSketch:
+    """
+    KLL quantile sketch with NumPy compactors. Memory is O(k log(n/k)), updates
+    take whole arrays, and two sketches merge into one that summarizes both inputs.
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, seed: int = 0):
+        self.k = k
+        self.levels = [np.empty(0, dtype="float64")]
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(math.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype="float64"))
+                items = np.sort(items)
+                # An odd item stays behind so the promoted half represents exactly twice its weight
+                keep = items[:1] if items.size % 2 else items[:0]
+                pairs = items[keep.size:]
+                promoted = pairs[self._rng.integers(0, 2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate((self.levels[level + 1], promoted))
+            level += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.count += int(values.size)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        # Feeding bounded blocks keeps every sort small instead of sorting the whole input once
+        for start in range(0, values.size, UPDATE_BLOCK_ROWS):
+            self.levels[0] = np.concatenate((self.levels[0], values[start:start + UPDATE_BLOCK_ROWS]))
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype="float64"))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate((self.levels[level], items))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    @property
+    def num_retained(self) -> int:
+        return sum(level.size for level in self.levels)
+
+    def quantiles(self, qs):
+        """
+        Returns approximate quantiles for each q in qs; the exact min/max are used for q=0 and q=1.
+        """
+        if self.count == 0:
+            return [np.nan for _ in qs]
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.size, 2 ** h, dtype="float64") for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        total = cumulative[-1]
+
+        result = []
+        for q in qs:
+            if q <= 0:
+                result.append(self.min)
+            elif q >= 1:
+                result.append(self.max)
+            else:
+                idx = int(np.searchsorted(cumulative, q * total, side="left"))
+                result.append(float(items[min(idx, items.size - 1)]))
+        return result
+
+def hll_relative_error(precision: int) -> float:
+    """
+    Standard error of a HyperLogLog estimate with 2**precision registers.
+    precision=14 (16 KB of registers) gives about 0.81%.
+    """
+    return 1.04 / math.sqrt(2 ** precision)
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """
+    Vectorized 64-bit hashes of the non-null values of a Series. Hashes are
+    deterministic across processes, so sketches from different workers merge.
+    Numbers are hashed as float64, so an int64 chunk and a float64 chunk of the
+    same column (a CSV chunk with a missing value) hash equal values alike.
+    """
+    values = series.dropna()
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        # Adding 0.0 turns -0.0 into 0.0, which compares equal but hashes differently
+        values = values.astype("float64") + 0.0
+    # categorize=False hashes every value directly instead of factorizing first (which builds a hash set)
+    return pd.util.hash_pandas_object(values, index=False, categorize=False).to_numpy()
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter over 64-bit hashes. Registers merge with an
+    element-wise max, so per-chunk sketches combine into the sketch of the union.
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update_hashes(self, hashes: np.ndarray):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return self
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << (64 - p)) - 1)
+        # Rank = position of the leftmost 1-bit in the remaining 64 - p bits
+        bit_length = np.zeros(remainder.shape, dtype=np.int64)
+        nonzero = remainder > 0
+        bit_length[nonzero] = np.floor(np.log2(remainder[nonzero].astype(np.float64))).astype(np.int64) + 1
+        rank = (64 - p - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def update(self, series: pd.Series):
+        return self.update_hashes(hash_values(series))
+
+    def merge(self, other: "HyperLogLog"):
+        if other.precision != self.precision:
+            raise ValueError("HyperLogLog sketches can only be merged at the same precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> int:
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction: linear counting
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+def approximate_distinct(series: pd.Series, precision: int = DEFAULT_HLL_PRECISION) -> int:
+    """
+    HyperLogLog estimate of the number of distinct non-null values.
+    """
+    return HyperLogLog(precision).update(series).estimate()
@@ -0,0 +1,104 @@
+# eda/spill.py
+
+import os
+import shutil
+import tempfile
+import weakref
+
+import pandas as pd
+
+
+def _parquet_safe(chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Casts object columns mixing value types (e.g. ints with a few strings, which
+    pd.read_csv leaves as object) to strings, keeping missing values, since
+    Parquet needs a single type per column.
+    """
+    mixed = [
+        col for col in chunk.columns
+        if chunk[col].dtype == "object" and pd.api.types.infer_dtype(chunk[col], skipna=True).startswith("mixed")
+    ]
+    if not mixed:
+        return chunk
+    chunk = chunk.copy()
+    for col in mixed:
+        chunk[col] = chunk[col].where(chunk[col].isna(), chunk[col].astype(str))
+    return chunk
+
+class SpilledFrame:
+    """
+    On-disk stand-in for a DataFrame that did not fit in the session memory budget.
+    Rows are stored as an ordered list of Parquet part files, one per ingested chunk.
+    """
+
+    def __init__(self, columns, prefix="autoeda_spill_"):
+        self.directory = tempfile.mkdtemp(prefix=prefix)
+        self.columns = list(columns)
+        self.parts = []
+        self.n_rows = 0
+        self.nbytes = 0
+        # Remove the spill directory once the object is garbage collected
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    @property
+    def shape(self):
+        return (self.n_rows, len(self.columns))
+
+    def append(self, chunk: pd.DataFrame):
+        """
+        Writes one chunk as a new Parquet part file.
+        """
+        path = os.path.join(self.directory, f"part-{len(self.parts):05d}.parquet")
+        chunk = _parquet_safe(chunk)
+        chunk.to_parquet(path, index=False)
+        self.parts.append(path)
+        self.n_rows += len(chunk)
+        self.nbytes += int(chunk.memory_usage(deep=True).sum())
+
+    def iter_chunks(self, columns=None):
+        """
+        Yields the stored chunks in order, optionally projecting to `columns`.
+        """
+        for path in self.parts:
+            yield pd.read_parquet(path, columns=columns)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        frames = []
+        remaining = n
+        for chunk in self.iter_chunks():
+            frames.append(chunk.head(remaining))
+            remaining -= len(frames[-1])
+            if remaining <= 0:
+                break
+        if not frames:
+            return pd.DataFrame(columns=self.columns)
+        return pd.concat(frames, ignore_index=True)
+
+    def sample_frame(self, max_bytes: int) -> pd.DataFrame:
+        """
+        Returns an evenly strided row sample whose estimated size stays within max_bytes.
+        """
+        bytes_per_row = max(self.nbytes / self.n_rows, 1) if self.n_rows else 1
+        return self.sample_rows(max(int(max_bytes // bytes_per_row), 1))
+
+    def sample_rows(self, max_rows: int) -> pd.DataFrame:
+        """
+        Returns an evenly strided sample of at most max_rows rows.
+        """
+        if self.n_rows == 0:
+            return pd.DataFrame(columns=self.columns)
+        step = max(-(-self.n_rows // max(max_rows, 1)), 1)
+        frames = [chunk.iloc[::step] for chunk in self.iter_chunks()]
+        return pd.concat(frames, ignore_index=True)
+
+    def to_frame(self, columns=None) -> pd.DataFrame:
+        """
+        Materializes the full dataset (or a column projection of it) in memory.
+        """
+        frames = list(self.iter_chunks(columns=columns))
+        if not frames:
+            return pd.DataFrame(columns=columns or self.columns)
+        return pd.concat(frames, ignore_index=True)
+
+    def cleanup(self):
+        self._finalizer()
@@ -0,0 +1,220 @@
+# eda/streaming_stats.py
+
+import numpy as np
+import pandas as pd
+from eda.profiler import ColumnProfile, DatasetProfile, PROFILE_QUANTILES, skew_from_moments
+from eda.sketches import KLLSketch, HyperLogLog
+
+class NullTally:
+    """
+    Mergeable row and missing-value counts.
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self.null_count = 0
+
+    def update(self, series: pd.Series):
+        self.n_rows += len(series)
+        self.null_count += int(series.isnull().sum())
+        return self
+
+    def merge(self, other: "NullTally"):
+        self.n_rows += other.n_rows
+        self.null_count += other.null_count
+        return self
+
+class RunningMoments:
+    """
+    Count, mean and central moment sums (M2, M3) plus min/max, mergeable with
+    the pairwise update of Chan et al. / Pébay. Results match a single full pass
+    up to floating-point rounding.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        chunk = RunningMoments()
+        chunk.count = int(values.size)
+        chunk.mean = float(values.mean())
+        deviations = values - chunk.mean
+        squared = deviations ** 2
+        chunk.m2 = float(squared.sum())
+        chunk.m3 = float((squared * deviations).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        return self.merge(chunk)
+
+    def merge(self, other: "RunningMoments"):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.m3 = other.count, other.mean, other.m2, other.m3
+            self.min, self.max = other.min, other.max
+            return self
+
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        m3 = (self.m3 + other.m3
+              + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+              + 3.0 * delta * (n_a * other.m2 - n_b * self.m2) / n)
+        m2 = self.m2 + other.m2 + delta ** 2 * n_a * n_b / n
+
+        self.count = n
+        self.mean = self.mean + delta * n_b / n
+        self.m2 = m2
+        self.m3 = m3
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def skew(self) -> float:
+        return skew_from_moments(self.count, self.m2, self.m3)
+
+class ColumnStats:
+    """
+    Mergeable statistics of one column: null tally, a HyperLogLog distinct
+    counter, moments and a KLL quantile sketch for numeric data, and the
+    value range for datetimes.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.dtype = None
+        self.kind = None  # "numeric", "datetime" or "other"
+        self.seen_values = False
+        self.nulls = NullTally()
+        self.moments = RunningMoments()
+        self.sketch = KLLSketch()
+        self.distinct = HyperLogLog()
+        self.datetime_min = None
+        self.datetime_max = None
+
+    @staticmethod
+    def _kind_of(series: pd.Series) -> str:
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            return "numeric"
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return "datetime"
+        return "other"
+
+    def _combine_kind(self, kind: str, dtype: str, has_values: bool):
+        if self.kind is None or (has_values and not self.seen_values):
+            self.kind, self.dtype = kind, dtype
+        elif has_values and kind != self.kind:
+            # Chunks disagree (e.g. a later CSV chunk holds text): treat as a generic column
+            self.kind, self.dtype = "other", "object"
+        self.seen_values = self.seen_values or has_values
+
+    def update(self, series: pd.Series):
+        kind = self._kind_of(series)
+        has_values = bool(series.notna().any())
+        self._combine_kind(kind, str(series.dtype), has_values)
+        self.nulls.update(series)
+        self.distinct.update(series)
+        if kind == "numeric":
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            self.moments.update(values)
+            self.sketch.update(values)
+        elif kind == "datetime" and has_values:
+            self._update_range(series.min(), series.max())
+        return self
+
+    def _update_range(self, low, high):
+        self.datetime_min = low if self.datetime_min is None else min(self.datetime_min, low)
+        self.datetime_max = high if self.datetime_max is None else max(self.datetime_max, high)
+
+    def merge(self, other: "ColumnStats"):
+        if other.kind is not None:
+            self._combine_kind(other.kind, other.dtype, other.seen_values)
+        self.nulls.merge(other.nulls)
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        self.distinct.merge(other.distinct)
+        if other.datetime_min is not None:
+            self._update_range(other.datetime_min, other.datetime_max)
+        return self
+
+    def to_profile(self) -> ColumnProfile:
+        """
+        Converts to a ColumnProfile. Quantiles (KLL) and the distinct count
+        (HyperLogLog) are approximate; top values are not tracked.
+        """
+        n_rows = self.nulls.n_rows
+        count = n_rows - self.nulls.null_count
+        profile = ColumnProfile(
+            name=self.name,
+            dtype=self.dtype or "object",
+            n_rows=n_rows,
+            count=count,
+            null_count=self.nulls.null_count,
+            distinct=self.distinct.estimate(),
+            is_numeric=self.kind == "numeric",
+            is_datetime=self.kind == "datetime",
+            quantiles={q: np.nan for q in PROFILE_QUANTILES},
+            approximate=True
+        )
+        if profile.is_numeric and self.moments.count:
+            profile.mean = self.moments.mean
+            profile.variance = self.moments.variance
+            profile.skew = self.moments.skew
+            profile.min = self.moments.min
+            profile.max = self.moments.max
+            profile.quantiles = dict(zip(PROFILE_QUANTILES, self.sketch.quantiles(PROFILE_QUANTILES)))
+        elif profile.is_datetime:
+            profile.min = self.datetime_min
+            profile.max = self.datetime_max
+        return profile
+
+class StreamingStats:
+    """
+    Per-column mergeable statistics for a dataset seen one chunk (or partition) at a time.
+    """
+
+    def __init__(self):
+        self.columns = {}
+
+    def update(self, chunk: pd.DataFrame):
+        for col in chunk.columns:
+            if col not in self.columns:
+                self.columns[col] = ColumnStats(col)
+            self.columns[col].update(chunk[col])
+        return self
+
+    def merge(self, other: "StreamingStats"):
+        for col, stats in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(stats)
+            else:
+                self.columns[col] = stats
+        return self
+
+    def to_profile(self) -> DatasetProfile:
+        columns = {col: stats.to_profile() for col, stats in self.columns.items()}
+        n_rows = max((p.n_rows for p in columns.values()), default=0)
+        return DatasetProfile(n_rows=n_rows, columns=columns)
+
+def profile_chunks(chunks) -> DatasetProfile:
+    """
+    Builds a DatasetProfile from an iterable of DataFrame chunks without holding more than one in memory.
+    """
+    stats = StreamingStats()
+    for chunk in chunks:
+        stats.update(chunk)
+    return stats.to_profile()
@@ -1,9 +1,52 @@
 # eda/summary_stats.py
 
 import pandas as pd
+from eda.profiler import get_profile
 
-def generate_summary(df: pd.DataFrame) -> pd.DataFrame:
-    numeric_summary = df.describe().T
-    numeric_summary["missing (%)"] = df.isnull().mean() * 100
-    numeric_summary["dtype"] = df.dtypes
+def generate_summary(df: pd.DataFrame, profile=None) -> pd.DataFrame:
+    """
+    Describes numeric columns plus missing % and dtype. Pass a prebuilt `profile`
+    (e.g. from eda.streaming_stats.profile_chunks) to summarize data that is not in df.
+    """
+    profile = profile or get_profile(df)
+    numeric_cols = profile.numeric_columns()
+    datetime_cols = [col for col, p in profile.columns.items() if p.is_datetime]
+
+    rows = {}
+    if numeric_cols or datetime_cols:
+        # Like DataFrame.describe(): numbers and datetimes, in frame order
+        # The profile keeps only the count and range of datetimes; describe() adds their mean and
+        # quartiles (taken from df, i.e. the in-memory sample when a streamed profile is passed)
+        described = [col for col in datetime_cols if col in df.columns and pd.api.types.is_datetime64_any_dtype(df[col])]
+        datetime_summary = df[described].describe().T if described else pd.DataFrame()
+        for col, p in profile.columns.items():
+            if p.is_numeric:
+                rows[col] = {
+                    "count": float(p.count), "mean": p.mean, "std": p.std, "min": p.min,
+                    "25%": p.quantiles[0.25], "50%": p.quantiles[0.5], "75%": p.quantiles[0.75], "max": p.max
+                }
+            elif p.is_datetime:
+                described_row = datetime_summary.loc[col].to_dict() if col in datetime_summary.index else {}
+                rows[col] = {**described_row, "count": float(p.count), "min": p.min, "max": p.max}
+        # describe() moves std after max once datetimes are present and drops it without numbers
+        order = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+        if datetime_cols:
+            order = ["count", "mean", "min", "25%", "50%", "75%", "max"] + (["std"] if numeric_cols else [])
+    else:
+        # Same fallback as DataFrame.describe() when there are no numeric or datetime columns
+        for col, p in profile.columns.items():
+            top = p.top_values
+            rows[col] = {
+                "count": p.count, "unique": p.distinct,
+                "top": top.index[0] if top is not None and len(top) else None,
+                "freq": int(top.iloc[0]) if top is not None and len(top) else None
+            }
+        order = ["count", "unique", "top", "freq"]
+
+    numeric_summary = pd.DataFrame.from_dict(rows, orient="index", columns=order)
+    if datetime_cols or not numeric_cols:
+        # describe() returns stats mixed with Timestamps or labels as object columns, which round() leaves as is
+        numeric_summary[order] = numeric_summary[order].astype(object)
+    numeric_summary["missing (%)"] = [profile[col].null_fraction * 100 for col in numeric_summary.index]
+    numeric_summary["dtype"] = [profile[col].dtype for col in numeric_summary.index]
     return numeric_summary.round(2)
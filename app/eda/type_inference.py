@@ -1,4 +1,8 @@
 import pandas as pd
+from eda.profiler import get_profile
+
+# dtypes treated as categorical/text by the EDA, preprocessing and export modules
+CATEGORICAL_DTYPES = ["object", "category", "string"]
 
 def detect_column_types(df: pd.DataFrame):
     numerical_cols = []
@@ -6,12 +10,13 @@ def detect_column_types(df: pd.DataFrame):
     datetime_cols = []
     other_cols = []
 
+    profile = get_profile(df)
     for col in df.columns:
         if pd.api.types.is_numeric_dtype(df[col]):
             numerical_cols.append(col)
         elif pd.api.types.is_datetime64_any_dtype(df[col]):
             datetime_cols.append(col)
-        elif pd.api.types.is_categorical_dtype(df[col]) or df[col].nunique() < 20:
+        elif isinstance(df[col].dtype, pd.CategoricalDtype) or profile[col].distinct < 20:
             categorical_cols.append(col)
         else:
             other_cols.append(col)
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 from io import BytesIO
 
@@ -6,3 +7,28 @@ def convert_df_to_csv(df: pd.DataFrame) -> BytesIO:
     df.to_csv(output, index=False)
     output.seek(0)
     return output
+
+def _spilled_csv_path(spilled) -> str:
+    return os.path.join(spilled.directory, "export.csv")
+
+def spilled_csv_path(spilled):
+    """
+    Path of the CSV already written by convert_spilled_to_csv for this SpilledFrame, or None.
+    """
+    path = _spilled_csv_path(spilled)
+    return path if os.path.exists(path) else None
+
+def convert_spilled_to_csv(spilled) -> str:
+    """
+    Writes a SpilledFrame as one CSV file inside its spill directory and returns the path.
+    The file is written once per SpilledFrame and removed with it.
+    """
+    path = _spilled_csv_path(spilled)
+    if not os.path.exists(path):
+        # Write under a temporary name so an interrupted export is never reused
+        partial = path + ".partial"
+        with open(partial, "w", newline="", encoding="utf-8") as output:
+            for i, chunk in enumerate(spilled.iter_chunks()):
+                chunk.to_csv(output, index=False, header=i == 0)
+        os.replace(partial, path)
+    return path
@@ -1,6 +1,7 @@
 import os
 import plotly.io as pio
 from datetime import datetime
+from eda.profiler import get_profile
 
 def export_html_report(df, summary_stats, missing_report, insights, plots, export_dir="exports/reports"):
     """
@@ -20,9 +21,10 @@ def export_html_report(df, summary_stats, missing_report, insights, plots, expor
     html_sections.append(f"<p><strong>Rows:</strong> {df.shape[0]}<br>")
     html_sections.append(f"<strong>Columns:</strong> {df.shape[1]}</p>")
 
+    profile = get_profile(df)
     html_sections.append("<table border='1' cellspacing='0' cellpadding='5'><tr><th>Column</th><th>Data Type</th><th>Missing (%)</th></tr>")
     for col in df.columns:
-        null_pct = df[col].isnull().mean() * 100
+        null_pct = profile[col].null_fraction * 100
         html_sections.append(f"<tr><td>{col}</td><td>{df[col].dtype}</td><td>{null_pct:.2f}%</td></tr>")
     html_sections.append("</table>")
 
@@ -7,6 +7,8 @@ from reportlab.lib import colors
 import os
 import tempfile
 import matplotlib.pyplot as plt
+from eda.type_inference import CATEGORICAL_DTYPES
+from eda.profiler import get_profile
 
 try:
     import plotly.io as pio
@@ -33,13 +35,14 @@ def export_pdf_report(df, summary_stats, missing_report, insights, plots_dict):
     story.append(Spacer(1, 12))
 
     # === Dataset Metadata ===
+    profile = get_profile(df)
     meta_info = f"""
     <b>Dataset Overview</b><br/>
     Rows: {df.shape[0]}<br/>
     Columns: {df.shape[1]}<br/>
     Numeric Columns: {df.select_dtypes(include='number').shape[1]}<br/>
-    Categorical Columns: {df.select_dtypes(include='object').shape[1]}<br/>
-    Null Values Present: {'Yes' if df.isnull().sum().sum() > 0 else 'No'}
+    Categorical Columns: {df.select_dtypes(include=CATEGORICAL_DTYPES).shape[1]}<br/>
+    Null Values Present: {'Yes' if any(p.null_count for p in profile.columns.values()) else 'No'}
     """
     story.append(Paragraph(meta_info, styles['Normal']))
     story.append(Spacer(1, 12))
@@ -0,0 +1,94 @@
+# insights/anomaly_detector.py
+
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import IsolationForest
+from eda.parallel import DEFAULT_WORKERS
+from eda.profiler import get_profile
+
+TRAIN_ROWS = 100_000
+SCORE_BATCH_ROWS = 100_000
+TOP_ANOMALIES = 10
+# Seconds of scoring before the remaining rows are skipped in the Smart Insights panel
+SCORE_TIME_BUDGET = 30.0
+# IsolationForest anomaly scores lie in (0, 1); about 0.5 is ordinary, close to 1 is isolated quickly
+SCORE_THRESHOLD = 0.6
+
+def _feature_block(df: pd.DataFrame, columns, medians: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """
+    Numeric features of rows [start, stop) as float64, missing values set to the column median.
+    """
+    # Rows first: selecting columns first would copy every row on each batch
+    block = df.iloc[start:stop][columns].to_numpy(dtype="float64", na_value=np.nan)
+    missing = np.isnan(block)
+    if missing.any():
+        block[missing] = np.take(medians, np.nonzero(missing)[1])
+    return block
+
+def detect_anomalies(df: pd.DataFrame, train_rows: int = TRAIN_ROWS, batch_rows: int = SCORE_BATCH_ROWS,
+                     n_estimators: int = 100, n_jobs: int = None, time_budget: float = None,
+                     score_threshold: float = SCORE_THRESHOLD, top_n: int = TOP_ANOMALIES, random_state: int = 0,
+                     profile=None):
+    """
+    Row-level multivariate anomalies with IsolationForest over the numeric columns
+    (preprocess_data output). The forest is trained on a fixed random subsample of at
+    most train_rows rows, with trees built in parallel (n_jobs, default AUTOEDA_WORKERS);
+    every row is then scored in batches of batch_rows, and rows whose anomaly score
+    exceeds score_threshold are flagged. With time_budget (seconds),
+    scoring stops after the batch that exceeds it and only the rows scored so far count.
+    Returns None when fewer than two numeric columns exist.
+    """
+    profile = profile or get_profile(df)
+    columns = profile.numeric_columns()
+    if len(columns) < 2 or len(df) < 2:
+        return None
+    medians = np.array([profile[col].quantiles[0.5] for col in columns], dtype="float64")
+    medians = np.nan_to_num(medians, nan=0.0)
+
+    started = time.monotonic()
+    rng = np.random.default_rng(random_state)
+    train_positions = np.sort(rng.choice(len(df), size=min(train_rows, len(df)), replace=False))
+    train = df.iloc[train_positions][columns].to_numpy(dtype="float64", na_value=np.nan)
+    train = np.where(np.isnan(train), medians, train)
+    model = IsolationForest(
+        n_estimators=n_estimators,
+        n_jobs=DEFAULT_WORKERS if n_jobs is None else n_jobs,
+        random_state=random_state
+    ).fit(train)
+
+    scores = np.full(len(df), np.nan)
+    scored_rows = 0
+    for start in range(0, len(df), batch_rows):
+        stop = min(start + batch_rows, len(df))
+        scores[start:stop] = -model.score_samples(_feature_block(df, columns, medians, start, stop))
+        scored_rows = stop
+        if time_budget is not None and time.monotonic() - started > time_budget:
+            break
+
+    scored = scores[:scored_rows]
+    anomalies = int(np.count_nonzero(scored > score_threshold))
+    top = np.argsort(-scored, kind="stable")[:min(top_n, anomalies)]
+    return {
+        "columns": columns,
+        "n_rows": len(df),
+        "scored_rows": scored_rows,
+        "anomaly_rows": anomalies,
+        "anomaly_percent": round(anomalies / scored_rows * 100, 2) if scored_rows else 0.0,
+        "top": pd.DataFrame({"Row": df.index[top], "Anomaly Score": scored[top]})
+    }
+
+def generate_anomaly_insights(anomalies: dict):
+    """
+    Produces a human-readable warning when rows look anomalous across several columns at once.
+    """
+    if not anomalies or not anomalies["anomaly_rows"]:
+        return []
+    partial = ""
+    if anomalies["scored_rows"] < anomalies["n_rows"]:
+        partial = f" (first {anomalies['scored_rows']} rows scored)"
+    return [
+        f"🛰️ {anomalies['anomaly_rows']} rows ({anomalies['anomaly_percent']}%) look like multivariate "
+        f"anomalies across {len(anomalies['columns'])} numeric columns (IsolationForest){partial}."
+    ]
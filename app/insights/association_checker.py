@@ -0,0 +1,148 @@
+# insights/association_checker.py
+
+import numpy as np
+import pandas as pd
+from eda.profiler import get_profile
+from eda.type_inference import CATEGORICAL_DTYPES
+
+MAX_LEVELS = 30
+SAMPLE_ROWS = 20_000
+BLOCK_CELLS = 1 << 24
+
+def categorical_codes(df: pd.DataFrame, max_levels: int = MAX_LEVELS):
+    """
+    Integer codes for every column that behaves like a low-cardinality categorical:
+    text/category/boolean columns, plus integer columns with at most max_levels values
+    (preprocess_data turns low-cardinality categoricals into such integer codes).
+    Missing values get a level of their own. Returns {column: (codes, n_levels)}.
+    """
+    profile = get_profile(df)
+    codes = {}
+    for col in df.columns:
+        col_profile = profile[col]
+        dtype = df[col].dtype
+        is_text = dtype.name in CATEGORICAL_DTYPES or pd.api.types.is_string_dtype(dtype)
+        is_flag = pd.api.types.is_bool_dtype(dtype) or (pd.api.types.is_integer_dtype(dtype) and not is_text)
+        if not (is_text or is_flag):
+            continue
+        levels = col_profile.distinct_with_null
+        if levels is None or levels < 2 or levels > max_levels:
+            continue
+        col_codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+        codes[col] = (col_codes.astype(np.int64), len(uniques))
+    return codes
+
+def _cramers_v(tables: np.ndarray) -> np.ndarray:
+    """
+    Cramér's V for a stack of contingency tables with shape (pairs, rows, cols).
+    """
+    rows = tables.sum(axis=2)
+    cols = tables.sum(axis=1)
+    expected = rows[:, :, None] * cols[:, None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # chi² / n = sum(O² / (row * col)) - 1, over cells with non-zero margins
+        phi2 = np.where(expected > 0, tables ** 2 / expected, 0.0).sum(axis=(1, 2)) - 1
+        dof = np.minimum((rows > 0).sum(axis=1), (cols > 0).sum(axis=1)) - 1
+        v = np.sqrt(np.clip(phi2, 0, None) / dof)
+    return np.where(dof > 0, np.minimum(v, 1.0), np.nan)
+
+def cramers_v_pairs(codes: dict) -> pd.DataFrame:
+    """
+    Cramér's V for every pair of categorical columns. For each column, the contingency
+    tables against all later columns come from a single np.bincount over combined codes.
+    """
+    columns = list(codes)
+    records = []
+    if len(columns) < 2:
+        return pd.DataFrame(columns=["Column A", "Column B", "Cramér's V"])
+    width = max(n_levels for _, n_levels in codes.values())
+    cells = width * width
+    matrix = np.column_stack([codes[col][0] for col in columns])
+    # Each partner column's codes pre-shifted into its own block of width * width cells
+    shifted = matrix + np.arange(len(columns), dtype=np.int64) * cells
+    n = matrix.shape[0]
+
+    # Partner columns are taken in blocks so the combined-code buffer stays around BLOCK_CELLS entries
+    block = max(BLOCK_CELLS // max(n, 1), 1)
+    for i, col in enumerate(columns[:-1]):
+        row_codes = matrix[:, i:i + 1] * width
+        for start in range(i + 1, len(columns), block):
+            stop = min(start + block, len(columns))
+            # Cell index = partner offset + row level * width + partner level
+            combined = row_codes + shifted[:, start:stop]
+            tables = np.bincount(combined.ravel(), minlength=stop * cells)[start * cells:]
+            v = _cramers_v(tables.reshape(stop - start, width, width).astype("float64"))
+            records.extend(zip([col] * (stop - start), columns[start:stop], v))
+    return pd.DataFrame(records, columns=["Column A", "Column B", "Cramér's V"])
+
+def correlation_ratio_pairs(df: pd.DataFrame, codes: dict) -> pd.DataFrame:
+    """
+    Correlation ratio η² (share of a numeric column's variance explained by a categorical
+    column's groups) for every categorical x numeric pair. Group sums for all numeric
+    columns come from one weighted np.bincount per categorical column.
+    """
+    profile = get_profile(df)
+    numeric_cols = [col for col in profile.numeric_columns() if col not in codes]
+    if not codes or not numeric_cols:
+        return pd.DataFrame(columns=["Categorical", "Numeric", "Eta²"])
+
+    values = df[numeric_cols].to_numpy(dtype="float64", na_value=np.nan)
+    valid = ~np.isnan(values)
+    with np.errstate(invalid="ignore"):
+        # Centering keeps the sums of squares well conditioned
+        values = np.where(valid, values - np.nanmean(values, axis=0), 0.0)
+    weights = valid.astype("float64")
+    counts = weights.sum(axis=0)
+    totals = values.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ss_total = (values ** 2).sum(axis=0) - totals ** 2 / counts
+
+    n_numeric = len(numeric_cols)
+    records = []
+    for col, (col_codes, n_levels) in codes.items():
+        index = (col_codes[:, None] + np.arange(n_numeric) * n_levels).ravel()
+        size = n_numeric * n_levels
+        group_sums = np.bincount(index, weights=values.ravel(), minlength=size).reshape(n_numeric, n_levels)
+        group_counts = np.bincount(index, weights=weights.ravel(), minlength=size).reshape(n_numeric, n_levels)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            between = np.where(group_counts > 0, group_sums ** 2 / group_counts, 0.0).sum(axis=1) - totals ** 2 / counts
+            eta2 = np.where(ss_total > 0, between / ss_total, np.nan)
+        records.extend(zip([col] * n_numeric, numeric_cols, np.clip(eta2, 0.0, 1.0)))
+    return pd.DataFrame(records, columns=["Categorical", "Numeric", "Eta²"])
+
+def detect_associations(df: pd.DataFrame, v_threshold: float = 0.5, eta_threshold: float = 0.5,
+                        max_levels: int = MAX_LEVELS, sample_rows: int = SAMPLE_ROWS):
+    """
+    Flags strongly associated categorical pairs (Cramér's V > v_threshold) and
+    categorical/numeric pairs (η² > eta_threshold). Tall frames are evaluated on a
+    fixed random sample of sample_rows rows. Returns a dict of two DataFrames.
+    """
+    if sample_rows and len(df) > sample_rows:
+        df = df.sample(n=sample_rows, random_state=0)
+    codes = categorical_codes(df, max_levels)
+
+    cramers = cramers_v_pairs(codes)
+    cramers = cramers[cramers["Cramér's V"] > v_threshold]
+    eta = correlation_ratio_pairs(df, codes)
+    eta = eta[eta["Eta²"] > eta_threshold]
+    return {
+        "categorical": cramers.sort_values(by="Cramér's V", ascending=False).reset_index(drop=True),
+        "numeric": eta.sort_values(by="Eta²", ascending=False).reset_index(drop=True)
+    }
+
+def generate_association_insights(associations: dict):
+    """
+    Produces human-readable warnings for strongly associated column pairs.
+    """
+    insights = []
+    for a, b, v in associations["categorical"].itertuples(index=False):
+        insights.append(
+            f"🧩 Columns `{a}` and `{b}` are strongly associated "
+            f"(Cramér's V={v:.2f}); one may be redundant."
+        )
+    for categorical, numeric, eta2 in associations["numeric"].itertuples(index=False):
+        insights.append(
+            f"📊 `{numeric}` differs strongly across groups of `{categorical}` "
+            f"(η²={eta2:.2f})."
+        )
+    return insights
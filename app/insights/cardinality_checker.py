@@ -1,27 +1,42 @@
 # insights/cardinality_checker.py
 
 import pandas as pd
+from eda.profiler import get_profile
+from eda.sketches import DEFAULT_HLL_PRECISION, approximate_distinct
 
-def compute_cardinality(df: pd.DataFrame):
+def compute_cardinality(df: pd.DataFrame, approximate: bool = None, precision: int = DEFAULT_HLL_PRECISION,
+                        profile=None):
     """
     Returns DataFrame with unique count and uniqueness ratio for each column.
+    approximate=None counts exactly up to EXACT_DISTINCT_MAX_ROWS rows and uses
+    HyperLogLog above that (relative error about 1.04 / sqrt(2**precision), 0.8% by default);
+    True/False force one mode for every column.
     """
+    profile = profile or get_profile(df)
     total = len(df)
     cardinality = []
     for col in df.columns:
-        unique = df[col].nunique(dropna=False)
+        col_profile = profile[col]
+        null_bucket = 1 if col_profile.null_count else 0
+        if approximate:
+            unique = approximate_distinct(df[col], precision) + null_bucket
+        elif approximate is False and col_profile.approximate:
+            unique = df[col].nunique(dropna=False)
+        else:
+            unique = col_profile.distinct_with_null
         ratio = unique / total if total > 0 else 0
         cardinality.append({
             "Column": col,
             "Unique Count": unique,
-            "Uniqueness %": round(ratio * 100, 2)
+            "Uniqueness %": round(min(ratio, 1.0) * 100, 2)
         })
     return pd.DataFrame(cardinality).sort_values(by="Uniqueness %", ascending=False)
 
-def flag_high_cardinality(df: pd.DataFrame, threshold: float = 0.95):
+def flag_high_cardinality(df: pd.DataFrame, threshold: float = 0.95, approximate: bool = None):
     """
     Flags columns where uniqueness (unique/total) exceeds threshold.
+    Columns above EXACT_DISTINCT_MAX_ROWS rows are checked with HyperLogLog estimates.
     """
-    card_df = compute_cardinality(df)
+    card_df = compute_cardinality(df, approximate=approximate)
     flagged = card_df[card_df["Uniqueness %"] > (threshold * 100)]
     return flagged.reset_index(drop=True)
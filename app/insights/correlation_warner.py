@@ -1,26 +1,137 @@
 # insights/correlation_warner.py
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 
-def high_correlation_pairs(df: pd.DataFrame, threshold: float = 0.85):
+TILE_SIZE = 512
+CORRELATION_METHODS = ("pearson", "spearman")
+MISSING_MODES = ("pairwise", "listwise")
+
+def _standardize(values: np.ndarray) -> np.ndarray:
+    """
+    Centers each column and scales it to unit norm, so Z.T @ Z is the Pearson matrix.
+    Constant columns become all-NaN (undefined correlation, as in pandas).
+    """
+    centered = values - values.mean(axis=0)
+    norms = np.sqrt(np.einsum("ij,ij->j", centered, centered))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return centered / np.where(norms > 0, norms, np.nan)
+
+def _complete_tiles(values: np.ndarray):
+    """
+    Tile function for data without missing values: standardize once, then one matmul per tile.
+    """
+    # NaN (constant) columns would poison whole tiles; zero them so they never pass the threshold
+    z = np.nan_to_num(_standardize(values), nan=0.0)
+    return lambda i0, i1, j0, j1: z[:, i0:i1].T @ z[:, j0:j1]
+
+def _pairwise_tiles(values: np.ndarray):
+    """
+    Tile function for pairwise-complete correlation: every pair uses the rows where
+    both columns are present (pandas' corr() semantics). Per-pair counts, sums and
+    sums of squares come from matrix products with the validity mask.
+    """
+    mask = ~np.isnan(values)
+    with np.errstate(invalid="ignore"):
+        # Centering by the column mean first keeps the one-pass sums well conditioned
+        centered = np.where(mask, values - np.nanmean(values, axis=0), 0.0)
+    squared = centered ** 2
+    weights = mask.astype("float64")
+
+    def tile(i0, i1, j0, j1):
+        x_i, x_j = centered[:, i0:i1], centered[:, j0:j1]
+        m_i, m_j = weights[:, i0:i1], weights[:, j0:j1]
+        n = m_i.T @ m_j
+        sum_i = x_i.T @ m_j
+        sum_j = m_i.T @ x_j
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = x_i.T @ x_j - sum_i * sum_j / n
+            var_i = squared[:, i0:i1].T @ m_j - sum_i ** 2 / n
+            var_j = m_i.T @ squared[:, j0:j1] - sum_j ** 2 / n
+            corr = cov / np.sqrt(var_i * var_j)
+        corr[(n < 2) | (var_i <= 0) | (var_j <= 0)] = np.nan
+        return corr
+    return tile
+
+def _tile_pairs(tile_corr, i0: int, i1: int, j0: int, j1: int, threshold: float):
+    """
+    Correlations of column tile [i0, i1) against [j0, j1) above threshold, upper triangle only.
+    """
+    block = np.abs(tile_corr(i0, i1, j0, j1))
+    keep = block > threshold
+    if i0 == j0:
+        keep &= np.triu(np.ones(block.shape, dtype=bool), k=1)
+    rows, cols = np.nonzero(keep)
+    return rows + i0, cols + j0, np.minimum(block[rows, cols], 1.0)
+
+def correlated_pairs(tile_corr, n_cols: int, threshold: float, tile_size: int = TILE_SIZE, n_jobs: int = 1):
+    """
+    Scans the correlation matrix tile by tile (BLAS matmuls per tile) and returns
+    (row index, column index, |r|) arrays for pairs above threshold.
+    tile_corr(i0, i1, j0, j1) returns the correlation block of two column ranges.
+    Peak extra memory is a few tile_size x tile_size blocks per worker.
+    """
+    tiles = [
+        (i0, min(i0 + tile_size, n_cols), j0, min(j0 + tile_size, n_cols))
+        for i0 in range(0, n_cols, tile_size)
+        for j0 in range(i0, n_cols, tile_size)
+    ]
+    if n_jobs == 1 or len(tiles) == 1:
+        results = [_tile_pairs(tile_corr, *tile, threshold) for tile in tiles]
+    else:
+        # NumPy releases the GIL inside matmul, so threads run tiles concurrently
+        with ThreadPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None) as pool:
+            results = list(pool.map(lambda tile: _tile_pairs(tile_corr, *tile, threshold), tiles))
+
+    if not results:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype="float64")
+    rows = np.concatenate([r[0] for r in results])
+    cols = np.concatenate([r[1] for r in results])
+    values = np.concatenate([r[2] for r in results])
+    return rows, cols, values
+
+def high_correlation_pairs(df: pd.DataFrame, threshold: float = 0.85, method: str = "pearson",
+                           missing: str = "pairwise", tile_size: int = TILE_SIZE, n_jobs: int = 1):
     """
     Finds pairs of numeric columns with absolute correlation above threshold.
     Returns a DataFrame of pairs and their correlation.
+    Only pairs above threshold are materialized; the full matrix never is.
+
+    method: "pearson", or "spearman" (Pearson on ranks, catches monotonic non-linear relations).
+    missing: "pairwise" uses every row where both columns are present, like pandas' corr();
+    "listwise" drops rows with any missing value first.
+    With missing values, Spearman ranks each column once over its own values rather than
+    re-ranking per pair, so it can differ slightly from pandas there.
     """
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Unsupported correlation method: {method}")
+    if missing not in MISSING_MODES:
+        raise ValueError(f"Unsupported missing-value mode: {missing}")
+
     numeric = df.select_dtypes(include='number')
-    corr_matrix = numeric.corr().abs()
-
-    # Mask self-correlations and duplicate pairs using NumPy
-    upper_mask = np.triu(np.ones(corr_matrix.shape), k=1).astype(bool)
-    upper = corr_matrix.where(upper_mask)
-
-    high_corr = (
-        upper.stack()
-        .reset_index()
-        .rename(columns={'level_0': 'Column A', 'level_1': 'Column B', 0: 'Correlation'})
-    )
-    high_corr = high_corr[high_corr['Correlation'] > threshold].sort_values(by='Correlation', ascending=False)
+    if missing == "listwise":
+        numeric = numeric.dropna()
+    if method == "spearman":
+        # One vectorized rank transform for all columns; NaN stays NaN
+        numeric = numeric.rank(method="average")
+    columns = numeric.columns
+    values = numeric.to_numpy(dtype="float64", na_value=np.nan)
+
+    if np.isnan(values).any():
+        tile_corr = _pairwise_tiles(values)
+    else:
+        tile_corr = _complete_tiles(values)
+    rows, cols, corr = correlated_pairs(tile_corr, len(columns), threshold, tile_size, n_jobs)
+
+    high_corr = pd.DataFrame({
+        "Column A": columns[rows],
+        "Column B": columns[cols],
+        "Correlation": corr
+    })
+    high_corr = high_corr.sort_values(by='Correlation', ascending=False)
     return high_corr.reset_index(drop=True)
 
 def generate_correlation_insights(high_corr_df: pd.DataFrame):
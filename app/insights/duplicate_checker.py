@@ -0,0 +1,205 @@
+# insights/duplicate_checker.py
+
+import numpy as np
+import pandas as pd
+
+BLOCK_ROWS = 65_536
+MAX_EXAMPLE_GROUPS = 5
+
+NUM_PERM = 64
+LSH_BANDS = 16
+NEAR_DUPLICATE_SAMPLE_ROWS = 20_000
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MAX_BUCKET_SIZE = 50
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    64-bit fingerprint of every row (values only, index ignored), computed in row
+    blocks with pandas' vectorized hashing so memory stays bounded on tall frames.
+    """
+    hashes = np.empty(len(df), dtype=np.uint64)
+    for start in range(0, len(df), BLOCK_ROWS):
+        block = df.iloc[start:start + BLOCK_ROWS]
+        hashes[start:start + len(block)] = pd.util.hash_pandas_object(block, index=False).to_numpy()
+    return hashes
+
+def _groups_of_equal(keys: np.ndarray):
+    """
+    Positions grouped by equal key, for keys that occur more than once, largest groups first.
+    """
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    sizes = np.diff(np.append(starts, keys.size))
+    repeated = np.flatnonzero(sizes > 1)
+    repeated = repeated[np.argsort(-sizes[repeated], kind="stable")]
+    return [order[starts[g]:starts[g] + sizes[g]] for g in repeated]
+
+def find_exact_duplicates(df: pd.DataFrame, max_groups: int = MAX_EXAMPLE_GROUPS):
+    """
+    Exact duplicate rows via row fingerprints. "duplicate_rows" counts the extra copies
+    (same as df.duplicated().sum()); "groups" lists index labels of the largest groups.
+    """
+    if df.empty:
+        return {"duplicate_rows": 0, "duplicate_groups": 0, "groups": []}
+    hashes = row_hashes(df)
+    groups = _groups_of_equal(hashes)
+    duplicate_rows = int(sum(len(g) - 1 for g in groups))
+    return {
+        "duplicate_rows": duplicate_rows,
+        "duplicate_groups": len(groups),
+        "groups": [df.index[g].tolist() for g in groups[:max_groups]]
+    }
+
+def _row_tokens(df: pd.DataFrame):
+    """
+    (row position, token hash) pairs for a frame with a RangeIndex: one token per field (column + value) plus one per
+    lower-cased word of every text field, so rows with small text edits still share most tokens.
+    """
+    rows, tokens = [], []
+    positions = np.arange(len(df))
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        field = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        rows.append(positions)
+        # Salt by column so equal values in different columns are different tokens
+        tokens.append(field ^ np.uint64((0x9E3779B97F4A7C15 * (i + 1)) % (1 << 64)))
+        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            words = series.astype("string").str.lower().str.findall(r"\w+").explode().dropna()
+            if not words.empty:
+                rows.append(words.index.to_numpy())
+                tokens.append(pd.util.hash_pandas_object(words.astype(str), index=False).to_numpy())
+    return np.concatenate(rows), np.concatenate(tokens)
+
+def _token_sets(df: pd.DataFrame):
+    """
+    Token hashes grouped by row: returns (tokens, starts, ends), where row i owns the
+    sorted, de-duplicated slice tokens[starts[i]:ends[i]].
+    """
+    rows, tokens = _row_tokens(df.reset_index(drop=True))
+    order = np.lexsort((tokens, rows))
+    rows, tokens = rows[order], tokens[order]
+    keep = np.concatenate(([True], (rows[1:] != rows[:-1]) | (tokens[1:] != tokens[:-1])))
+    rows, tokens = rows[keep], tokens[keep]
+    starts = np.searchsorted(rows, np.arange(len(df)), side="left")
+    ends = np.searchsorted(rows, np.arange(len(df)), side="right")
+    return tokens, starts, ends
+
+def minhash_signatures(df: pd.DataFrame, num_perm: int = NUM_PERM, seed: int = 0) -> np.ndarray:
+    """
+    MinHash signature (num_perm values) of every row's token set.
+    Two rows agree on a signature position with probability equal to their Jaccard similarity.
+    """
+    tokens, starts, _ = _token_sets(df)
+    return _signatures(tokens, starts, len(df), num_perm, seed)
+
+def _signatures(tokens: np.ndarray, starts: np.ndarray, n_rows: int, num_perm: int, seed: int = 0) -> np.ndarray:
+    # Every row has at least one field token, so no row slice is empty
+    rng = np.random.default_rng(seed)
+    # x -> a*x + b (mod 2**64) with odd a is a permutation of the 64-bit hashes
+    a = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+    b = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64, endpoint=True)
+    signatures = np.empty((n_rows, num_perm), dtype=np.uint64)
+    for k in range(num_perm):
+        signatures[:, k] = np.minimum.reduceat(a[k] * tokens + b[k], starts)
+    return signatures
+
+def _union_find_groups(n: int, pairs):
+    parent = np.arange(n)
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[root_j] = root_i
+    roots = np.array([find(x) for x in range(n)])
+    return _groups_of_equal(roots)
+
+def find_near_duplicates(df: pd.DataFrame, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+                         sample_rows: int = NEAR_DUPLICATE_SAMPLE_ROWS, num_perm: int = NUM_PERM,
+                         bands: int = LSH_BANDS, max_groups: int = MAX_EXAMPLE_GROUPS):
+    """
+    Near-duplicate rows (Jaccard similarity of field/word tokens >= threshold) with
+    MinHash + LSH banding: only rows sharing a band bucket become candidates, and only
+    candidates whose signatures roughly agree get an exact Jaccard check. Tall frames
+    are checked on a fixed random sample, so the cost stays sub-quadratic.
+    Exact duplicates are left to find_exact_duplicates.
+    """
+    sampled = len(df) > sample_rows
+    frame = df.sample(n=sample_rows, random_state=0) if sampled else df
+    result = {"near_duplicate_rows": 0, "near_duplicate_pairs": 0, "groups": [],
+              "sampled_rows": len(frame), "sampled": sampled}
+    if len(frame) < 2 or frame.shape[1] == 0:
+        return result
+
+    tokens, starts, ends = _token_sets(frame)
+    signatures = _signatures(tokens, starts, len(frame), num_perm)
+    exact = row_hashes(frame)
+    rows_per_band = num_perm // bands
+    candidates = set()
+    for band in range(bands):
+        # Rows land in the same bucket when all signature values of the band agree
+        band_keys = np.zeros(len(frame), dtype=np.uint64)
+        for k in range(band * rows_per_band, (band + 1) * rows_per_band):
+            band_keys = band_keys * np.uint64(0x100000001B3) + signatures[:, k]
+        for bucket in _groups_of_equal(band_keys):
+            # Oversized buckets are rows with near-identical content across the sample; skip them
+            if len(bucket) > MAX_BUCKET_SIZE:
+                continue
+            for x in range(len(bucket)):
+                for y in range(x + 1, len(bucket)):
+                    candidates.add((int(bucket[x]), int(bucket[y])))
+
+    pairs = []
+    # Loose signature filter first (estimates are noisy), then the exact token-set Jaccard
+    loose = threshold - 0.2
+    for i, j in candidates:
+        if exact[i] == exact[j] or np.mean(signatures[i] == signatures[j]) < loose:
+            continue
+        set_i, set_j = tokens[starts[i]:ends[i]], tokens[starts[j]:ends[j]]
+        shared = np.intersect1d(set_i, set_j, assume_unique=True).size
+        if shared / (set_i.size + set_j.size - shared) >= threshold:
+            pairs.append((i, j))
+
+    groups = _union_find_groups(len(frame), pairs) if pairs else []
+    result.update({
+        "near_duplicate_rows": int(sum(len(g) for g in groups)),
+        "near_duplicate_pairs": len(pairs),
+        "groups": [frame.index[g].tolist() for g in groups[:max_groups]]
+    })
+    return result
+
+def detect_duplicates(df: pd.DataFrame, near_duplicates: bool = False):
+    """
+    Exact duplicate summary, plus the MinHash near-duplicate summary when near_duplicates is set.
+    """
+    return {
+        "exact": find_exact_duplicates(df),
+        "near": find_near_duplicates(df) if near_duplicates else None
+    }
+
+def generate_duplicate_insights(duplicates: dict, n_rows: int):
+    """
+    Produces human-readable warnings for duplicate and near-duplicate rows.
+    """
+    insights = []
+    exact = duplicates["exact"]
+    if exact["duplicate_rows"]:
+        percent = round(exact["duplicate_rows"] / n_rows * 100, 2) if n_rows else 0
+        insights.append(
+            f"🧬 {exact['duplicate_rows']} rows ({percent}%) are exact duplicates of another row "
+            f"across {exact['duplicate_groups']} groups; consider dropping them."
+        )
+    near = duplicates["near"]
+    if near and near["near_duplicate_rows"]:
+        scope = f" in a {near['sampled_rows']}-row sample" if near["sampled"] else ""
+        insights.append(
+            f"🧬 {near['near_duplicate_rows']} rows{scope} look like near-duplicates "
+            f"({int(NEAR_DUPLICATE_THRESHOLD * 100)}%+ token overlap) of another row."
+        )
+    return insights
@@ -1,36 +1,227 @@
 # insights/insight_panel.py
 
-from insights.outlier_detector import aggregate_outlier_flags
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+from eda.dataset_cache import memoize_on_frame
+from eda.profiler import get_profile
+from insights.null_flagger import flag_nulls
+from insights.outlier_detector import aggregate_outlier_flags, get_outlier_index
 from insights.skewness_checker import detect_skewness, generate_skewness_insights
-from insights.cardinality_checker import flag_high_cardinality
+from insights.cardinality_checker import compute_cardinality
 from insights.correlation_warner import high_correlation_pairs, generate_correlation_insights
+from insights.association_checker import detect_associations, generate_association_insights
+from insights.duplicate_checker import detect_duplicates, generate_duplicate_insights
+from insights.anomaly_detector import SCORE_TIME_BUDGET, detect_anomalies, generate_anomaly_insights
+
+DEFAULT_PARAMS = {
+    "null_threshold": 0.3,
+    "iqr_multiplier": 1.5,
+    "z_thresh": 3.0,
+    "skew_threshold": 1.0,
+    "cardinality_threshold": 0.95,
+    "correlation_threshold": 0.85,
+    "correlation_method": "pearson",
+    "correlation_missing": "pairwise",
+    "near_duplicates": False,
+    "anomaly_time_budget": SCORE_TIME_BUDGET
+}
+
+# Parameter name -> Streamlit widget key that controls it
+SESSION_PARAMS = {
+    "iqr_multiplier": "iqr_multiplier",
+    "z_thresh": "z_thresh",
+    "correlation_method": "corr_method",
+    "correlation_missing": "corr_missing",
+    "near_duplicates": "near_duplicates"
+}
 
-def generate_all_insights(df):
+@dataclass(frozen=True)
+class Statistic:
     """
-    Runs all smart insight checks and returns a dictionary with
-    lists of bullet-point insights grouped by category.
+    A named intermediate result. compute(df, params, stats) may read the statistics
+    listed in requires from stats; params lists the settings it depends on.
     """
-    all_insights = {}
+    name: str
+    compute: Callable
+    requires: Tuple[str, ...] = ()
+    params: Tuple[str, ...] = ()
+
+@dataclass(frozen=True)
+class InsightCheck:
+    """
+    An insight category: render(stats) turns the required statistics into bullet points.
+    """
+    category: str
+    requires: Tuple[str, ...]
+    render: Callable
+
+STATISTICS: Dict[str, Statistic] = {}
+CHECKS: List[InsightCheck] = []
 
-    # 1️⃣ Outlier detection
-    outlier_info = aggregate_outlier_flags(df)
-    all_insights["Outliers"] = outlier_info["insights"]
+def register_statistic(name: str, compute: Callable, requires=(), params=()):
+    STATISTICS[name] = Statistic(name, compute, tuple(requires), tuple(params))
 
-    # 2️⃣ Skewness detection
-    skew_df = detect_skewness(df, threshold=1.0)
-    all_insights["Skewness"] = generate_skewness_insights(skew_df)
+def register_check(category: str, requires, render: Callable):
+    CHECKS.append(InsightCheck(category, tuple(requires), render))
+
+def resolve_order(names) -> List[str]:
+    """
+    Returns the given statistics and everything they depend on, dependencies first.
+    """
+    order, state = [], {}
+
+    def visit(name):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Circular dependency involving statistic '{name}'.")
+        if name not in STATISTICS:
+            raise KeyError(f"Unknown statistic '{name}'.")
+        state[name] = "visiting"
+        for dependency in STATISTICS[name].requires:
+            visit(dependency)
+        state[name] = "done"
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+def _effective_params(name: str) -> Tuple[str, ...]:
+    """
+    Settings a statistic depends on, directly or through its dependencies.
+    """
+    stat = STATISTICS[name]
+    params = set(stat.params)
+    for dependency in stat.requires:
+        params.update(_effective_params(dependency))
+    return tuple(sorted(params))
+
+@dataclass
+class InsightResults:
+    """
+    Everything one insight run produced: the computed statistics (tables the
+    Smart Insights page shows) and the bullet-point insights per category.
+    """
+    params: Dict[str, object]
+    stats: Dict[str, object]
+    insights: Dict[str, List[str]]
+
+    def __getitem__(self, name):
+        return self.stats[name]
+
+def params_from_state(state) -> Dict[str, object]:
+    """
+    Reads the insight settings chosen in the UI from a session-state mapping.
+    """
+    return {param: state[key] for param, key in SESSION_PARAMS.items() if key in state}
+
+def _run_insights(df: pd.DataFrame, params: Dict[str, object]) -> InsightResults:
+    # Every registered statistic is computed, including ones no check needs (e.g. null_flags),
+    # because the page and exports show them too
+    stats = {}
+    for name in resolve_order(STATISTICS):
+        stat = STATISTICS[name]
+        # Each statistic is memoized per frame under the settings it actually uses,
+        # so changing one slider only recomputes what depends on it
+        key = ("insight_stat", name) + tuple((p, params[p]) for p in _effective_params(name))
+        stats[name] = memoize_on_frame(df, key, lambda: stat.compute(df, params, stats))
+    insights = {check.category: check.render(stats) for check in CHECKS}
+    return InsightResults(params=params, stats=stats, insights=insights)
+
+def run_insights(df: pd.DataFrame, **params) -> InsightResults:
+    """
+    Runs every registered check on df and returns the shared result object.
+    Repeated calls with the same settings (page render, PDF and HTML export) reuse it.
+    """
+    unknown = set(params) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown insight settings: {', '.join(sorted(unknown))}")
+    params = {**DEFAULT_PARAMS, **params}
+    key = ("insights",) + tuple(sorted(params.items()))
+    return memoize_on_frame(df, key, lambda: _run_insights(df, params))
+
+def generate_all_insights(df, correlation_method: str = "pearson", correlation_missing: str = "pairwise"):
+    """
+    Runs all smart insight checks and returns a dictionary with
+    lists of bullet-point insights grouped by category.
+    correlation_method/correlation_missing are passed to high_correlation_pairs.
+    """
+    return run_insights(
+        df, correlation_method=correlation_method, correlation_missing=correlation_missing
+    ).insights
 
-    # 3️⃣ Cardinality check
-    high_card = flag_high_cardinality(df, threshold=0.95)
-    card_insights = []
-    for _, row in high_card.iterrows():
-        card_insights.append(
-            f"⚠️ Column `{row['Column']}` has {row['Uniqueness %']}% unique values — may behave like an identifier."
-        )
-    all_insights["Cardinality"] = card_insights
+def _cardinality_insights(stats):
+    return [
+        f"⚠️ Column `{row['Column']}` has {row['Uniqueness %']}% unique values — may behave like an identifier."
+        for _, row in stats["high_cardinality"].iterrows()
+    ]
 
-    # 4️⃣ High correlation
-    high_corr_df = high_correlation_pairs(df, threshold=0.85)
-    all_insights["Correlation"] = generate_correlation_insights(high_corr_df)
+# Shared statistics
+register_statistic("profile", lambda df, params, stats: get_profile(df))
+register_statistic("outlier_index", lambda df, params, stats: get_outlier_index(df), requires=["profile"])
+register_statistic(
+    "null_flags",
+    lambda df, params, stats: flag_nulls(df, params["null_threshold"], profile=stats["profile"]),
+    requires=["profile"], params=["null_threshold"]
+)
+register_statistic(
+    "outliers",
+    lambda df, params, stats: aggregate_outlier_flags(
+        df, params["iqr_multiplier"], params["z_thresh"], index=stats["outlier_index"]
+    ),
+    requires=["outlier_index"], params=["iqr_multiplier", "z_thresh"]
+)
+register_statistic(
+    "skewness",
+    lambda df, params, stats: detect_skewness(df, params["skew_threshold"], profile=stats["profile"]),
+    requires=["profile"], params=["skew_threshold"]
+)
+register_statistic(
+    "cardinality",
+    lambda df, params, stats: compute_cardinality(df, profile=stats["profile"]),
+    requires=["profile"]
+)
+register_statistic(
+    "high_cardinality",
+    lambda df, params, stats: stats["cardinality"][
+        stats["cardinality"]["Uniqueness %"] > params["cardinality_threshold"] * 100
+    ].reset_index(drop=True),
+    requires=["cardinality"], params=["cardinality_threshold"]
+)
+register_statistic(
+    "correlation",
+    lambda df, params, stats: high_correlation_pairs(
+        df, params["correlation_threshold"],
+        method=params["correlation_method"], missing=params["correlation_missing"]
+    ),
+    params=["correlation_threshold", "correlation_method", "correlation_missing"]
+)
+# Tall frames are checked on a row sample, which is profiled on its own
+register_statistic("associations", lambda df, params, stats: detect_associations(df))
+register_statistic(
+    "anomalies",
+    lambda df, params, stats: detect_anomalies(
+        df, time_budget=params["anomaly_time_budget"], profile=stats["profile"]
+    ),
+    requires=["profile"], params=["anomaly_time_budget"]
+)
+register_statistic(
+    "duplicates",
+    lambda df, params, stats: detect_duplicates(df, near_duplicates=params["near_duplicates"]),
+    params=["near_duplicates"]
+)
 
-    return all_insights
+# Insight categories, in display order
+register_check("Outliers", ["outliers"], lambda stats: stats["outliers"]["insights"])
+register_check("Anomalies", ["anomalies"], lambda stats: generate_anomaly_insights(stats["anomalies"]))
+register_check("Skewness", ["skewness"], lambda stats: generate_skewness_insights(stats["skewness"]))
+register_check("Cardinality", ["high_cardinality"], _cardinality_insights)
+register_check("Correlation", ["correlation"], lambda stats: generate_correlation_insights(stats["correlation"]))
+register_check("Association", ["associations"], lambda stats: generate_association_insights(stats["associations"]))
+register_check(
+    "Duplicates", ["duplicates", "profile"],
+    lambda stats: generate_duplicate_insights(stats["duplicates"], stats["profile"].n_rows)
+)
@@ -1,7 +1,9 @@
 import pandas as pd
+from eda.profiler import get_profile
 
-def flag_nulls(df, threshold=0.3):
-    null_percent = df.isnull().mean()
+def flag_nulls(df, threshold=0.3, profile=None):
+    profile = profile or get_profile(df)
+    null_percent = pd.Series({col: p.null_fraction for col, p in profile.columns.items()}, dtype="float64")
     flagged = null_percent[null_percent > threshold]
     if flagged.empty:
         return pd.DataFrame()
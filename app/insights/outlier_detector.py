@@ -2,60 +2,149 @@
 
 import pandas as pd
 import numpy as np
-from scipy import stats
+from eda.profiler import get_profile
+from eda.dataset_cache import memoize_on_frame
+from eda.parallel import SharedColumns, map_shared_columns, resolve_workers
 
-def detect_outliers_iqr(df: pd.DataFrame, multiplier: float = 1.5) -> pd.DataFrame:
+BLOCK_ROWS = 65_536
+
+class OutlierIndex:
+    """
+    Sorted non-null values of every numeric column, built once per dataset.
+    Outlier counts for any IQR multiplier or z threshold are then two binary
+    searches per column instead of a scan of the data. Memory: one float64
+    copy of the numeric values. When the profile is built here, the columns it
+    sorts are taken over instead of sorted again; quartiles and moments come from
+    the profile, so the IQR fences match the summary table (KLL quartiles above 1M rows).
+    """
+
+    def __init__(self, df: pd.DataFrame, workers: int = None):
+        self.sorted_values = {}
+        profile = get_profile(df, sorted_out=self.sorted_values)
+        self.n_rows = profile.n_rows
+        self.columns = profile.numeric_columns()
+        unsorted = [col for col in self.columns if col not in self.sorted_values]
+        workers = resolve_workers(len(df), len(unsorted), workers)
+        if workers > 1:
+            # Workers sort each column in place inside the shared block (NaN sorts last)
+            with SharedColumns(df, unsorted) as shared:
+                counts = map_shared_columns(_sort_in_place, shared, [()] * len(unsorted), workers)
+                block = shared.array()
+                for i, col in enumerate(unsorted):
+                    self.sorted_values[col] = block[:counts[i], i].copy()
+                del block
+        else:
+            for col in unsorted:
+                values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+                self.sorted_values[col] = np.sort(values[~np.isnan(values)])
+        self.q1 = np.array([profile[col].quantiles[0.25] for col in self.columns], dtype="float64")
+        self.q3 = np.array([profile[col].quantiles[0.75] for col in self.columns], dtype="float64")
+        self.counts = np.array([self.sorted_values[col].size for col in self.columns], dtype=np.int64)
+        self.mean = np.array([profile[col].mean if profile[col].count else np.nan for col in self.columns], dtype="float64")
+        self.std = np.array([profile[col].population_std for col in self.columns], dtype="float64")
+
+    def count_outside(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """
+        Per-column number of values strictly below lower or strictly above upper.
+        A NaN fence counts nothing, as in the scan (comparisons with NaN are False).
+        """
+        result = np.zeros(len(self.columns), dtype=np.int64)
+        for i, col in enumerate(self.columns):
+            values = self.sorted_values[col]
+            below = 0 if np.isnan(lower[i]) else np.searchsorted(values, lower[i], side="left")
+            above = 0 if np.isnan(upper[i]) else values.size - np.searchsorted(values, upper[i], side="right")
+            result[i] = below + above
+        return result
+
+def _sort_in_place(values: np.ndarray) -> int:
+    """
+    Sorts a shared-memory column in place and returns its number of non-NaN values.
+    """
+    values.sort()
+    return int(np.count_nonzero(~np.isnan(values)))
+
+def get_outlier_index(df: pd.DataFrame) -> OutlierIndex:
+    """
+    Returns the OutlierIndex for df, building it on first use.
+    """
+    return memoize_on_frame(df, "outlier_index", lambda: OutlierIndex(df))
+
+def _count_outside_fences(df: pd.DataFrame, columns, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Counts values outside [lower, upper] for every column at once, scanning the
+    numeric block in row slices so memory stays bounded on tall frames.
+    NaN never counts (comparisons with NaN are False).
+    """
+    counts = np.zeros(len(columns), dtype=np.int64)
+    if not len(columns):
+        return counts
+    for start in range(0, len(df), BLOCK_ROWS):
+        # Slice rows before selecting columns so only one block is ever materialized
+        block = df.iloc[start:start + BLOCK_ROWS][columns].to_numpy(dtype="float64", na_value=np.nan)
+        counts += np.count_nonzero((block < lower) | (block > upper), axis=0)
+    return counts
+
+def _outlier_frame(columns, method: str, counts: np.ndarray, totals: np.ndarray) -> pd.DataFrame:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = np.where(totals > 0, counts / totals * 100, 0.0)
+    result = pd.DataFrame({
+        "Column": columns,
+        "Method": method,
+        "Outlier Count": counts,
+        "Outlier %": np.round(percent, 2)
+    })
+    return result.sort_values(by="Outlier %", ascending=False)
+
+def detect_outliers_iqr(df: pd.DataFrame, multiplier: float = 1.5, index: OutlierIndex = None) -> pd.DataFrame:
     """
     IQR-based outlier detection. Returns DataFrame with count and percent of outliers per numeric column.
+    With an OutlierIndex the counts come from binary searches instead of a data scan.
     """
-    numeric = df.select_dtypes(include='number')
-    results = []
-    for col in numeric.columns:
-        q1 = numeric[col].quantile(0.25)
-        q3 = numeric[col].quantile(0.75)
-        iqr = q3 - q1
-        lower = q1 - multiplier * iqr
-        upper = q3 + multiplier * iqr
-        outliers = numeric[(numeric[col] < lower) | (numeric[col] > upper)][col]
-        count = outliers.shape[0]
-        total = numeric.shape[0]
-        percent = (count / total) * 100 if total > 0 else 0
-        results.append({
-            "Column": col,
-            "Method": "IQR",
-            "Outlier Count": count,
-            "Outlier %": round(percent, 2)
-        })
-    return pd.DataFrame(results).sort_values(by="Outlier %", ascending=False)
-
-def detect_outliers_zscore(df: pd.DataFrame, threshold: float = 3.0) -> pd.DataFrame:
+    if index is not None:
+        iqr = index.q3 - index.q1
+        counts = index.count_outside(index.q1 - multiplier * iqr, index.q3 + multiplier * iqr)
+        return _outlier_frame(index.columns, "IQR", counts, np.full(len(index.columns), index.n_rows))
+
+    profile = get_profile(df)
+    columns = profile.numeric_columns()
+    q1 = np.array([profile[col].quantiles[0.25] for col in columns], dtype="float64")
+    q3 = np.array([profile[col].quantiles[0.75] for col in columns], dtype="float64")
+    iqr = q3 - q1
+    counts = _count_outside_fences(df, columns, q1 - multiplier * iqr, q3 + multiplier * iqr)
+    totals = np.full(len(columns), profile.n_rows)
+    return _outlier_frame(columns, "IQR", counts, totals)
+
+def detect_outliers_zscore(df: pd.DataFrame, threshold: float = 3.0, index: OutlierIndex = None) -> pd.DataFrame:
     """
     Z-score based outlier detection. Returns DataFrame with count and percent of outliers per numeric column.
+    With an OutlierIndex the counts come from binary searches instead of a data scan.
     """
-    numeric = df.select_dtypes(include='number')
-    results = []
-    for col in numeric.columns:
-        col_z = np.abs(stats.zscore(numeric[col].dropna()))
-        if len(col_z) == 0:
-            continue
-        outlier_mask = col_z > threshold
-        count = int(np.sum(outlier_mask))
-        total = numeric[col].dropna().shape[0]
-        percent = (count / total) * 100 if total > 0 else 0
-        results.append({
-            "Column": col,
-            "Method": "Z-score",
-            "Outlier Count": count,
-            "Outlier %": round(percent, 2)
-        })
-    return pd.DataFrame(results).sort_values(by="Outlier %", ascending=False)
-
-def aggregate_outlier_flags(df: pd.DataFrame, iqr_multiplier: float = 1.5, z_thresh: float = 3.0):
+    if index is not None:
+        present = index.counts > 0
+        half_width = np.where(index.std > 0, threshold * index.std, np.inf)
+        counts = index.count_outside(index.mean - half_width, index.mean + half_width)
+        columns = [col for col, keep in zip(index.columns, present) if keep]
+        return _outlier_frame(columns, "Z-score", counts[present], index.counts[present])
+
+    profile = get_profile(df)
+    # All-missing columns have no z-scores and are left out
+    columns = [col for col in profile.numeric_columns() if profile[col].count > 0]
+    mean = np.array([profile[col].mean for col in columns], dtype="float64")
+    std = np.array([profile[col].population_std for col in columns], dtype="float64")
+    # |z| > threshold  <=>  x outside mean ± threshold * std; constant columns have no outliers
+    half_width = np.where(std > 0, threshold * std, np.inf)
+    counts = _count_outside_fences(df, columns, mean - half_width, mean + half_width)
+    totals = np.array([profile[col].count for col in columns])
+    return _outlier_frame(columns, "Z-score", counts, totals)
+
+def aggregate_outlier_flags(df: pd.DataFrame, iqr_multiplier: float = 1.5, z_thresh: float = 3.0,
+                            index: OutlierIndex = None):
     """
     Combine both methods into a summary. Returns a dict with dataframes and a concise insight list.
+    Pass get_outlier_index(df) to re-threshold without rescanning the data.
     """
-    iqr_df = detect_outliers_iqr(df, multiplier=iqr_multiplier)
-    z_df = detect_outliers_zscore(df, threshold=z_thresh)
+    iqr_df = detect_outliers_iqr(df, multiplier=iqr_multiplier, index=index)
+    z_df = detect_outliers_zscore(df, threshold=z_thresh, index=index)
 
     # Merge summaries for the same column if needed
     summary = pd.concat([iqr_df, z_df], ignore_index=True)
@@ -1,14 +1,15 @@
 # insights/skewness_checker.py
 
 import pandas as pd
+from eda.profiler import get_profile
 
-def detect_skewness(df: pd.DataFrame, threshold: float = 1.0) -> pd.DataFrame:
+def detect_skewness(df: pd.DataFrame, threshold: float = 1.0, profile=None) -> pd.DataFrame:
     """
     Computes skewness for numeric columns and flags those with |skew| > threshold.
     Returns a DataFrame with skew values and an indicator.
     """
-    numeric = df.select_dtypes(include='number')
-    skew_series = numeric.skew().dropna()
+    profile = profile or get_profile(df)
+    skew_series = pd.Series({col: profile[col].skew for col in profile.numeric_columns()}, dtype="float64").dropna()
     flagged = skew_series[skew_series.abs() > threshold].sort_values(ascending=False)
 
     result = pd.DataFrame({
@@ -3,10 +3,12 @@
 import streamlit as st
 from ui.layout import render_landing_page
 from eda.data_loader import upload_file
+from eda.dataset_cache import cached
 from ui import styles
 from eda.type_inference import detect_column_types
 from eda.summary_stats import generate_summary
-from eda.missing_values import get_missing_value_report, plot_missing_bar
+from eda.streaming_stats import profile_chunks
+from eda.missing_values import get_missing_value_report, get_nullity_bitmap, plot_missing_bar, plot_co_missing_heatmap
 from eda.preprocess import preprocess_data
 from ui.about import show_about_section
 
@@ -66,15 +68,26 @@ elif st.session_state.page == "Upload":
 
     if df is not None:
         st.session_state.df_raw = df
+        dataset_key = st.session_state.dataset_key
+        memory_report = st.session_state.memory_report
+        full_shape = st.session_state.df_spilled.shape if "df_spilled" in st.session_state else df.shape
         st.markdown(styles.section_block("👀 Data Preview"), unsafe_allow_html=True)
         st.dataframe(df.head(), use_container_width=True)
 
         st.markdown(styles.section_block("📏 Dataset Dimensions"), unsafe_allow_html=True)
-        st.write(f"Rows: {df.shape[0]} &nbsp;&nbsp;|&nbsp;&nbsp; Columns: {df.shape[1]}", unsafe_allow_html=True)
+        st.write(f"Rows: {full_shape[0]} &nbsp;&nbsp;|&nbsp;&nbsp; Columns: {full_shape[1]}", unsafe_allow_html=True)
 
         st.markdown(styles.section_block("🧮 Column Data Types"), unsafe_allow_html=True)
         st.dataframe(df.dtypes.reset_index().rename(columns={"index": "Column", 0: "Data Type"}), use_container_width=True)
-        col_types = detect_column_types(df)
+
+        if memory_report is not None:
+            st.markdown(styles.section_block("🪶 Memory Optimization"), unsafe_allow_html=True)
+            before_mb = memory_report["Before (KB)"].sum() / 1024
+            after_mb = memory_report["After (KB)"].sum() / 1024
+            st.write(f"Memory: {before_mb:,.2f} MB → {after_mb:,.2f} MB")
+            st.dataframe(memory_report, use_container_width=True)
+
+        col_types = cached(dataset_key, "column_types", lambda: detect_column_types(df))
         st.markdown(styles.section_block("🔍 Auto Column Type Detection"), unsafe_allow_html=True)
         # st.markdown('<div class="type-section">', unsafe_allow_html=True)
 
@@ -99,14 +112,20 @@ elif st.session_state.page == "Upload":
         # Summary Statistics
         # --------------------------
         st.markdown(styles.section_block("📊 Summary Statistics"), unsafe_allow_html=True)
-        summary_df = generate_summary(df)
+        # Spilled datasets are summarized by streaming their on-disk chunks: counts, nulls, mean,
+        # variance, min and max are exact; quartiles (KLL) and distinct counts (HyperLogLog) are approximate
+        full_profile = None
+        if "df_spilled" in st.session_state:
+            spilled = st.session_state.df_spilled
+            full_profile = cached(dataset_key, "full_profile", lambda: profile_chunks(spilled.iter_chunks()))
+        summary_df = cached(dataset_key, "summary", lambda: generate_summary(df, profile=full_profile))
         st.dataframe(summary_df, use_container_width=True)
 
         # --------------------------
         # Missing Value Report
         # --------------------------
         st.markdown(styles.section_block("❗ Missing Values"), unsafe_allow_html=True)
-        null_df = get_missing_value_report(df)
+        null_df = cached(dataset_key, "missing_report", lambda: get_missing_value_report(df, profile=full_profile))
 
         if null_df.empty:
             st.success("No missing values detected! 🎉")
@@ -116,20 +135,70 @@ elif st.session_state.page == "Upload":
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
 
+            # Row-level views come from the packed nullity bitmap of the in-memory frame
+            bitmap = get_nullity_bitmap(df)
+            if "df_spilled" in st.session_state:
+                st.caption("Row-level missingness below is computed on the in-memory sample.")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**Missing Values per Row**")
+                st.dataframe(cached(dataset_key, "missing_rows", bitmap.row_distribution), use_container_width=True)
+            with col2:
+                st.markdown("**Most Common Missing Patterns**")
+                st.dataframe(cached(dataset_key, "missing_patterns", bitmap.pattern_frequencies), use_container_width=True)
+
+            co_missing = cached(dataset_key, "co_missing", bitmap.co_missing_correlation)
+            fig = plot_co_missing_heatmap(co_missing)
+            if fig:
+                st.plotly_chart(fig, use_container_width=True)
+
 
 elif st.session_state.page == "Preprocess":
     if "df_raw" not in st.session_state:
         st.warning("⚠️ Please upload a dataset first!")
     else:
-        from eda.preprocess import preprocess_data  # ✅ updated function name
+        from eda.preprocess import PreprocessPipeline, preprocess_data, preprocess_spilled  # ✅ updated function name
 
         st.markdown(styles.section_block("🧼 Data Preprocessing"), unsafe_allow_html=True)
         st.write("Click the button below to clean and standardize your dataset.")
 
+        # A saved pipeline replays the same fill values and category codes on a new batch
+        pipeline_file = st.file_uploader("Optional: apply a saved preprocessing pipeline (.json)", type=["json"],
+                                         key="pipeline_file")
+
         if st.button("✨ Run Preprocessing", use_container_width=True):
-            df_cleaned = preprocess_data(st.session_state.df_raw)
-            st.session_state.df_cleaned = df_cleaned
-            st.success("✅ Dataset cleaned and stored as `df_cleaned` in memory.")
+            pipeline = None
+            if pipeline_file is not None:
+                try:
+                    pipeline = PreprocessPipeline.from_json(pipeline_file.getvalue().decode("utf-8"))
+                except ValueError as e:
+                    # json.JSONDecodeError and UnicodeDecodeError are ValueErrors too
+                    st.error(f"❌ Could not read the saved pipeline: {e}")
+                    st.stop()
+            if "df_spilled" in st.session_state:
+                # Out of core: clean the on-disk chunks into new Parquet parts and keep only a sample in memory
+                with st.spinner("Cleaning the full dataset chunk by chunk..."):
+                    cleaned, pipeline = preprocess_spilled(st.session_state.df_spilled, pipeline=pipeline)
+                st.session_state.df_cleaned_spilled = cleaned
+                st.session_state.df_cleaned = cleaned.sample_rows(len(st.session_state.df_raw))
+                st.success(f"✅ {cleaned.n_rows:,} rows cleaned to disk; analyses use a "
+                           f"{st.session_state.df_cleaned.shape[0]:,}-row sample.")
+            else:
+                pipeline = pipeline or PreprocessPipeline().fit(st.session_state.df_raw)
+                st.session_state.df_cleaned = preprocess_data(st.session_state.df_raw, pipeline=pipeline)
+                st.session_state.pop("df_cleaned_spilled", None)
+                st.success("✅ Dataset cleaned and stored as `df_cleaned` in memory.")
+            st.session_state.preprocess_pipeline = pipeline
+
+        if "preprocess_pipeline" in st.session_state:
+            st.download_button(
+                label="💾 Download Preprocessing Pipeline",
+                data=st.session_state.preprocess_pipeline.to_json(),
+                file_name="autoeda_pipeline.json",
+                mime="application/json",
+                use_container_width=True
+            )
 
         if "df_cleaned" in st.session_state:
             st.markdown("### 🔍 Cleaned Data Preview")
@@ -140,7 +209,8 @@ elif st.session_state.page == "Preprocess":
 
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("📐 Rows", df_cleaned.shape[0])
+            cleaned_spilled = st.session_state.get("df_cleaned_spilled")
+            st.metric("📐 Rows", cleaned_spilled.n_rows if cleaned_spilled is not None else df_cleaned.shape[0])
             st.metric("📏 Columns", df_cleaned.shape[1])
             st.metric("🧪 Missing Cells", df_cleaned.isnull().sum().sum())
         with col2:
@@ -157,7 +227,7 @@ elif st.session_state.page == "Visualizations":
         from eda.basic_viz import show_basic_visualizations
 
         st.markdown(styles.section_block("📊 Auto Visualizations"), unsafe_allow_html=True)
-        st.write("This section shows visualizations automatically.")
+        st.write("Search or page through the columns and open one to see its charts.")
 
         show_basic_visualizations(st.session_state.df_cleaned)
 
@@ -177,10 +247,13 @@ elif st.session_state.page == "Smart Insights":
         st.warning("⚠️ Please upload and preprocess a dataset first.")
     else:
         #summary
-        from insights.insight_panel import generate_all_insights
+        from insights.insight_panel import run_insights, params_from_state
 
-        # Generate all insights once
-        insights_dict = generate_all_insights(st.session_state.df_cleaned)
+        # Run every check once; the sections below and the exports read from the same results
+        insight_results = run_insights(st.session_state.df_cleaned, **params_from_state(st.session_state))
+        insights_dict = insight_results.insights
+        # Widget state is dropped once the page is left; keep the settings for the exports
+        st.session_state.insight_params = insight_results.params
 
         # Count issues
         summary_stats = {k: len(v) for k, v in insights_dict.items()}
@@ -215,14 +288,13 @@ elif st.session_state.page == "Smart Insights":
 
 
 
-        from insights.null_flagger import flag_nulls
         df = st.session_state.df_cleaned
 
         # --- Section: Null Value Flags ---
         st.markdown("### <span style='color:#10b981'>🔍 Null Value Check</span>", unsafe_allow_html=True)
         st.info("Detects columns with more than **30% missing values**.")
 
-        null_flags = flag_nulls(df)
+        null_flags = insight_results["null_flags"]
 
         if not null_flags.empty:
             st.markdown("#### ⚠️ Columns With High Missing Values")
@@ -247,14 +319,53 @@ elif st.session_state.page == "Smart Insights":
             st.success("✅ Great! No columns have more than 30% missing values.")
 
 
-        # --- Section: Outlier Detection Flags ---
+        # --- Section: Duplicate Rows ---
+        from insights.duplicate_checker import generate_duplicate_insights
+
+        st.markdown("### <span style='color:#10b981'>🧬 Duplicate Rows</span>", unsafe_allow_html=True)
+        st.info("Finds exact duplicate rows via row fingerprints. Optionally looks for near-duplicates (≥80% overlap of field values and words) with MinHash; large tables are sampled.")
 
-        from insights.outlier_detector import aggregate_outlier_flags
+        st.checkbox("Also look for near-duplicate rows (MinHash)", key="near_duplicates")
+        duplicates = insight_results["duplicates"]
+        exact = duplicates["exact"]
+
+        dup_col1, dup_col2 = st.columns(2)
+        with dup_col1:
+            st.metric("Exact duplicate rows", exact["duplicate_rows"])
+        with dup_col2:
+            st.metric("Duplicate groups", exact["duplicate_groups"])
+
+        duplicate_insights = generate_duplicate_insights(duplicates, len(df))
+        if duplicate_insights:
+            for insight in duplicate_insights:
+                st.markdown(f"<div class='insight-flag'>{insight}</div>", unsafe_allow_html=True)
+        else:
+            st.success("✅ No duplicate rows detected.")
+
+        example_groups = [("Exact duplicates", group) for group in exact["groups"]]
+        if duplicates["near"]:
+            example_groups += [("Near-duplicates", group) for group in duplicates["near"]["groups"]]
+        for kind, group in example_groups:
+            with st.expander(f"{kind}: {len(group)} rows (index {group[0]}, ...)"):
+                st.dataframe(df.loc[group], use_container_width=True)
+
+
+        # --- Section: Outlier Detection Flags ---
 
         st.markdown("### <span style='color:#10b981'>🔎 Outlier Detection</span>", unsafe_allow_html=True)
         st.info("Detects potential outliers using both IQR and Z-score methods. Columns with >5% outliers are flagged.")
 
-        outlier_info = aggregate_outlier_flags(st.session_state.df_cleaned)
+        # The sorted-value index is built once per dataset, so moving the sliders only re-counts.
+        # insight_results above already reflects these values: widget state is set before the rerun.
+        slider_col1, slider_col2 = st.columns(2)
+        with slider_col1:
+            st.slider("IQR multiplier", min_value=0.5, max_value=5.0, value=1.5, step=0.1,
+                      key="iqr_multiplier")
+        with slider_col2:
+            st.slider("Z-score threshold", min_value=1.0, max_value=6.0, value=3.0, step=0.1,
+                      key="z_thresh")
+
+        outlier_info = insight_results["outliers"]
 
         col1, col2 = st.columns([2, 1])  # Wider summary, narrower flags
 
@@ -272,13 +383,44 @@ elif st.session_state.page == "Smart Insights":
                 st.success("✅ No significant outlier patterns detected (threshold: 5%).")
 
 
+        # --- Section: Multivariate Anomalies ---
+        from insights.anomaly_detector import generate_anomaly_insights
+
+        st.markdown("### <span style='color:#10b981'>🛰️ Multivariate Anomalies</span>", unsafe_allow_html=True)
+        st.info("Scores every row with an IsolationForest trained on a subsample of the numeric columns. Rows with an anomaly score above 0.6 are flagged.")
+
+        anomalies = insight_results["anomalies"]
+        if anomalies is None:
+            st.success("✅ At least two numeric columns are needed for multivariate anomaly detection.")
+        elif anomalies["anomaly_rows"]:
+            col1, col2 = st.columns([3, 2])
+
+            with col1:
+                st.subheader("Most Anomalous Rows")
+                top_rows = df.loc[anomalies["top"]["Row"]].copy()
+                top_rows.insert(0, "Anomaly Score", anomalies["top"]["Anomaly Score"].to_numpy())
+                st.dataframe(
+                    top_rows.style
+                        .format({"Anomaly Score": "{:.3f}"})
+                        .background_gradient(subset=["Anomaly Score"], cmap="OrRd"),
+                    use_container_width=True
+                )
+
+            with col2:
+                st.markdown("<div style='padding-top: 1.3rem;'></div>", unsafe_allow_html=True)
+                for insight in generate_anomaly_insights(anomalies):
+                    st.markdown(f"<div class='insight-flag'>{insight}</div>", unsafe_allow_html=True)
+        else:
+            st.success("✅ No multivariate anomalies detected.")
+
+
         # --- Section: Skewness Detection ---
-        from insights.skewness_checker import detect_skewness, generate_skewness_insights
+        from insights.skewness_checker import generate_skewness_insights
 
         st.markdown("### <span style='color:#10b981'>⚖️ Skewness Detection</span>", unsafe_allow_html=True)
         st.info("Identifies numeric columns with high skew (|skew| > 1).")
 
-        skew_df = detect_skewness(st.session_state.df_cleaned, threshold=1.0)
+        skew_df = insight_results["skewness"]
 
         if not skew_df.empty:
             col1, col2 = st.columns([3, 2])
@@ -304,12 +446,10 @@ elif st.session_state.page == "Smart Insights":
             st.success("✅ No numeric columns found to check for skewness.")
         
         # --- Section: Cardinality Check ---
-        from insights.cardinality_checker import compute_cardinality, flag_high_cardinality
-
         st.markdown("### <span style='color:#10b981'>🧮 Cardinality Check</span>", unsafe_allow_html=True)
         st.info("Warns if a column is almost all unique values (e.g., IDs/emails) which may not be useful for grouping or aggregation.")
 
-        card_full = compute_cardinality(st.session_state.df_cleaned)
+        card_full = insight_results["cardinality"]
 
         col1, col2 = st.columns([3, 2])
         with col1:
@@ -323,7 +463,7 @@ elif st.session_state.page == "Smart Insights":
 
         with col2:
             st.markdown("<div style='padding-top: 0.8rem;'></div>", unsafe_allow_html=True)
-            high_card = flag_high_cardinality(st.session_state.df_cleaned, threshold=0.95)
+            high_card = insight_results["high_cardinality"]
             if not high_card.empty:
                 st.markdown("#### ⚠️ High Cardinality Columns")
                 st.dataframe(
@@ -346,12 +486,28 @@ elif st.session_state.page == "Smart Insights":
 
 
         # --- Section: Correlation Insights ---
-        from insights.correlation_warner import high_correlation_pairs, generate_correlation_insights
+        from insights.correlation_warner import generate_correlation_insights
 
         st.markdown("### <span style='color:#10b981'>🔗 Correlation Insights</span>", unsafe_allow_html=True)
         st.info("Detects highly correlated numeric column pairs (absolute correlation > 0.85).")
 
-        high_corr_df = high_correlation_pairs(st.session_state.df_cleaned, threshold=0.85)
+        corr_col1, corr_col2 = st.columns(2)
+        with corr_col1:
+            st.selectbox(
+                "Correlation method",
+                options=["pearson", "spearman"],
+                format_func=lambda m: "Pearson (linear)" if m == "pearson" else "Spearman (rank / monotonic)",
+                key="corr_method"
+            )
+        with corr_col2:
+            st.selectbox(
+                "Missing values",
+                options=["pairwise", "listwise"],
+                format_func=lambda m: "Pairwise-complete rows" if m == "pairwise" else "Drop incomplete rows",
+                key="corr_missing"
+            )
+
+        high_corr_df = insight_results["correlation"]
         if not high_corr_df.empty:
             col1, col2 = st.columns([3, 2])
 
@@ -373,6 +529,43 @@ elif st.session_state.page == "Smart Insights":
         else:
             st.success("✅ No high correlation feature pairs detected.")
 
+
+        # --- Section: Association Insights ---
+        from insights.association_checker import generate_association_insights
+
+        st.markdown("### <span style='color:#10b981'>🧩 Association Insights</span>", unsafe_allow_html=True)
+        st.info("Detects strongly related categorical pairs (Cramér's V > 0.5) and numeric columns that differ strongly across categories (η² > 0.5).")
+
+        associations = insight_results["associations"]
+        if not associations["categorical"].empty or not associations["numeric"].empty:
+            col1, col2 = st.columns([3, 2])
+
+            with col1:
+                if not associations["categorical"].empty:
+                    st.subheader("Categorical Pairs")
+                    st.dataframe(
+                        associations["categorical"].style
+                            .format({"Cramér's V": "{:.2f}"})
+                            .background_gradient(subset=["Cramér's V"], cmap="RdPu"),
+                        use_container_width=True
+                    )
+                if not associations["numeric"].empty:
+                    st.subheader("Categorical vs Numeric")
+                    st.dataframe(
+                        associations["numeric"].style
+                            .format({"Eta²": "{:.2f}"})
+                            .background_gradient(subset=["Eta²"], cmap="RdPu"),
+                        use_container_width=True
+                    )
+
+            with col2:
+                st.markdown("<div style='padding-top: 1.3rem;'></div>", unsafe_allow_html=True)
+                st.markdown("**Flagged Columns:**")
+                for insight in generate_association_insights(associations):
+                    st.markdown(f"<div class='insight-flag'>{insight}</div>", unsafe_allow_html=True)
+        else:
+            st.success("✅ No strong categorical associations detected.")
+
 elif st.session_state.page == "Exports":
     if "df_cleaned" not in st.session_state:
         st.warning("⚠️ No cleaned dataset found. Please upload and process a dataset first!")
@@ -384,7 +577,7 @@ elif st.session_state.page == "Exports":
             # --------------------------
             # Export the cleaned data CSV
             # --------------------------
-            from exports.export_csv import convert_df_to_csv
+            from exports.export_csv import convert_df_to_csv, convert_spilled_to_csv, spilled_csv_path
             df_cleaned = st.session_state.df_cleaned
 
             # 🪄 Section Title Block
@@ -392,15 +585,31 @@ elif st.session_state.page == "Exports":
             st.write("You can now download your final cleaned dataset for use in machine learning pipelines or external tools.")
 
             # 📥 Download Button (styled + consistent)
-            csv_file = convert_df_to_csv(df_cleaned)
-            st.download_button(
-                label="⬇️ Download Cleaned Data (CSV)",
-                data=csv_file,
-                file_name="cleaned_dataset.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-        
+            cleaned_spilled = st.session_state.get("df_cleaned_spilled")
+            if cleaned_spilled is not None:
+                # The full cleaned data lives on disk: write its parts to one CSV only on request
+                csv_path = spilled_csv_path(cleaned_spilled)
+                if csv_path is None and st.button("📝 Prepare Cleaned Data (CSV)", use_container_width=True):
+                    with st.spinner(f"🔄 Writing {cleaned_spilled.n_rows:,} rows to CSV..."):
+                        csv_path = convert_spilled_to_csv(cleaned_spilled)
+                if csv_path is not None:
+                    with open(csv_path, "rb") as f:
+                        st.download_button(
+                            label="⬇️ Download Cleaned Data (CSV)",
+                            data=f,
+                            file_name="cleaned_dataset.csv",
+                            mime="text/csv",
+                            use_container_width=True
+                        )
+            else:
+                st.download_button(
+                    label="⬇️ Download Cleaned Data (CSV)",
+                    data=convert_df_to_csv(df_cleaned),
+                    file_name="cleaned_dataset.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
+
         with col2:
             # --------------------------
             #Export Summary Statistics
@@ -435,8 +644,7 @@ elif st.session_state.page == "Exports":
             if st.button("📝 Generate PDF Report"):
                 with st.spinner("🔄 Generating PDF report... Please wait."):
                     from exports.export_pdf import export_pdf_report
-                    from insights.null_flagger import flag_nulls
-                    from insights.insight_panel import generate_all_insights
+                    from insights.insight_panel import run_insights
                     import eda.basic_viz
 
                     summary_stats = get_summary_statistics(df_cleaned)
@@ -449,12 +657,14 @@ elif st.session_state.page == "Exports":
                     # Use matplotlib directly for better reliability
                     from eda.basic_viz import generate_matplotlib_plots_for_export
                     pdf_plots = generate_matplotlib_plots_for_export(df_cleaned)
+                    # Same settings as the Smart Insights page, so this reuses its results
+                    insight_results = run_insights(df_cleaned, **st.session_state.get("insight_params", {}))
                     
                     pdf_path = export_pdf_report(
                         df=df_cleaned,
                         summary_stats=summary_stats,
-                        missing_report=flag_nulls(df_cleaned),
-                        insights=generate_all_insights(df_cleaned),
+                        missing_report=insight_results["null_flags"],
+                        insights=insight_results.insights,
                         plots_dict=pdf_plots
                     )
 
@@ -478,14 +688,14 @@ elif st.session_state.page == "Exports":
             if st.button("📝 Generate HTML Report"):
                 with st.spinner("🔄 Generating HTML report... Please wait."):
                     from exports.export_html import export_html_report
-                    from insights.null_flagger import flag_nulls
-                    from insights.insight_panel import generate_all_insights
+                    from insights.insight_panel import run_insights
                     from eda.basic_viz import generate_plots_for_export
 
                     # Prepare data for HTML export
                     summary_stats = get_summary_statistics(df_cleaned)
-                    missing_report = flag_nulls(df_cleaned)
-                    insights_dict = generate_all_insights(df_cleaned)
+                    insight_results = run_insights(df_cleaned, **st.session_state.get("insight_params", {}))
+                    missing_report = insight_results["null_flags"]
+                    insights_dict = insight_results.insights
                     
                     # Flatten insights into a list
                     insights_list = []
@@ -0,0 +1,26 @@
+# tests/test_anomaly_detector.py
+
+import numpy as np
+import pandas as pd
+from insights.anomaly_detector import detect_anomalies
+from insights.insight_panel import DEFAULT_PARAMS, run_insights
+
+def _frame(n: int = 5000) -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(rng.normal(size=(n, 3)), columns=["a", "b", "c"])
+    df.loc[[10, 20], ["a", "b", "c"]] = 25.0
+    return df
+
+def test_isolated_rows_rank_first():
+    result = detect_anomalies(_frame(), n_jobs=1)
+    assert set(result["top"]["Row"].iloc[:2]) == {10, 20}
+    assert result["scored_rows"] == result["n_rows"]
+
+def test_time_budget_stops_after_first_batch():
+    result = detect_anomalies(_frame(), n_jobs=1, batch_rows=1000, time_budget=0.0)
+    assert result["scored_rows"] == 1000
+
+def test_insight_panel_passes_time_budget():
+    df = _frame(2000)
+    assert run_insights(df).params["anomaly_time_budget"] == DEFAULT_PARAMS["anomaly_time_budget"]
+    assert run_insights(df, anomaly_time_budget=0.0)["anomalies"]["scored_rows"] == 2000
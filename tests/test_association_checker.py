@@ -0,0 +1,67 @@
+# tests/test_association_checker.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from insights import association_checker
+from insights.association_checker import (categorical_codes, correlation_ratio_pairs, cramers_v_pairs,
+                                          detect_associations)
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(13)
+    n = 3_000
+    color = rng.choice(["red", "green", "blue", None], n)
+    # size mostly follows color; shape is independent; flag is an integer-coded categorical
+    size = np.where(rng.random(n) < 0.8, pd.Series(color).fillna("none").map(
+        {"red": "S", "green": "M", "blue": "L", "none": "S"}), rng.choice(["S", "M", "L"], n))
+    return pd.DataFrame({
+        "color": color,
+        "size": pd.Series(size, dtype="category"),
+        "shape": rng.choice(["circle", "square"], n),
+        "flag": rng.integers(0, 3, n),
+        "price": rng.normal(size=n) + (size == "L") * 3.0,
+        "noise": rng.normal(size=n),
+        "id_text": [f"row{i}" for i in range(n)]
+    })
+
+def _cramers_v_reference(a: pd.Series, b: pd.Series) -> float:
+    # str() gives missing values a level of their own ("None")
+    table = pd.crosstab(a.astype(object).astype(str), b.astype(object).astype(str)).to_numpy(dtype=float)
+    n = table.sum()
+    expected = table.sum(axis=1)[:, None] * table.sum(axis=0)[None, :] / n
+    chi2 = ((table - expected) ** 2 / expected).sum()
+    return float(np.sqrt(chi2 / n / (min(table.shape) - 1)))
+
+def _eta2_reference(groups: pd.Series, values: pd.Series) -> float:
+    data = pd.DataFrame({"g": groups.astype(object).astype(str), "v": values}).dropna(subset=["v"])
+    grand = data["v"].mean()
+    between = data.groupby("g")["v"].agg(lambda v: len(v) * (v.mean() - grand) ** 2).sum()
+    return float(between / ((data["v"] - grand) ** 2).sum())
+
+def test_codes_cover_low_cardinality_columns_only(frame):
+    codes = categorical_codes(frame)
+    assert set(codes) == {"color", "size", "shape", "flag"}
+    assert codes["color"][1] == 4  # missing values are a level of their own
+
+@pytest.mark.parametrize("block_cells", [1 << 24, 64])
+def test_cramers_v_matches_contingency_tables(frame, monkeypatch, block_cells):
+    monkeypatch.setattr(association_checker, "BLOCK_CELLS", block_cells)
+    result = cramers_v_pairs(categorical_codes(frame))
+    assert len(result) == 6
+    for a, b, v in result.itertuples(index=False):
+        assert v == pytest.approx(_cramers_v_reference(frame[a], frame[b]), abs=1e-10)
+
+def test_correlation_ratio_matches_groupby(frame):
+    df = frame.copy()
+    df.loc[::17, "price"] = np.nan
+    result = correlation_ratio_pairs(df, categorical_codes(df))
+    assert len(result) == 4 * 2
+    for categorical, numeric, eta2 in result.itertuples(index=False):
+        assert eta2 == pytest.approx(_eta2_reference(df[categorical], df[numeric]), abs=1e-10)
+
+def test_detect_associations_flags_the_strong_pairs(frame):
+    result = detect_associations(frame)
+    assert [tuple(sorted(pair)) for pair in result["categorical"].iloc[:, :2].itertuples(index=False)] == \
+        [("color", "size")]
+    assert list(result["numeric"].iloc[:, :2].itertuples(index=False, name=None)) == [("size", "price")]
@@ -0,0 +1,95 @@
+# tests/test_chart_data.py
+
+import numpy as np
+import pytest
+import pandas as pd
+from eda.chart_data import TIME_FREQUENCIES, _time_bin, box_data, column_chart_specs, lttb, time_counts
+from eda.profiler import get_profile
+
+def test_box_data_matches_pandas_and_the_profile():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.lognormal(size=20_000)})
+    df.loc[::7, "a"] = np.nan
+    box = box_data(df, "a")
+    values = df["a"].dropna()
+    q1, median, q3 = values.quantile([0.25, 0.5, 0.75])
+    assert np.isclose(box["q1"], q1) and np.isclose(box["median"], median) and np.isclose(box["q3"], q3)
+    assert np.isclose(box["mean"], values.mean())
+    assert box["q1"] == get_profile(df)["a"].quantiles[0.25]
+
+    high = q3 + 1.5 * (q3 - q1)
+    low = q1 - 1.5 * (q3 - q1)
+    assert box["upper_whisker"] == values[values <= high].max()
+    assert box["lower_whisker"] == values[values >= low].min()
+    assert box["n_outliers"] == int(((values > high) | (values < low)).sum())
+    assert box["outliers"].size == 200
+    assert box["outliers"].max() == values.max()
+    assert box["count"] == values.size
+
+def test_box_data_of_an_empty_column_is_none():
+    df = pd.DataFrame({"a": [np.nan, np.nan]})
+    assert box_data(df, "a") is None
+
+def test_pie_chart_shows_every_value_of_a_low_cardinality_column():
+    df = pd.DataFrame({"c": pd.Series([f"v{i}" for i in range(10)] * 3, dtype="category")})
+    pie = [spec for spec in column_chart_specs(df, "c", "categorical") if spec.kind == "pie"][0]
+    assert len(pie.data) == 10
+    assert not pie.data["c"].str.startswith("Other").any()
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.arange(10_000)
+    y = np.sin(x / 300.0)
+    y[4321] = 50.0
+    keep = lttb(x, y, 500)
+    assert keep.size == 500
+    assert keep[0] == 0 and keep[-1] == x.size - 1
+    assert np.all(np.diff(keep) > 0)
+    assert 4321 in keep
+
+@pytest.mark.parametrize("n_out", [100, 150, 2])
+def test_lttb_passes_short_series_through(n_out):
+    x = np.arange(100)
+    np.testing.assert_array_equal(lttb(x, x * 2.0, n_out), np.arange(100))
+
+@pytest.mark.parametrize("span_ns", [0, 10 ** 9, 86_400 * 10 ** 9, 40 * 365 * 86_400 * 10 ** 9, 10 ** 19])
+def test_time_bin_is_the_smallest_step_within_max_bins(span_ns):
+    label, step = _time_bin(span_ns, 1_000)
+    assert span_ns // step + 1 <= 1_000
+    finer = [s for _, s in TIME_FREQUENCIES if s < step]
+    assert all(span_ns // s + 1 > 1_000 for s in finer)
+
+def _timestamps(n: int, tz=None) -> pd.Series:
+    rng = np.random.default_rng(0)
+    offsets = pd.to_timedelta(rng.integers(0, 90 * 86_400, n), unit="s")
+    return pd.Series(pd.Timestamp("2024-01-01", tz=tz) + offsets)
+
+def test_time_counts_match_floor_counts():
+    df = pd.DataFrame({"t": _timestamps(50_000)})
+    result = time_counts(df, "t", max_bins=5_000, max_points=5_000)
+    assert result["freq"] == "hour" and not result["downsampled"]
+    expected = df["t"].dt.floor("h").value_counts()
+    counts = pd.Series(result["y"], index=result["x"])
+    counts = counts[counts > 0]
+    pd.testing.assert_series_equal(counts.sort_index(), expected.sort_index(), check_names=False,
+                                   check_freq=False, check_index_type=False)
+
+def test_time_counts_per_timestamp_for_few_distinct_values():
+    df = pd.DataFrame({"t": pd.to_datetime(["2024-01-02", "2024-01-01", "2024-01-02", None])})
+    result = time_counts(df, "t")
+    assert result["freq"] is None
+    assert list(result["x"]) == [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-02")]
+    assert list(result["y"]) == [1, 2]
+
+def test_time_counts_keep_the_time_zone():
+    df = pd.DataFrame({"t": _timestamps(50_000, tz="America/New_York")})
+    result = time_counts(df, "t", max_points=500)
+    assert str(result["x"].tz) == "America/New_York"
+    assert result["downsampled"] and result["x"].size == 500
+    assert result["x"][0] <= df["t"].min()
+    assert result["x"][-1] <= df["t"].max()
+
+def test_time_counts_of_an_all_nat_column():
+    df = pd.DataFrame({"t": pd.Series([pd.NaT] * 5, dtype="datetime64[ns]")})
+    result = time_counts(df, "t")
+    assert result["x"].size == 0 and result["y"].size == 0
+    assert result["freq"] is None and not result["downsampled"]
@@ -0,0 +1,99 @@
+# tests/test_correlation_warner.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from insights.correlation_warner import high_correlation_pairs
+
+def _frame(n_rows: int = 500, n_cols: int = 23) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    base = rng.normal(size=(n_rows, 4))
+    # Mixtures of a few shared factors give a spread of strong and weak correlations
+    values = base @ rng.normal(size=(4, n_cols)) + rng.normal(scale=0.5, size=(n_rows, n_cols))
+    df = pd.DataFrame(values, columns=[f"c{i}" for i in range(n_cols)])
+    df["constant"] = 3.0
+    df["label"] = "x"
+    return df
+
+def _pandas_pairs(corr: pd.DataFrame, threshold: float) -> dict:
+    columns = corr.columns
+    pairs = {}
+    for i in range(len(columns)):
+        for j in range(i + 1, len(columns)):
+            r = abs(corr.iloc[i, j])
+            if r > threshold:
+                pairs[(columns[i], columns[j])] = min(r, 1.0)
+    return pairs
+
+def _pairs(result: pd.DataFrame) -> dict:
+    return {(a, b): r for a, b, r in result.itertuples(index=False)}
+
+def _assert_same_pairs(result: pd.DataFrame, expected: dict):
+    pairs = _pairs(result)
+    assert pairs.keys() == expected.keys()
+    np.testing.assert_allclose([pairs[key] for key in expected], list(expected.values()), atol=1e-10)
+
+@pytest.mark.parametrize("tile_size,n_jobs", [(512, 1), (5, 1), (4, 3)])
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.85])
+def test_pearson_matches_pandas(tile_size, n_jobs, threshold):
+    df = _frame()
+    result = high_correlation_pairs(df, threshold, tile_size=tile_size, n_jobs=n_jobs)
+    expected = _pandas_pairs(df.corr(numeric_only=True), threshold)
+    # Constant columns have no correlation
+    assert not any("constant" in key for key in expected)
+    _assert_same_pairs(result, expected)
+    assert result["Correlation"].is_monotonic_decreasing
+
+def test_no_numeric_columns():
+    result = high_correlation_pairs(pd.DataFrame({"label": ["a", "b"]}))
+    assert result.empty
+
+def _with_missing(df: pd.DataFrame) -> pd.DataFrame:
+    rng = np.random.default_rng(12)
+    df = df.copy()
+    numeric = [col for col in df.columns if col.startswith("c")]
+    for col in numeric:
+        df.loc[rng.random(len(df)) < 0.1, col] = np.nan
+    df.loc[df.index[:-1], "c0"] = np.nan  # one value left: no pair has two rows
+    df.loc[::2, "constant"] = np.nan
+    return df
+
+@pytest.mark.parametrize("tile_size", [512, 4])
+def test_pearson_pairwise_with_missing_values_matches_pandas(tile_size):
+    df = _with_missing(_frame())
+    result = high_correlation_pairs(df, 0.0, tile_size=tile_size)
+    expected = _pandas_pairs(df.corr(numeric_only=True), 0.0)
+    assert not any("c0" in key or "constant" in key for key in expected)
+    _assert_same_pairs(result, expected)
+
+@pytest.mark.parametrize("tile_size", [512, 4])
+@pytest.mark.parametrize("threshold", [0.0, 0.5])
+def test_spearman_matches_pandas(tile_size, threshold):
+    df = _frame()
+    # A monotonic, non-linear transform keeps the Spearman correlation
+    df["c_exp"] = np.exp(df["c1"])
+    result = high_correlation_pairs(df, threshold, method="spearman", tile_size=tile_size)
+    expected = _pandas_pairs(df.corr(method="spearman", numeric_only=True), threshold)
+    assert expected[("c1", "c_exp")] == pytest.approx(1.0)
+    _assert_same_pairs(result, expected)
+
+def test_spearman_pairwise_ranks_each_column_once():
+    df = _with_missing(_frame())
+    result = high_correlation_pairs(df, 0.0, method="spearman")
+    # Documented semantics: Pearson on per-column ranks over each pair's complete rows
+    expected = _pandas_pairs(df.select_dtypes("number").rank().corr(), 0.0)
+    _assert_same_pairs(result, expected)
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_listwise_matches_pandas_on_complete_rows(method):
+    df = _with_missing(_frame()).drop(columns="c0")
+    # Few complete rows make exact zero rank correlations likely; keep them off the threshold
+    result = high_correlation_pairs(df, 0.01, method=method, missing="listwise")
+    expected = _pandas_pairs(df.dropna().corr(method=method, numeric_only=True), 0.01)
+    _assert_same_pairs(result, expected)
+
+def test_unknown_modes_raise():
+    with pytest.raises(ValueError):
+        high_correlation_pairs(_frame(), method="kendall")
+    with pytest.raises(ValueError):
+        high_correlation_pairs(_frame(), missing="mean")
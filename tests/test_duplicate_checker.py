@@ -0,0 +1,67 @@
+# tests/test_duplicate_checker.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from insights import duplicate_checker
+from insights.duplicate_checker import find_exact_duplicates, find_near_duplicates, minhash_signatures
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(16)
+    n = 5_000
+    df = pd.DataFrame({
+        "a": rng.integers(0, 20, n),
+        "b": rng.choice(["x", "y", None], n),
+        "c": rng.integers(0, 4, n).astype(float)
+    })
+    df.loc[::11, "c"] = np.nan
+    return df
+
+@pytest.mark.parametrize("block_rows", [65_536, 777])
+def test_exact_duplicates_match_pandas(frame, monkeypatch, block_rows):
+    monkeypatch.setattr(duplicate_checker, "BLOCK_ROWS", block_rows)
+    result = find_exact_duplicates(frame, max_groups=3)
+    assert result["duplicate_rows"] == int(frame.duplicated().sum())
+    sizes = frame.groupby(list(frame.columns), dropna=False).size()
+    assert result["duplicate_groups"] == int((sizes > 1).sum())
+    # Largest groups first, each a set of identical rows
+    assert [len(g) for g in result["groups"]] == sorted(sizes, reverse=True)[:3]
+    for group in result["groups"]:
+        assert len(frame.loc[group].drop_duplicates()) == 1
+
+def test_exact_duplicates_of_an_empty_frame():
+    assert find_exact_duplicates(pd.DataFrame())["duplicate_rows"] == 0
+
+def test_minhash_agreement_estimates_jaccard():
+    df = pd.DataFrame({
+        "text": ["the quick brown fox jumps over the lazy dog", "the quick brown fox leaps over a lazy cat"],
+        "n": [1, 1]
+    })
+    signatures = minhash_signatures(df, num_perm=512)
+    # Tokens: one per field plus one per word. The two text fields differ and the n fields match
+    tokens = [set(text.split()) for text in df["text"]]
+    jaccard = (len(tokens[0] & tokens[1]) + 1) / (len(tokens[0] | tokens[1]) + 3)
+    assert np.mean(signatures[0] == signatures[1]) == pytest.approx(jaccard, abs=0.07)
+
+def test_near_duplicates_find_edited_rows_only():
+    rng = np.random.default_rng(17)
+    n = 400
+    words = np.array(["alpha", "beta", "gamma", "delta", "omega", "sigma", "kappa", "theta", "zeta", "eta"])
+    df = pd.DataFrame({
+        "name": [" ".join(rng.choice(words, 8)) + f" item{i}" for i in range(n)],
+        "city": rng.choice(["paris", "rome", "oslo"], n),
+        "score": rng.integers(0, 1_000_000, n)
+    })
+    # Row 1 is row 0 with one extra word; row 3 is an exact copy of row 2
+    df.loc[1] = [df.loc[0, "name"] + " extra", df.loc[0, "city"], df.loc[0, "score"]]
+    df.loc[3] = df.loc[2]
+    result = find_near_duplicates(df, threshold=0.7)
+    assert result["groups"] == [[0, 1]]
+    assert result["near_duplicate_rows"] == 2 and result["near_duplicate_pairs"] == 1
+    assert not result["sampled"]
+
+def test_near_duplicates_sample_tall_frames():
+    df = pd.DataFrame({"a": np.arange(100)})
+    result = find_near_duplicates(df, sample_rows=50)
+    assert result["sampled"] and result["sampled_rows"] == 50
@@ -0,0 +1,26 @@
+# tests/test_export_csv.py
+
+import os
+
+import numpy as np
+import pandas as pd
+from eda.spill import SpilledFrame
+from exports.export_csv import convert_spilled_to_csv, spilled_csv_path
+
+def test_spilled_csv_is_written_once_and_matches_the_parts():
+    df = pd.DataFrame({"a": np.arange(1000.0), "b": np.arange(1000) % 7})
+    spilled = SpilledFrame(df.columns)
+    for start in range(0, len(df), 300):
+        spilled.append(df.iloc[start:start + 300])
+
+    assert spilled_csv_path(spilled) is None
+    path = convert_spilled_to_csv(spilled)
+    assert spilled_csv_path(spilled) == path
+    pd.testing.assert_frame_equal(pd.read_csv(path), df)
+
+    # A second request reuses the file instead of rewriting it
+    modified = os.path.getmtime(path)
+    assert convert_spilled_to_csv(spilled) == path
+    assert os.path.getmtime(path) == modified
+    spilled.cleanup()
+    assert not os.path.exists(path)
@@ -0,0 +1,39 @@
+# tests/test_insight_panel.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from insights import anomaly_detector, cardinality_checker
+from insights.insight_panel import STATISTICS, resolve_order, run_insights
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(9)
+    n = 2_000
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "x": rng.normal(size=n),
+        "y": rng.normal(size=n),
+        "group": rng.choice(["a", "b", "c"], n)
+    })
+
+def test_dependencies_come_first():
+    order = resolve_order(STATISTICS)
+    for name, stat in STATISTICS.items():
+        for dependency in stat.requires:
+            assert order.index(dependency) < order.index(name)
+
+def test_statistics_requiring_the_profile_read_it_from_stats(frame, monkeypatch):
+    def fail(df):
+        raise AssertionError("profile must come from stats")
+    for module in (cardinality_checker, anomaly_detector):
+        monkeypatch.setattr(module, "get_profile", fail)
+    assert "profile" in STATISTICS["cardinality"].requires
+    assert "profile" in STATISTICS["anomalies"].requires
+
+    results = run_insights(frame)
+    monkeypatch.undo()
+    pd.testing.assert_frame_equal(results["cardinality"], cardinality_checker.compute_cardinality(frame))
+    expected = anomaly_detector.detect_anomalies(frame, time_budget=results.params["anomaly_time_budget"])
+    assert results["anomalies"]["anomaly_rows"] == expected["anomaly_rows"]
+    pd.testing.assert_frame_equal(results["anomalies"]["top"], expected["top"])
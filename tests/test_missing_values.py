@@ -0,0 +1,57 @@
+# tests/test_missing_values.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from eda import missing_values
+from eda.missing_values import NullityBitmap, get_missing_value_report
+
+def _frame(n_rows: int, n_cols: int) -> pd.DataFrame:
+    rng = np.random.default_rng(18)
+    values = rng.normal(size=(n_rows, n_cols))
+    # Varying missing rates; the first two columns go missing together, the last never does
+    values[rng.random(values.shape) < np.linspace(0.0, 0.3, n_cols)] = np.nan
+    together = rng.random(n_rows) < 0.2
+    values[together, 0] = values[together, 1] = np.nan
+    values[:, -1] = 1.0
+    df = pd.DataFrame(values, columns=[f"c{i}" for i in range(n_cols)])
+    df["text"] = pd.Series(rng.choice(["a", None], n_rows), dtype="object")
+    return df
+
+@pytest.fixture(params=[(1_001, 5), (777, 70)], ids=["narrow", "wide"])
+def frame(request, monkeypatch):
+    # Tiny blocks exercise the block loops; 70 columns need two 64-bit words per pattern
+    monkeypatch.setattr(missing_values, "ROW_BLOCK_BYTES", 3)
+    monkeypatch.setattr(missing_values, "PAIR_BLOCK", 4)
+    return _frame(*request.param)
+
+def test_column_counts_match_isna(frame):
+    counts = NullityBitmap(frame).column_counts()
+    pd.testing.assert_series_equal(counts, frame.isna().sum().astype("int64"))
+
+def test_row_distribution_matches_isna(frame):
+    result = NullityBitmap(frame).row_distribution()
+    expected = frame.isna().sum(axis=1).value_counts().sort_index()
+    assert result["Missing Values in Row"].tolist() == expected.index.tolist()
+    assert result["Rows"].tolist() == expected.tolist()
+
+def test_pattern_frequencies_match_groupby(frame):
+    result = NullityBitmap(frame).pattern_frequencies(top=10_000)
+    mask = frame.isna()
+    patterns = mask.apply(lambda row: ", ".join(row.index[row]) or "(none)", axis=1).value_counts()
+    assert dict(zip(result["Missing Columns"], result["Rows"])) == patterns.to_dict()
+    assert result["Rows"].is_monotonic_decreasing
+
+def test_co_missing_correlation_matches_indicator_corr(frame):
+    result = NullityBitmap(frame).co_missing_correlation()
+    mask = frame.isna()
+    expected = mask.loc[:, mask.any()].astype("float64").corr()
+    pd.testing.assert_frame_equal(result, expected, atol=1e-12)
+    assert "c0" in result and result.loc["c0", "c1"] > 0.5
+
+def test_frame_without_missing_values():
+    bitmap = NullityBitmap(pd.DataFrame({"a": [1, 2, 3]}))
+    assert bitmap.row_distribution()["Rows"].tolist() == [3]
+    assert bitmap.pattern_frequencies()["Missing Columns"].tolist() == ["(none)"]
+    assert bitmap.co_missing_correlation().empty
+    assert get_missing_value_report(pd.DataFrame({"a": [1, 2, 3]})).empty
@@ -0,0 +1,102 @@
+# tests/test_outlier_detector.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from insights import outlier_detector
+from insights.outlier_detector import OutlierIndex, detect_outliers_iqr, detect_outliers_zscore
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(5)
+    n = 10_000
+    df = pd.DataFrame({
+        "normal": rng.normal(size=n),
+        "heavy": rng.standard_t(2, size=n),
+        "ints": rng.integers(0, 100, n),
+        "all_nan": np.nan,
+        "label": rng.choice(["a", "b"], n)
+    })
+    df.loc[::13, "normal"] = np.nan
+    return df
+
+def _iqr_counts_pandas(df: pd.DataFrame, multiplier: float):
+    counts = {}
+    for col in ["normal", "heavy", "ints", "all_nan"]:
+        q1, q3 = df[col].quantile([0.25, 0.75])
+        iqr = q3 - q1
+        counts[col] = int(((df[col] < q1 - multiplier * iqr) | (df[col] > q3 + multiplier * iqr)).sum())
+    return counts
+
+@pytest.mark.parametrize("multiplier", [0.5, 1.5, 3.0])
+def test_iqr_scan_and_index_match_pandas(frame, monkeypatch, multiplier):
+    # Small blocks exercise the row slicing of the scan
+    monkeypatch.setattr(outlier_detector, "BLOCK_ROWS", 999)
+    expected = _iqr_counts_pandas(frame, multiplier)
+    scanned = detect_outliers_iqr(frame, multiplier).set_index("Column")["Outlier Count"].to_dict()
+    indexed = detect_outliers_iqr(frame, multiplier, index=OutlierIndex(frame)).set_index("Column")["Outlier Count"].to_dict()
+    assert scanned == expected
+    assert indexed == expected
+
+def test_zscore_scan_matches_index(frame, monkeypatch):
+    monkeypatch.setattr(outlier_detector, "BLOCK_ROWS", 999)
+    scanned = detect_outliers_zscore(frame, 2.0).set_index("Column")["Outlier Count"].to_dict()
+    indexed = detect_outliers_zscore(frame, 2.0, index=OutlierIndex(frame)).set_index("Column")["Outlier Count"].to_dict()
+    assert scanned == indexed
+    assert "all_nan" not in scanned
+
+def _sorted_column(df: pd.DataFrame, col) -> np.ndarray:
+    return np.sort(df[col].dropna().to_numpy(dtype=float))
+
+@pytest.mark.parametrize("profile_first", [True, False])
+def test_index_uses_profile_quartiles(frame, profile_first):
+    from eda.profiler import get_profile
+    if profile_first:
+        get_profile(frame)
+    index = OutlierIndex(frame)
+    profile = get_profile(frame)
+    np.testing.assert_array_equal(index.q1, [profile[col].quantiles[0.25] for col in index.columns])
+    for col in index.columns:
+        np.testing.assert_array_equal(index.sorted_values[col], _sorted_column(frame, col))
+
+def test_profile_memo_keeps_no_sorted_columns(frame):
+    from eda.dataset_cache import _FRAME_RESULTS
+    from eda.profiler import DatasetProfile, get_profile
+    OutlierIndex(frame)
+    assert isinstance(get_profile(frame), DatasetProfile)
+    # Only the profile and the index itself are memoized; the index owns the only sorted copy
+    memo = _FRAME_RESULTS[id(frame)][1]
+    assert all(not isinstance(value, (dict, tuple)) for value in memo.values())
+
+def test_parallel_profile_hands_over_sorted_columns():
+    from eda.profiler import get_profile, profile_dataframe
+    rng = np.random.default_rng(6)
+    n = 1_100_000
+    df = pd.DataFrame({"a": rng.normal(size=n), "b": rng.integers(0, 10, n).astype(float)})
+    df.loc[::7, "a"] = np.nan
+    sorted_values = {}
+    profile = profile_dataframe(df, workers=2, sorted_out=sorted_values)
+    for col in df.columns:
+        np.testing.assert_array_equal(sorted_values[col], _sorted_column(df, col))
+    # Above EXACT_QUANTILE_MAX_ROWS the quartiles are sketched; the index must use the same ones
+    assert profile["b"].approximate
+    index = OutlierIndex(df)
+    np.testing.assert_array_equal(index.q3, [get_profile(df)[col].quantiles[0.75] for col in index.columns])
+
+@pytest.mark.parametrize("detect", [detect_outliers_zscore, detect_outliers_iqr])
+def test_index_and_scan_agree_on_infinite_values(detect):
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        "pos_inf": rng.normal(size=1000),
+        "both_inf": rng.normal(size=1000),
+        "mostly_inf": rng.normal(size=1000)
+    })
+    df.loc[3, "pos_inf"] = np.inf
+    df.loc[[3, 4], "both_inf"] = [np.inf, -np.inf]
+    df.loc[:800, "mostly_inf"] = np.inf
+    scanned = detect(df).set_index("Column")["Outlier Count"].to_dict()
+    indexed = detect(df, index=OutlierIndex(df)).set_index("Column")["Outlier Count"].to_dict()
+    assert scanned == indexed
+    if detect is detect_outliers_zscore:
+        # Infinite mean / undefined std: no z-scores, so no outliers
+        assert scanned == {"pos_inf": 0, "both_inf": 0, "mostly_inf": 0}
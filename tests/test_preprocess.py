@@ -0,0 +1,50 @@
+# tests/test_preprocess.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from eda.preprocess import PreprocessPipeline
+
+def _round_trip(pipeline: PreprocessPipeline) -> PreprocessPipeline:
+    return PreprocessPipeline.from_json(pipeline.to_json())
+
+def test_integer_column_names_round_trip():
+    df = pd.DataFrame({0: [1.0, np.nan, 3.0], 1: ["a", None, "b"]})
+    pipeline = PreprocessPipeline().fit(df)
+    restored = _round_trip(pipeline)
+    assert restored.fill_values == pipeline.fill_values
+    assert restored.vocabularies == pipeline.vocabularies
+    assert restored.category_fills == pipeline.category_fills
+    pd.testing.assert_frame_equal(restored.transform(df), pipeline.transform(df))
+
+def test_timestamp_categories_round_trip():
+    stamps = pd.Series([pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01", tz="UTC"), None] * 3,
+                       dtype="object")
+    df = pd.DataFrame({"when": stamps, "x": np.arange(9.0)})
+    pipeline = PreprocessPipeline().fit(df)
+    restored = _round_trip(pipeline)
+    assert restored.fill_values == pipeline.fill_values
+    assert restored.vocabularies == pipeline.vocabularies
+    pd.testing.assert_frame_equal(restored.transform(df), pipeline.transform(df))
+
+def test_old_dict_format_still_loads():
+    data = {"max_categories": 50, "fill_values": {"x": 1.5}, "category_fills": [], "vocabularies": {}}
+    assert PreprocessPipeline.from_dict(data).fill_values == {"x": 1.5}
+
+@pytest.mark.parametrize("text", ["not json", "[1, 2]", '{"max_categories": 50}'])
+def test_malformed_json_raises_value_error(text):
+    with pytest.raises(ValueError):
+        PreprocessPipeline.from_json(text)
+
+def test_fit_chunks_ignores_all_null_chunks_of_a_text_column():
+    chunks = [
+        pd.DataFrame({"t": ["x", "y", None], "n": [1.0, 2.0, 3.0]}),
+        pd.DataFrame({"t": [np.nan, np.nan, np.nan], "n": [4.0, 5.0, 6.0]}),
+        pd.DataFrame({"t": ["y", "x", "x"], "n": [7.0, 8.0, 9.0]})
+    ]
+    assert chunks[1]["t"].dtype == "float64"
+    # An odd number of values, so the sketched median is the exact one
+    streamed = PreprocessPipeline().fit_chunks(chunks)
+    in_memory = PreprocessPipeline().fit(pd.concat(chunks, ignore_index=True))
+    assert streamed.to_dict() == in_memory.to_dict()
+    assert streamed.vocabularies == {"t": ["Unknown", "x", "y"]}
@@ -0,0 +1,66 @@
+# tests/test_sketches.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from eda.sketches import KLLSketch, HyperLogLog, hll_relative_error, kll_rank_error
+
+QS = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+def _rank_errors(sketch: KLLSketch, values: np.ndarray):
+    """
+    |rank(estimate) - q| for each q in QS, with ranks normalized by the number of values.
+    """
+    ordered = np.sort(values)
+    estimates = sketch.quantiles(QS)
+    return [abs(np.searchsorted(ordered, est, side="right") / ordered.size - q) for est, q in zip(estimates, QS)]
+
+@pytest.mark.parametrize("distribution", ["normal", "lognormal", "ints"])
+def test_kll_rank_error_within_bound(distribution):
+    rng = np.random.default_rng(3)
+    values = {
+        "normal": rng.normal(size=1_000_000),
+        "lognormal": rng.lognormal(size=1_000_000),
+        "ints": rng.integers(0, 1000, 1_000_000).astype(float)
+    }[distribution]
+    sketch = KLLSketch(k=200).update(values)
+    assert sketch.count == values.size
+    assert max(_rank_errors(sketch, values)) <= kll_rank_error(200)
+    assert sketch.num_retained < 2_000
+
+def test_kll_merge_matches_bound_and_extremes():
+    rng = np.random.default_rng(4)
+    parts = [rng.normal(loc, 1, 200_000) for loc in (0, 5, -3, 10)]
+    merged = KLLSketch(seed=1)
+    for i, part in enumerate(parts):
+        merged.merge(KLLSketch(seed=i + 10).update(part))
+    values = np.concatenate(parts)
+    assert merged.count == values.size
+    assert merged.quantiles([0, 1]) == [values.min(), values.max()]
+    assert max(_rank_errors(merged, values)) <= kll_rank_error(200)
+
+def test_kll_ignores_nan_and_handles_empty():
+    sketch = KLLSketch().update(np.array([np.nan, np.nan]))
+    assert sketch.count == 0
+    assert all(np.isnan(q) for q in sketch.quantiles([0.5]))
+    assert KLLSketch().merge(sketch).count == 0
+
+def test_kll_small_input_is_exact():
+    values = np.arange(101, dtype=float)
+    assert KLLSketch().update(values).quantiles([0.5]) == [50.0]
+
+def test_hyperloglog_estimate_and_merge():
+    values = pd.Series(np.arange(300_000))
+    full = HyperLogLog().update(values)
+    left = HyperLogLog().update(values.iloc[:200_000])
+    right = HyperLogLog().update(values.iloc[100_000:])
+    assert abs(full.estimate() / 300_000 - 1) < 3 * hll_relative_error(14)
+    assert left.merge(right).estimate() == full.estimate()
+
+def test_hyperloglog_merges_int_and_float_chunks_of_the_same_values():
+    # A CSV column read in chunks: int64 until a chunk with a missing value turns float64
+    ints = pd.Series(np.arange(1000), dtype="int64")
+    floats = pd.Series(np.append(np.arange(1000, dtype="float64"), np.nan))
+    merged = HyperLogLog().update(ints).merge(HyperLogLog().update(floats))
+    assert merged.estimate() == HyperLogLog().update(ints).estimate()
+    assert abs(merged.estimate() / 1000 - 1) < 3 * hll_relative_error(14)
@@ -0,0 +1,29 @@
+# tests/test_spill.py
+
+import io
+
+import numpy as np
+import pandas as pd
+from eda.data_loader import read_csv_chunked
+from eda.spill import SpilledFrame
+
+def _mixed_csv(n_rows: int = 400_000) -> io.BytesIO:
+    values = np.arange(n_rows).astype(object)
+    values[[10, 262_144, n_rows - 1]] = ["bad", "unknown", "x"]
+    df = pd.DataFrame({"id": np.arange(n_rows), "mixed": values})
+    return io.BytesIO(df.to_csv(index=False).encode("utf-8"))
+
+def test_spilled_csv_with_mixed_type_column_loads():
+    result = read_csv_chunked(_mixed_csv(), memory_budget_mb=1)
+    assert isinstance(result, SpilledFrame)
+    assert result.n_rows == 400_000
+    frame = result.to_frame()
+    assert frame["mixed"].iloc[262_144] == "unknown"
+    assert str(frame["mixed"].iloc[5]) == "5"
+
+def test_append_keeps_missing_values_in_mixed_columns():
+    spilled = SpilledFrame(["a"])
+    spilled.append(pd.DataFrame({"a": [1, "b", None, 2.5]}))
+    frame = spilled.to_frame()
+    assert frame["a"].tolist()[:2] == ["1", "b"]
+    assert frame["a"].isna().tolist() == [False, False, True, False]
@@ -0,0 +1,89 @@
+# tests/test_streaming_stats.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from eda.streaming_stats import StreamingStats, profile_chunks
+from eda.summary_stats import generate_summary
+from insights.null_flagger import flag_nulls
+from insights.skewness_checker import detect_skewness
+
+EXACT_COLUMNS = ["count", "mean", "std", "min", "max", "missing (%)"]
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    n = 5000
+    df = pd.DataFrame({
+        "normal": rng.normal(10, 3, n),
+        "skewed": rng.lognormal(0, 1, n),
+        "ints": rng.integers(-50, 50, n),
+        "all_nan": np.full(n, np.nan),
+        "text": rng.choice(["a", "b", None], n)
+    })
+    df.loc[::11, "normal"] = np.nan
+    df.loc[rng.random(n) < 0.4, "skewed"] = np.nan
+    return df
+
+def _chunks(df: pd.DataFrame, sizes):
+    """
+    Splits df into consecutive chunks of the given sizes (0 gives an empty chunk).
+    """
+    chunks, start = [], 0
+    for size in sizes:
+        chunks.append(df.iloc[start:start + size])
+        start += size
+    chunks.append(df.iloc[start:])
+    return chunks
+
+def _merged_profile(df: pd.DataFrame):
+    # Two partitions built from chunks in different orders, then merged
+    chunks = _chunks(df, [1000, 0, 1, 1700, 0])
+    left, right = StreamingStats(), StreamingStats()
+    for chunk in reversed(chunks[:3]):
+        left.update(chunk)
+    for chunk in chunks[3:][::-1]:
+        right.update(chunk)
+    return right.merge(left).to_profile()
+
+@pytest.mark.parametrize("build", [
+    lambda df: profile_chunks(_chunks(df, [0, 1234, 1, 2000])),
+    _merged_profile
+], ids=["update", "merge"])
+def test_summary_matches_full_frame(frame, build):
+    profile = build(frame)
+    expected = generate_summary(frame)
+    result = generate_summary(frame, profile=profile)
+    assert list(result.index) == list(expected.index)
+    pd.testing.assert_frame_equal(result[EXACT_COLUMNS], expected[EXACT_COLUMNS], check_dtype=False, atol=0.011)
+
+    # Quartiles come from the KLL sketch: compare by rank instead of value
+    for col in ["normal", "skewed", "ints"]:
+        values = np.sort(frame[col].dropna().to_numpy())
+        for q in ("25%", "50%", "75%"):
+            rank = np.searchsorted(values, result.loc[col, q], side="right") / values.size
+            assert abs(rank - int(q[:-1]) / 100) < 0.02
+    assert np.isnan(result.loc["all_nan", "mean"])
+
+@pytest.mark.parametrize("build", [
+    lambda df: profile_chunks(_chunks(df, [0, 1234, 1, 2000])),
+    _merged_profile
+], ids=["update", "merge"])
+def test_insights_match_full_frame(frame, build):
+    profile = build(frame)
+    expected_skew = detect_skewness(frame)
+    result_skew = detect_skewness(frame, profile=profile)
+    pd.testing.assert_frame_equal(result_skew, expected_skew, rtol=1e-9)
+    assert "all_nan" not in set(result_skew["Column"])
+
+    pd.testing.assert_frame_equal(flag_nulls(frame, 0.3, profile=profile), flag_nulls(frame, 0.3))
+    assert set(flag_nulls(frame, 0.3, profile=profile)["Column"]) == {"all_nan", "skewed", "text"}
+
+def test_merge_of_empty_stats_is_neutral(frame):
+    full = profile_chunks([frame])
+    merged = StreamingStats().merge(StreamingStats().update(frame)).merge(StreamingStats()).to_profile()
+    for col in frame.columns:
+        assert merged[col].count == full[col].count
+        assert merged[col].null_count == full[col].null_count
+        np.testing.assert_allclose(merged[col].mean if merged[col].mean is not None else np.nan,
+                                   full[col].mean if full[col].mean is not None else np.nan)
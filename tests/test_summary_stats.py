@@ -0,0 +1,40 @@
+# tests/test_summary_stats.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from eda.summary_stats import generate_summary
+
+def _describe_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The original DataFrame.describe()-based implementation.
+    """
+    summary = df.describe().T
+    summary["missing (%)"] = df.isnull().mean() * 100
+    summary["dtype"] = df.dtypes
+    return summary.round(2)
+
+def _frames():
+    rng = np.random.default_rng(1)
+    n = 3000
+    return {
+        "mixed": pd.DataFrame({
+            "a": rng.normal(size=n) * 1e3,
+            "i": rng.integers(0, 9, n),
+            "o": rng.choice(["x", "y", None], n),
+            "t": pd.date_range("2020", periods=n, freq="h"),
+            "b": rng.random(n) < 0.5,
+            "f": np.where(rng.random(n) < 0.2, np.nan, rng.random(n))
+        }),
+        "object_and_datetime": pd.DataFrame({
+            "o": rng.choice(["x", "y"], n),
+            "t": pd.date_range("2020", periods=n, freq="D")
+        }),
+        "object_only": pd.DataFrame({"o": rng.choice(["x", "y", None], n), "p": ["q"] * n}),
+        "numeric_only": pd.DataFrame({"a": rng.normal(size=n), "empty": np.nan})
+    }
+
+@pytest.mark.parametrize("name", list(_frames()))
+def test_generate_summary_matches_describe(name):
+    df = _frames()[name]
+    pd.testing.assert_frame_equal(generate_summary(df), _describe_summary(df))